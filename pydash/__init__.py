@@ -105,6 +105,7 @@ from .collections import (
     any_,
     at,
     collect,
+    columns,
     contains,
     count_by,
     deep_pluck,
@@ -131,13 +132,17 @@ from .collections import (
     map_,
     mapiter,
     partition,
+    pfilter,
     pluck,
+    pluck_many,
+    pmap,
     reduce_,
     reduce_right,
     reductions,
     reductions_right,
     reject,
     sample,
+    sample_weighted,
     select,
     shuffle,
     size,
@@ -146,7 +151,9 @@ from .collections import (
     sort_by_all,
     sort_by_order,
     to_list,
+    tree_reduce,
     where,
+    WeightedSampler,
 )
 
 
@@ -205,16 +212,25 @@ from .numerical import (
     min_by,
     moving_average,
     moving_avg,
+    moving_max,
+    moving_median,
+    moving_min,
+    moving_std,
+    moving_sum,
     multiply,
+    percentile,
     pow_,
     power,
+    quantile,
     round_,
+    RunningStats,
     scale,
     sigma,
     slope,
     std_deviation,
     subtract,
     sum_,
+    TDigest,
     transpose,
     variance,
     zscore,
@@ -230,22 +246,29 @@ from .objects import (
     callables,
     clone,
     clone_deep,
+    compile_path,
     deep_get,
     deep_has,
+    deep_iter,
     deep_map_values,
     deep_set,
     defaults,
     defaults_deep,
+    diff,
     extend,
     find_key,
     find_last_key,
+    flatten_keys,
     for_in,
     for_in_right,
     for_own,
     for_own_right,
     get,
+    get_many,
     get_path,
     has,
+    has_all,
+    has_any,
     has_path,
     invert,
     keys,
@@ -255,11 +278,17 @@ from .objects import (
     merge,
     methods,
     omit,
+    omit_all,
     pairs,
     parse_int,
+    patch,
     pick,
+    pick_all,
+    project,
     rename_keys,
+    rename_keys_all,
     set_,
+    set_many,
     set_path,
     to_boolean,
     to_dict,
@@ -267,9 +296,12 @@ from .objects import (
     to_plain_object,
     to_string,
     transform,
+    unflatten_keys,
+    update_many,
     update_path,
     values,
     values_in,
+    walk,
 )
 
 
@@ -327,6 +359,9 @@ from .predicates import (
     is_string,
     is_tuple,
     is_zero,
+    mask,
+    Mask,
+    monotone_violation,
 )
 
 
@@ -418,6 +453,8 @@ from .utilities import (
     deep_property,
     deep_prop,
     default_to,
+    freeze_deep,
+    hash_deep,
     iteratee,
     identity,
     matches,
@@ -48,12 +48,13 @@ if PY3:
     _range = range
 
     implements_to_string = _identity
+    imap = map
     izip = zip
 
     def _cmp(a, b): return (a > b) - (a < b)
 else:
     from HTMLParser import HTMLParser
-    from itertools import izip
+    from itertools import imap, izip
     from urllib import urlencode
     from urlparse import urlsplit, urlunsplit, parse_qs, parse_qsl
     import __builtin__ as _builtins
@@ -83,6 +84,20 @@ builtins = dict((value, key) for key, value in iteritems(_builtins.__dict__)
 html_escape = partial(cgi.escape, quote=True)
 html_unescape = HTMLParser().unescape
 
+try:
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+except ImportError:  # pragma: no cover
+    # This module is missing on PY2 unless the futures backport is installed.
+    ProcessPoolExecutor = ThreadPoolExecutor = None
+
+try:
+    from json import detect_encoding as json_detect_encoding
+except ImportError:  # pragma: no cover
+    # This function is missing before PY36.
+    def json_detect_encoding(b):
+        """Return the encoding that ``json.loads`` would decode `b` with."""
+        return 'utf-8'
+
 try:
     from functools import cmp_to_key
 except ImportError:
@@ -10,7 +10,7 @@ from bisect import bisect_left, bisect_right
 from math import ceil
 
 import pydash as pyd
-from .helpers import itercallback, get_item
+from .helpers import itercallback, get_item, NoValue
 from ._compat import cmp_to_key, string_types
 
 
@@ -1754,11 +1754,24 @@ def zip_with(*arrays, **kargs):
 
 
 def iterflatten(array, depth=-1):
-    """Iteratively flatten a list shallowly or deeply."""
-    for item in array:
-        if isinstance(item, (list, tuple)) and depth != 0:
-            for subitem in iterflatten(item, depth - 1):
-                yield subitem
+    """Iteratively flatten a list shallowly or deeply. Lists that are already
+    being flattened further up, i.e. cyclic references, are yielded as is.
+    """
+    stack = [(id(array), iter(array), depth)]
+    active = set([id(array)])
+
+    while stack:
+        ident, items, depth = stack[-1]
+        item = next(items, NoValue)
+
+        if item is NoValue:
+            stack.pop()
+            active.discard(ident)
+        elif (isinstance(item, (list, tuple)) and
+              depth != 0 and
+              id(item) not in active):
+            stack.append((id(item), iter(item), depth - 1))
+            active.add(id(item))
         else:
             yield item
 
@@ -1793,24 +1806,51 @@ def iterunique(array, comparator=None, iteratee=None):
     if not array:  # pragma: no cover
         return
 
-    if comparator is None:
-        comparator = pyd.is_equal
-
     iteratee = pyd.iteratee(iteratee)
 
-    seen = []
+    if comparator is not None:
+        seen = []
+        for item in array:
+            cmp_item = iteratee(item)
+            new = True
+
+            for seen_item in seen:
+                if comparator(cmp_item, seen_item):
+                    new = False
+                    break
+
+            if new:
+                yield item
+                seen.append(cmp_item)
+        return
+
+    # Group seen items by the hash of their frozen mirror so that each item is
+    # only compared to the seen items with the same hash. Items that can't be
+    # frozen and hashed, including cyclic items, are compared to all seen
+    # items.
+    buckets = {}
+    unhashable = []
     for item in array:
         cmp_item = iteratee(item)
-        new = True
 
-        for seen_item in seen:
-            if comparator(cmp_item, seen_item):
-                new = False
-                break
+        try:
+            bucket = buckets.setdefault(hash(pyd.freeze_deep(cmp_item)), [])
+        except (TypeError, ValueError):
+            bucket = None
+            candidates = [seen_item for seen_items in buckets.values()
+                          for seen_item in seen_items] + unhashable
+        else:
+            candidates = bucket + unhashable
 
-        if new:
-            yield item
-            seen.append(cmp_item)
+        if any(pyd.is_equal(cmp_item, seen_item) for seen_item in candidates):
+            continue
+
+        yield item
+
+        if bucket is None:
+            unhashable.append(cmp_item)
+        else:
+            bucket.append(cmp_item)
 
 
 def iterduplicates(array):
@@ -6,12 +6,26 @@
 
 from __future__ import absolute_import
 
+from array import array
+from functools import partial
+from multiprocessing import cpu_count
 import random
 
 import pydash as pyd
 
-from .helpers import itercallback, iterator, callit, getargcount, NoValue
-from ._compat import cmp_to_key, _cmp
+from .helpers import (
+    itercallback,
+    itercallback_parallel,
+    iterator,
+    callit,
+    getargcount,
+    is_process_executor,
+    NoValue,
+    read_shared,
+    shared_typecode,
+    SharedBuffer
+)
+from ._compat import cmp_to_key, _cmp, _range, ThreadPoolExecutor
 
 
 __all__ = (
@@ -19,6 +33,7 @@ __all__ = (
     'any_',
     'at',
     'collect',
+    'columns',
     'contains',
     'count_by',
     'deep_pluck',
@@ -45,13 +60,17 @@ __all__ = (
     'map_',
     'mapiter',
     'partition',
+    'pfilter',
     'pluck',
+    'pluck_many',
+    'pmap',
     'reduce_',
     'reduce_right',
     'reductions',
     'reductions_right',
     'reject',
     'sample',
+    'sample_weighted',
     'select',
     'shuffle',
     'size',
@@ -60,10 +79,117 @@ __all__ = (
     'sort_by_all',
     'sort_by_order',
     'to_list',
+    'tree_reduce',
     'where',
 )
 
 
+class WeightedSampler(object):
+    """Draw weighted random elements from a collection in constant time using
+    Walker's alias method. The alias tables are built once on initialization
+    so that repeated draws from the same distribution are cheap.
+
+    Args:
+        collection (list|dict): Collection to sample from.
+        weights (list|mixed, optional): List of weights corresponding to each
+            element of `collection` or a callback which returns the weight of
+            an element. Defaults to using the elements themselves as weights.
+
+    Raises:
+        ValueError: If `weights` doesn't match the size of `collection`, a
+            weight is negative, or all weights are zero.
+    """
+    def __init__(self, collection, weights=None):
+        if isinstance(collection, dict):
+            collection = list(collection.values())
+        else:
+            collection = list(collection)
+
+        if isinstance(weights, (list, tuple)):
+            weights = list(weights)
+        else:
+            cbk = pyd.iteratee(weights)
+            weights = [cbk(item) for item in collection]
+
+        if len(weights) != len(collection):
+            raise ValueError('weights must be the same length as collection')
+
+        if any(weight < 0 for weight in weights):
+            raise ValueError('weights must not be negative')
+
+        total = float(sum(weights))
+
+        if not total:
+            raise ValueError('weights must not all be zero')
+
+        size = len(weights)
+        probs = [weight * size / total for weight in weights]
+        accept = [1.0] * size
+        alias = list(_range(size))
+        small = [i for i, prob in enumerate(probs) if prob < 1]
+        large = [i for i, prob in enumerate(probs) if prob >= 1]
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+
+            accept[less] = probs[less]
+            alias[less] = more
+            probs[more] = (probs[more] + probs[less]) - 1
+
+            if probs[more] < 1:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # Anything left over in small or large only missed having a
+        # probability of exactly 1 due to rounding so it's always accepted.
+
+        self.collection = collection
+        self.accept = accept
+        self.alias = alias
+
+    def __len__(self):
+        return len(self.collection)
+
+    def __call__(self, n=None):
+        """Return a single weighted random element if `n` is ``None``, else a
+        list of `n` weighted random elements drawn with replacement.
+        """
+        if n is None:
+            return self.draw()
+
+        collection = self.collection
+        accept = self.accept
+        alias = self.alias
+        size = len(collection)
+        rand = random.random
+        sampled = []
+
+        for _ in _range(int(n)):
+            # Use a single random number for both the column choice and the
+            # acceptance test.
+            value = rand() * size
+            index = int(value)
+
+            if value - index >= accept[index]:
+                index = alias[index]
+
+            sampled.append(collection[index])
+
+        return sampled
+
+    def draw(self):
+        """Return a single weighted random element."""
+        value = random.random() * len(self.collection)
+        index = int(value)
+
+        if value - index >= self.accept[index]:
+            index = self.alias[index]
+
+        return self.collection[index]
+
+
 def at(collection, *indexes):  # pylint: disable=invalid-name
     """Creates a list of elements from the specified indexes, or keys, of the
     collection. Indexes may be specified as individual arguments or as arrays
@@ -90,6 +216,63 @@ def at(collection, *indexes):  # pylint: disable=invalid-name
     return [collection[i] for i in indexes]
 
 
+def columns(collection, *paths, **kargs):
+    """Retrieves the values of multiple paths from all elements in the
+    collection as a ``dict`` of columns keyed by path. All paths are parsed
+    once up front and extracted in a single pass over `collection`. If
+    `typecode` is given, columns are returned as compact ``array.array``
+    objects instead of lists.
+
+    Args:
+        collection (list|dict): Collection to iterate over.
+        paths (str|list): Paths of the values to extract.
+
+    Keyword Args:
+        typecode (str|dict, optional): ``array.array`` typecode to use for
+            every column or a ``dict`` mapping paths to typecodes for
+            individual columns. Defaults to ``None`` which returns lists.
+
+    Returns:
+        dict: Columns of plucked values keyed by path. List paths are
+            converted to tuples.
+
+    Example:
+
+        >>> items = [{'a': 1, 'b': {'c': 2}}, {'a': 3, 'b': {'c': 4}}]
+        >>> results = columns(items, 'a', 'b.c')
+        >>> results == {'a': [1, 3], 'b.c': [2, 4]}
+        True
+        >>> columns(items, 'a', typecode='d')['a']
+        array('d', [1.0, 3.0])
+
+    Warning:
+        Missing paths resolve to ``None`` which can't be stored in an
+        ``array.array`` column.
+
+    .. versionadded:: TODO
+    """
+    typecodes = kargs.get('typecode')
+    keys = [tuple(path) if isinstance(path, list) else path
+            for path in paths]
+    getters = base_path_getters(paths)
+
+    if not isinstance(typecodes, dict):
+        typecodes = dict.fromkeys(keys, typecodes)
+
+    cols = [array(typecodes[key]) if typecodes.get(key) else []
+            for key in keys]
+    appenders = list(zip([col.append for col in cols], getters))
+
+    if isinstance(collection, dict):
+        collection = collection.values()
+
+    for item in collection:
+        for append, getter in appenders:
+            append(getter(item))
+
+    return dict(zip(keys, cols))
+
+
 def contains(collection, target, from_index=0):
     """Checks if a given value is present in a collection. If `from_index` is
     negative, it is used as the offset from the end of the collection.
@@ -232,13 +415,16 @@ def every(collection, callback=None):
 all_ = every
 
 
-def filter_(collection, callback=None):
+def filter_(collection, callback=None, executor=None):
     """Iterates over elements of a collection, returning a list of all elements
     the callback returns truthy for.
 
     Args:
         collection (list|dict): Collection to iterate over.
         callback (mixed, optional): Callback applied per iteration.
+        executor (Executor, optional): ``concurrent.futures.Executor`` used to
+            run `callback` over chunks of `collection` in parallel. Defaults
+            to running serially.
 
     Returns:
         list: Filtered list.
@@ -255,10 +441,16 @@ def filter_(collection, callback=None):
         - :func:`filter_` (alias)
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: TODO
+        Added `executor` argument.
     """
-    return [value
-            for is_true, value, _, _ in itercallback(collection, callback)
-            if is_true]
+    if executor is not None:
+        results = itercallback_parallel(collection, callback, executor)
+    else:
+        results = itercallback(collection, callback)
+
+    return [value for is_true, value, _, _ in results if is_true]
 
 
 select = filter_
@@ -328,7 +520,7 @@ def find_last(collection, callback=None):
     return next(search, None)
 
 
-def flat_map(collection, callback=None):
+def flat_map(collection, callback=None, executor=None):
     """Creates a flattened list of values by running each element in
     collection thru `callback` and flattening the mapped results. The
     `callback` is invoked with three arguments:
@@ -337,6 +529,9 @@ def flat_map(collection, callback=None):
     Args:
         collection (list|dict): Collection to iterate over.
         callback (mixed, optional): Callback applied per iteration.
+        executor (Executor, optional): ``concurrent.futures.Executor`` used to
+            run `callback` over chunks of `collection` in parallel. Defaults
+            to running serially.
 
     Returns:
         list: Flattened mapped list.
@@ -349,6 +544,9 @@ def flat_map(collection, callback=None):
 
     .. versionadded:: TODO
     """
+    if executor is not None:
+        return pyd.flatten(map_(collection, callback, executor))
+
     return pyd.flatten(mapiter(collection, callback=callback))
 
 
@@ -469,13 +667,16 @@ def for_each_right(collection, callback):
 each_right = for_each_right
 
 
-def group_by(collection, callback=None):
+def group_by(collection, callback=None, executor=None):
     """Creates an object composed of keys generated from the results of running
     each element of a `collection` through the callback.
 
     Args:
         collection (list|dict): Collection to iterate over.
         callback (mixed, optional): Callback applied per iteration.
+        executor (Executor, optional): ``concurrent.futures.Executor`` used to
+            run `callback` over chunks of `collection` in parallel. Defaults
+            to running serially.
 
     Returns:
         dict: Results of grouping by `callback`.
@@ -489,12 +690,22 @@ def group_by(collection, callback=None):
                                True: [{'a': 1, 'b': 2}]}
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: TODO
+        Added `executor` argument.
     """
     ret = {}
-    cbk = pyd.iteratee(callback)
 
-    for value in collection:
-        key = cbk(value)
+    if executor is not None:
+        # Only pass the value to the callback like the serial version does.
+        pairs = ((key, value) for key, value, _, _ in
+                 itercallback_parallel(list(collection), callback, executor,
+                                       argcount=1))
+    else:
+        cbk = pyd.iteratee(callback)
+        pairs = ((cbk(value), value) for value in collection)
+
+    for key, value in pairs:
         ret.setdefault(key, [])
         ret[key].append(value)
 
@@ -539,6 +750,12 @@ def invoke(collection, method_name, *args, **kargs):
         args (optional): Arguments to pass to method call.
         kargs (optional): Keyword arguments to pass to method call.
 
+    Keyword Args:
+        executor (Executor, optional): ``concurrent.futures.Executor`` used to
+            invoke the method over chunks of `collection` in parallel.
+            Defaults to running serially. This keyword is not passed on to the
+            invoked method.
+
     Returns:
         list: List of results of invoking method of each item.
 
@@ -557,7 +774,19 @@ def invoke(collection, method_name, *args, **kargs):
 
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: TODO
+        Added `executor` keyword argument. An `executor` keyword argument is
+        no longer passed on to the invoked method.
     """
+    executor = kargs.pop('executor', None)
+
+    if executor is not None:
+        method = partial(invoke_method, method_name, args, kargs)
+        return [result for result, _, _, _ in
+                itercallback_parallel(collection, method, executor,
+                                      argcount=1)]
+
     lst = []
 
     for item in collection:
@@ -569,7 +798,7 @@ def invoke(collection, method_name, *args, **kargs):
     return lst
 
 
-def map_(collection, callback=None):
+def map_(collection, callback=None, executor=None):
     """Creates an array of values by running each element in the collection
     through the callback. The callback is invoked with three arguments:
     ``(value, index|key, collection)``. If a property name is passed for
@@ -581,6 +810,9 @@ def map_(collection, callback=None):
     Args:
         collection (list|dict): Collection to iterate over.
         callback (mixed, optional): Callback applied per iteration.
+        executor (Executor, optional): ``concurrent.futures.Executor`` used to
+            run `callback` over chunks of `collection` in parallel. Defaults
+            to running serially.
 
     Returns:
         list: Mapped list.
@@ -595,7 +827,14 @@ def map_(collection, callback=None):
         - :func:`collect` (alias)
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: TODO
+        Added `executor` argument.
     """
+    if executor is not None:
+        return [result for result, _, _, _ in
+                itercallback_parallel(collection, callback, executor)]
+
     return list(mapiter(collection, callback))
 
 
@@ -628,7 +867,7 @@ def mapiter(collection, callback=None):
         yield result[0]
 
 
-def partition(collection, callback=None):
+def partition(collection, callback=None, executor=None):
     """Creates an array of elements split into two groups, the first of which
     contains elements the `callback` returns truthy for, while the second of
     which contains elements the `callback` returns falsey for. The `callback`
@@ -644,6 +883,9 @@ def partition(collection, callback=None):
     Args:
         collection (list|dict): Collection to iterate over.
         callback (mixed, optional): Callback applied per iteration.
+        executor (Executor, optional): ``concurrent.futures.Executor`` used to
+            run `callback` over chunks of `collection` in parallel. Defaults
+            to running serially.
 
     Returns:
         list: List of grouped elements.
@@ -654,11 +896,19 @@ def partition(collection, callback=None):
         [[3, 4], [1, 2]]
 
     .. versionadded:: 1.1.0
+
+    .. versionchanged:: TODO
+        Added `executor` argument.
     """
     trues = []
     falses = []
 
-    for is_true, value, _, _ in itercallback(collection, callback):
+    if executor is not None:
+        results = itercallback_parallel(collection, callback, executor)
+    else:
+        results = itercallback(collection, callback)
+
+    for is_true, value, _, _ in results:
         if is_true:
             trues.append(value)
         else:
@@ -667,6 +917,34 @@ def partition(collection, callback=None):
     return [trues, falses]
 
 
+def pfilter(collection, callback=None, executor=None, chunk_size=None):
+    """Like :func:`filter_` except that `callback` is always run in parallel
+    over chunks of `collection`. Order of the filtered elements is preserved.
+
+    Args:
+        collection (list|dict): Collection to iterate over.
+        callback (mixed, optional): Callback applied per iteration.
+        executor (Executor, optional): ``concurrent.futures.Executor`` to
+            submit chunks to. Defaults to a thread pool that is shut down once
+            filtering is complete.
+        chunk_size (int, optional): Number of elements per chunk. Defaults to
+            a size based on the measured cost of calling `callback`.
+
+    Returns:
+        list: Filtered list.
+
+    Example:
+
+        >>> pfilter([1, 2, 3, 4], lambda x: x >= 3)
+        [3, 4]
+
+    .. versionadded:: TODO
+    """
+    return [value for is_true, value, _, _ in
+            base_parallel(collection, callback, executor, chunk_size)
+            if is_true]
+
+
 def pluck(collection, key):
     """Retrieves the value of a specified property from all elements in the
     collection.
@@ -688,6 +966,73 @@ def pluck(collection, key):
     return map_(collection, pyd.prop(key))
 
 
+def pluck_many(collection, *paths):
+    """Retrieves the values of multiple paths from all elements in the
+    collection as a list of tuples. All paths are parsed once up front and
+    extracted in a single pass over `collection`.
+
+    Args:
+        collection (list|dict): Collection to iterate over.
+        paths (str|list): Paths of the values to extract.
+
+    Returns:
+        list: List of tuples containing the plucked values of each element in
+            the order of `paths`.
+
+    Example:
+
+        >>> items = [{'a': 1, 'b': {'c': 2}}, {'a': 3, 'b': {'c': 4}}]
+        >>> pluck_many(items, 'a', 'b.c')
+        [(1, 2), (3, 4)]
+        >>> pluck_many(items, 'b.c', 'x')
+        [(2, None), (4, None)]
+
+    .. versionadded:: TODO
+    """
+    getters = base_path_getters(paths)
+
+    if isinstance(collection, dict):
+        collection = collection.values()
+
+    return [tuple([getter(item) for getter in getters])
+            for item in collection]
+
+
+def pmap(collection, callback=None, executor=None, chunk_size=None):
+    """Like :func:`map_` except that `callback` is always run in parallel over
+    chunks of `collection`. Results are returned in the same order as
+    `collection` and if any callback raises, the exception raised for the
+    earliest element is propagated.
+
+    Args:
+        collection (list|dict): Collection to iterate over.
+        callback (mixed, optional): Callback applied per iteration.
+        executor (Executor, optional): ``concurrent.futures.Executor`` to
+            submit chunks to. Defaults to a thread pool that is shut down once
+            mapping is complete.
+        chunk_size (int, optional): Number of elements per chunk. Defaults to
+            a size based on the measured cost of calling `callback`.
+
+    Returns:
+        list: Mapped list.
+
+    Example:
+
+        >>> pmap([1, 2, 3, 4], lambda x: x * 2)
+        [2, 4, 6, 8]
+        >>> pmap([1, 2, 3, 4], str, chunk_size=3)
+        ['1', '2', '3', '4']
+
+    Note:
+        Process based executors require `callback` to be picklable, e.g., a
+        module level function or a property or matching shorthand.
+
+    .. versionadded:: TODO
+    """
+    return [result for result, _, _, _ in
+            base_parallel(collection, callback, executor, chunk_size)]
+
+
 def reduce_(collection, callback=None, accumulator=None):
     """Reduces a collection to a value which is the accumulated result of
     running each element in the collection through the callback, where each
@@ -846,13 +1191,16 @@ def reductions_right(collection, callback=None, accumulator=None):
     return reductions(collection, callback, accumulator, from_right=True)
 
 
-def reject(collection, callback=None):
+def reject(collection, callback=None, executor=None):
     """The opposite of :func:`filter_` this method returns the elements of a
     collection that the callback does **not** return truthy for.
 
     Args:
         collection (list|dict): Collection to iterate over.
         callback (mixed, optional): Callback applied per iteration.
+        executor (Executor, optional): ``concurrent.futures.Executor`` used to
+            run `callback` over chunks of `collection` in parallel. Defaults
+            to running serially.
 
     Returns:
         list: Rejected elements of `collection`.
@@ -867,10 +1215,16 @@ def reject(collection, callback=None):
         [{'a': 0}, {'a': 2}]
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: TODO
+        Added `executor` argument.
     """
-    return [value
-            for is_true, value, _, _ in itercallback(collection, callback)
-            if not is_true]
+    if executor is not None:
+        results = itercallback_parallel(collection, callback, executor)
+    else:
+        results = itercallback(collection, callback)
+
+    return [value for is_true, value, _, _ in results if not is_true]
 
 
 def sample(collection, n=None):
@@ -898,6 +1252,44 @@ def sample(collection, n=None):
     return sampled[0] if n is None else sampled
 
 
+def sample_weighted(collection, weights=None, n=None):
+    """Retrieves a weighted random element or `n` weighted random elements
+    from a `collection`. Elements are drawn with replacement. If `weights` is a
+    list, it provides the weight of the corresponding element in
+    `collection`, otherwise, it is used as a callback which returns the weight
+    of each element.
+
+    Args:
+        collection (list|dict): Collection to sample from.
+        weights (list|mixed, optional): Weights for each element or callback
+            applied per element to compute its weight.
+        n (int, optional): Number of random samples to return.
+
+    Returns:
+        list|mixed: List of sampled collection values if `n` is provided, else
+            single value from collection if `n` is ``None``.
+
+    Example:
+
+        >>> items = ['a', 'b', 'c']
+        >>> sample_weighted(items, [0, 1, 0])
+        'b'
+        >>> results = sample_weighted(items, [1, 2, 3], 5)
+        >>> assert len(results) == 5
+        >>> assert set(items).issuperset(results)
+        >>> sample_weighted([{'w': 0}, {'w': 1}], 'w')
+        {'w': 1}
+
+    Note:
+        When drawing repeatedly from the same distribution, create a
+        :class:`WeightedSampler` once and call it for each draw so the alias
+        tables are only built once.
+
+    .. versionadded:: TODO
+    """
+    return WeightedSampler(collection, weights)(n)
+
+
 def shuffle(collection):
     """Creates a list of shuffled values, using a version of the Fisher-Yates
     shuffle.
@@ -1146,6 +1538,80 @@ def to_list(collection):
     return ret
 
 
+def tree_reduce(collection, callback=None, accumulator=None, executor=None,
+                chunk_size=None):
+    """Reduces a collection to a value using an associative `callback` by
+    reducing chunks of `collection` in parallel and then combining the partial
+    results pairwise in a balanced tree. Element order is preserved so
+    `callback` needs to be associative but not commutative.
+
+    Args:
+        collection (list|dict): Collection to iterate over.
+        callback (mixed): Associative callback invoked with two arguments
+            ``(total, value)``.
+        accumulator (mixed, optional): Initial value of aggregator. Default is
+            to use the first element.
+        executor (Executor, optional): ``concurrent.futures.Executor`` to
+            submit chunks to. Defaults to a thread pool that is shut down once
+            reduction is complete.
+        chunk_size (int, optional): Number of elements per chunk. Defaults to
+            splitting `collection` evenly between the executor's workers.
+
+    Returns:
+        mixed: Accumulator object containing results of reduction.
+
+    Example:
+
+        >>> tree_reduce([1, 2, 3, 4], lambda total, x: total + x)
+        10
+        >>> tree_reduce(['a', 'b', 'c'], lambda total, x: total + x, 'z')
+        'zabc'
+
+    Note:
+        Process based executors require `callback` to be picklable, e.g., a
+        module level function. ``array.array``, ``bytearray``, and ``bytes``
+        collections are staged in a shared buffer for them instead of being
+        pickled in chunks.
+
+    .. versionadded:: TODO
+    """
+    if callback is None:
+        callback = pyd.identity
+
+    if is_process_executor(executor):
+        typecode = shared_typecode(collection)
+    else:
+        typecode = None
+
+    if typecode and len(collection):
+        # Array and bytes-like inputs are reduced from a shared buffer so that
+        # only the partial results of the chunks are pickled. These are then
+        # combined pairwise as usual.
+        values = base_reduce_shared(collection, callback, typecode, executor,
+                                    chunk_size)
+        chunk_size = 2
+    else:
+        values = list(collection.values() if isinstance(collection, dict)
+                      else collection)
+
+    if accumulator is not None:
+        values.insert(0, accumulator)
+
+    if not values:
+        raise TypeError(
+            'tree_reduce() of empty sequence with no initial value')
+
+    if executor is not None:
+        return base_tree_reduce(values, callback, executor, chunk_size)
+
+    if ThreadPoolExecutor is None:  # pragma: no cover
+        # Without concurrent.futures fallback to reducing serially.
+        return reduce_chunk(callback, values)
+
+    with ThreadPoolExecutor(max_workers=cpu_count()) as pool:
+        return base_tree_reduce(values, callback, pool, chunk_size)
+
+
 def where(collection, properties):
     """Examines each element in a collection, returning an array of all
     elements that have the given properties.
@@ -1165,3 +1631,127 @@ def where(collection, properties):
     .. versionadded:: 1.0.0
     """
     return filter_(collection, pyd.matches(properties))
+
+
+#
+# Helper functions not a part of main API
+#
+
+
+def base_path_getters(paths):
+    """Return a compiled path getter for each path in `paths` with each path
+    parsed only once.
+    """
+    return [pyd.compile_path(path) for path in paths]
+
+
+def base_parallel(collection, callback, executor, chunk_size):
+    """Return :func:`pydash.helpers.itercallback_parallel` results using a
+    temporary thread pool if `executor` isn't provided.
+    """
+    if executor is not None:
+        return itercallback_parallel(collection, callback, executor,
+                                     chunk_size)
+
+    if ThreadPoolExecutor is None:  # pragma: no cover
+        # Without concurrent.futures fallback to running serially.
+        return list(itercallback(collection, callback))
+
+    with ThreadPoolExecutor(max_workers=cpu_count()) as pool:
+        return itercallback_parallel(collection, callback, pool, chunk_size)
+
+
+def base_reduce_shared(obj, callback, typecode, executor, chunk_size):
+    """Return the results of reducing chunks of the array or bytes-like `obj`
+    on `executor`. The items are staged in a :class:`SharedBuffer` so that
+    workers only receive offsets.
+    """
+    if not chunk_size:
+        workers = getattr(executor, '_max_workers', None) or cpu_count()
+        chunk_size = -(-len(obj) // workers)
+
+    chunk_size = max(chunk_size, 1)
+    source = SharedBuffer(typecode, obj)
+    futures = []
+
+    try:
+        for index in _range(0, len(obj), chunk_size):
+            futures.append(executor.submit(reduce_shared_chunk,
+                                           callback,
+                                           typecode,
+                                           source.path,
+                                           index,
+                                           min(index + chunk_size, len(obj))))
+
+        return [future.result() for future in futures]
+    finally:
+        for future in futures:
+            future.cancel()
+
+        # Wait for chunks that are already running before removing the
+        # buffer they read from.
+        for future in futures:
+            if not future.cancelled():
+                future.exception()
+
+        source.close()
+
+
+def base_tree_reduce(values, callback, executor, chunk_size):
+    """Reduce chunks of `values` on `executor` and then combine adjacent
+    partial results on `executor` until only one remains.
+    """
+    if not chunk_size:
+        workers = getattr(executor, '_max_workers', None) or cpu_count()
+        chunk_size = -(-len(values) // workers)
+
+    chunk_size = max(chunk_size, 1)
+    partials = [values[index:index + chunk_size]
+                for index in _range(0, len(values), chunk_size)]
+
+    while True:
+        futures = [executor.submit(reduce_chunk, callback, chunk)
+                   for chunk in partials]
+
+        try:
+            partials = [future.result() for future in futures]
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+
+        if len(partials) == 1:
+            return partials[0]
+
+        partials = [partials[index:index + 2]
+                    for index in _range(0, len(partials), 2)]
+
+
+def reduce_chunk(callback, values):
+    """Left fold `values` with `callback`. This is used as a module level
+    callback so that it can be sent to process based executors.
+    """
+    result = values[0]
+
+    for value in values[1:]:
+        result = callback(result, value)
+
+    return result
+
+
+def reduce_shared_chunk(callback, typecode, source, start, stop):
+    """Left fold the items of the shared buffer at `source` from `start` up to
+    `stop` with `callback`. This is used as a module level callback so that it
+    can be sent to process based executors.
+    """
+    return reduce_chunk(callback, read_shared(source, typecode, start, stop))
+
+
+def invoke_method(method_name, args, kargs, item):
+    """Invoke `method_name` on `item`. This is used as a module level callback
+    so that it can be sent to process based executors.
+    """
+    if callable(method_name):
+        return method_name(item, *args, **kargs)
+    else:
+        return getattr(item, method_name)(*args, **kargs)
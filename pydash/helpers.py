@@ -4,14 +4,21 @@
 
 from __future__ import absolute_import
 
+from array import array
 from collections import Iterable
 from functools import wraps
 import inspect
+from itertools import islice
+from multiprocessing import cpu_count
+import os
+import pickle
 import re
+import tempfile
+import time
 import warnings
 
 import pydash as pyd
-from ._compat import iteritems
+from ._compat import PY3, ProcessPoolExecutor, integer_types, iteritems
 
 
 class _NoValue(object):
@@ -25,6 +32,52 @@ class _NoValue(object):
 #: an unset value.
 NoValue = _NoValue()
 
+#: Target number of seconds of callback work to submit to an executor per
+#: chunk when the chunk size is determined automatically.
+PARALLEL_CHUNK_SECONDS = 0.01
+
+#: Maximum number of items to call serially when measuring callback cost
+#: before splitting a collection into chunks.
+PARALLEL_PROBE_SIZE = 32
+
+#: Directory used for staging shared buffers read by process workers. A
+#: memory backed filesystem is used when available.
+SHARED_BUFFER_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+#: Typecode used for shared result buffers keyed by the kind of value stored.
+SHARED_RESULT_TYPECODES = {float: 'd', int: 'q' if PY3 else 'l'}
+
+
+class SharedBuffer(object):
+    """Memory backed file holding an ``array.array`` style buffer that process
+    workers can read and write by path instead of having its contents pickled.
+    """
+    def __init__(self, typecode, data=None, length=0):
+        self.typecode = typecode
+        self.itemsize = array(typecode).itemsize
+
+        fd, self.path = tempfile.mkstemp(prefix='pydash-',
+                                         dir=SHARED_BUFFER_DIR)
+
+        with os.fdopen(fd, 'wb') as fp:
+            if data is None:
+                fp.truncate(self.itemsize * length)
+            elif isinstance(data, array):
+                data.tofile(fp)
+            else:
+                fp.write(data)
+
+    def read(self, start, stop):
+        """Return ``array.array`` of items from `start` up to `stop`."""
+        return read_shared(self.path, self.typecode, start, stop)
+
+    def close(self):
+        """Remove the backing file."""
+        try:
+            os.remove(self.path)
+        except OSError:  # pragma: no cover
+            pass
+
 
 def callit(callback, *args, **kargs):
     """Inspect argspec of `callback` function and only pass the supported
@@ -84,6 +137,262 @@ def itercallback(obj, callback=None, reverse=False):
                obj)
 
 
+class IterateeCallback(object):
+    """Picklable callback that calls the :func:`pydash.utilities.iteratee` of
+    the shorthand `func`, e.g. a property path or a ``dict`` to match, so that
+    shorthand callbacks can be sent to process based executors.
+    """
+    _argcount = 1
+
+    def __init__(self, func):
+        self.func = func
+        self.callback = pyd.iteratee(func)
+
+    def __call__(self, item):
+        return self.callback(item)
+
+    def __getstate__(self):
+        return (self.func,)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+
+def itercallback_parallel(obj, callback, executor, chunk_size=None,
+                          argcount=None):
+    """Return list of ``(result, item, key, obj)`` tuples like
+    :func:`itercallback` except that the callback is invoked for chunks of
+    `obj` submitted to `executor`. Results are returned in the same order as
+    `obj`. If any callback raises, the exception from the earliest failing
+    chunk is re-raised. Unless `argcount` is given, the number of arguments
+    passed to the callback is inspected like :func:`itercallback` does.
+
+    When `chunk_size` isn't given, the first items are called serially to
+    measure the per-item callback cost which is then used to size the
+    remaining chunks so that each takes about :data:`PARALLEL_CHUNK_SECONDS`.
+    """
+    if callback is None or callable(callback):
+        cbk = pyd.iteratee(callback)
+    else:
+        cbk = IterateeCallback(callback)
+
+    if argcount is None:
+        argcount = getargcount(cbk, maxargs=3)
+
+    if is_process_executor(executor):
+        # Fail before submitting any chunk since a callback that can't be
+        # pickled may leave the executor unable to shut down.
+        pickle.dumps(cbk, pickle.HIGHEST_PROTOCOL)
+
+    # Avoid shipping the whole collection with each chunk when the callback
+    # doesn't accept it.
+    target = obj if argcount >= 3 else None
+
+    if target is None and is_process_executor(executor):
+        typecode = shared_typecode(obj)
+    else:
+        typecode = None
+
+    if typecode:
+        # Array and bytes-like items are sent through shared buffers so
+        # there's no need to copy them into a list of pairs.
+        total = len(obj)
+        items = enumerate(obj)
+    else:
+        items = list(iterator(obj))
+        total = len(items)
+
+    if chunk_size is None:
+        results, chunk_size = probe_chunk_size(cbk, argcount, items, total,
+                                               target, executor)
+    else:
+        results = []
+
+    chunk_size = max(int(chunk_size), 1)
+
+    if typecode:
+        if len(results) < total:
+            results.extend(call_shared_chunks(cbk, argcount, obj, typecode,
+                                              len(results), chunk_size,
+                                              executor))
+        items = enumerate(obj)
+    else:
+        futures = [executor.submit(call_chunk,
+                                   cbk,
+                                   argcount,
+                                   items[i:i + chunk_size],
+                                   target)
+                   for i in range(len(results), total, chunk_size)]
+
+        try:
+            for future in futures:
+                results.extend(future.result())
+        finally:
+            for future in futures:
+                future.cancel()
+
+    return [(result, item, key, obj)
+            for result, (key, item) in zip(results, items)]
+
+
+def call_chunk(callback, argcount, items, obj):
+    """Return callback results for a chunk of ``(key, item)`` pairs. This is
+    executed by executor workers and so must remain a module level function.
+    """
+    return [callit(callback, item, key, obj, argcount=argcount)
+            for key, item in items]
+
+
+def call_shared_chunks(callback, argcount, obj, typecode, start, chunk_size,
+                       executor):
+    """Return callback results for the items of the array or bytes-like `obj`
+    starting at `start`. The items are staged in a :class:`SharedBuffer` so
+    that workers only receive offsets. Workers write numeric results back
+    through shared buffers and only pickle results that can't be stored in
+    one.
+    """
+    source = SharedBuffer(typecode, obj)
+    futures = []
+    results = []
+    loaded = 0
+
+    try:
+        for i in range(start, len(obj), chunk_size):
+            futures.append(executor.submit(call_shared_chunk,
+                                           callback,
+                                           argcount,
+                                           typecode,
+                                           source.path,
+                                           i,
+                                           min(i + chunk_size, len(obj))))
+
+        for future in futures:
+            results.extend(load_shared_results(future.result()))
+            loaded += 1
+    finally:
+        pending = futures[loaded:]
+
+        for future in pending:
+            future.cancel()
+
+        # Discard result buffers of chunks that still completed after an
+        # earlier chunk raised.
+        for future in pending:
+            if not future.cancelled() and future.exception() is None:
+                load_shared_results(future.result())
+
+        source.close()
+
+    return results
+
+
+def call_shared_chunk(callback, argcount, typecode, source, start, stop):
+    """Return callback results for the items of the shared buffer at `source`
+    from `start` up to `stop`. If every result is a ``float`` or every result
+    is an ``int``, they are written to a new shared buffer and its path and
+    typecode are returned instead. This is executed by executor workers and so
+    must remain a module level function.
+    """
+    values = read_shared(source, typecode, start, stop)
+    results = [callit(callback, value, key, argcount=argcount)
+               for key, value in enumerate(values, start)]
+    kind = shared_result_kind(results)
+
+    if kind is None:
+        return results
+
+    output = SharedBuffer(SHARED_RESULT_TYPECODES[kind],
+                          array(SHARED_RESULT_TYPECODES[kind], results))
+
+    return output.path, output.typecode
+
+
+def is_process_executor(executor):
+    """Return whether `executor` runs callbacks in other processes."""
+    return (ProcessPoolExecutor is not None and
+            isinstance(executor, ProcessPoolExecutor))
+
+
+def load_shared_results(results):
+    """Return chunk `results` returned by :func:`call_shared_chunk` loading
+    and removing the shared buffer they were written to if needed.
+    """
+    if isinstance(results, tuple):
+        path, typecode = results
+        length = os.path.getsize(path) // array(typecode).itemsize
+        results = read_shared(path, typecode, 0, length)
+        os.remove(path)
+
+    return results
+
+
+def read_shared(path, typecode, start, stop):
+    """Return ``array.array`` of items from `start` up to `stop` of the shared
+    buffer at `path`.
+    """
+    values = array(typecode)
+
+    with open(path, 'rb') as fp:
+        fp.seek(start * values.itemsize)
+        values.fromfile(fp, stop - start)
+
+    return values
+
+
+def shared_result_kind(results):
+    """Return ``float`` or ``int`` if all `results` are of that type and can
+    be stored in a shared result buffer, else ``None``.
+    """
+    if results and all(type(result) is float for result in results):
+        return float
+    elif (results and
+          all(type(result) in integer_types and
+              -2 ** 63 <= result < 2 ** 63 for result in results)):
+        return int
+    else:
+        return None
+
+
+def shared_typecode(obj):
+    """Return ``array.array`` typecode to use when staging `obj` in a
+    :class:`SharedBuffer` or ``None`` if it can't be staged.
+    """
+    if isinstance(obj, array):
+        return obj.typecode
+    elif isinstance(obj, bytearray) or (PY3 and isinstance(obj, bytes)):
+        return 'B'
+    else:
+        return None
+
+
+def probe_chunk_size(callback, argcount, items, total, obj, executor):
+    """Call `callback` serially on the first of `total` ``(key, item)`` pairs
+    of `items` to measure its cost and return the results along with a chunk
+    size for the remaining items.
+    """
+    workers = getattr(executor, '_max_workers', None) or cpu_count()
+    results = []
+    started = time.time()
+    elapsed = 0
+
+    for key, item in islice(items, PARALLEL_PROBE_SIZE):
+        results.append(callit(callback, item, key, obj, argcount=argcount))
+        elapsed = time.time() - started
+
+        if elapsed >= PARALLEL_CHUNK_SECONDS:
+            break
+
+    remaining = total - len(results)
+    max_size = -(-remaining // workers)
+
+    if elapsed > 0:
+        size = int(PARALLEL_CHUNK_SECONDS / (elapsed / len(results)))
+    else:
+        size = max_size
+
+    return results, min(max(size, 1), max(max_size, 1))
+
+
 def iterator(obj):
     """Return iterative based on object type."""
     if isinstance(obj, dict):
@@ -200,6 +509,50 @@ class iterator_with_default(object):
     next = __next__
 
 
+def import_numpy():
+    """Return the ``numpy`` module or ``None`` if it isn't installed. It's
+    only imported once it's first needed since importing it is slow.
+    """
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        numpy = None
+
+    return numpy
+
+
+def is_numpy_vector(value):
+    """Return whether `value` is a one-dimensional NumPy array without
+    importing NumPy.
+    """
+    return getattr(value, 'ndim', None) == 1 and hasattr(value, 'dtype')
+
+
+def numpy_vector(value):
+    """Return `value` as a one-dimensional NumPy array if it's one already or
+    if it's an ``array.array`` or one-dimensional ``memoryview`` and NumPy is
+    installed. The returned array shares the memory of `value`. Return
+    ``None`` otherwise.
+    """
+    if is_numpy_vector(value):
+        return value
+
+    if not isinstance(value, (array, memoryview)):
+        return None
+
+    numpy = import_numpy()
+
+    if numpy is None:
+        return None
+
+    try:
+        vector = numpy.asarray(memoryview(value))
+    except (TypeError, ValueError, NotImplementedError):
+        return None
+
+    return vector if vector.ndim == 1 else None
+
+
 def deprecated(func):  # pragma: no cover
     """This is a decorator which can be used to mark functions as deprecated.
     It will result in a warning being emitted when the function is used.
@@ -6,12 +6,22 @@
 
 from __future__ import absolute_import, division
 
+from bisect import bisect_left, insort
+from collections import deque
+from itertools import islice, repeat
 import math
 import operator
 
 import pydash as pyd
-from .helpers import NoValue, iterator_with_default, itercallback, iterator
-from ._compat import _range
+from .helpers import (
+    NoValue,
+    is_numpy_vector,
+    iterator_with_default,
+    itercallback,
+    iterator,
+    numpy_vector
+)
+from ._compat import integer_types, izip, _range
 
 
 __all__ = (
@@ -30,9 +40,16 @@ __all__ = (
     'min_by',
     'moving_average',
     'moving_avg',
+    'moving_max',
+    'moving_median',
+    'moving_min',
+    'moving_std',
+    'moving_sum',
     'multiply',
+    'percentile',
     'pow_',
     'power',
+    'quantile',
     'round_',
     'scale',
     'sigma',
@@ -48,8 +65,369 @@ __all__ = (
 
 INFINITY = float('inf')
 
+# Number of values up to which selecting ranks from them sorts them instead.
+SELECT_SORT_SIZE = 1024
+
+# Number of groups of neighboring ranks above which selecting them from values
+# sorts the values instead.
+SELECT_MAX_GROUPS = 2
+
+# Factor by which the sum of squared deviations of a window of moving_std()
+# may drop before it's recomputed since removing values with relatively large
+# deviations cancels most of its significant digits.
+MOVING_STD_CANCELLATION = 2 ** -20
+
+
+class RunningStats(object):
+    """Streaming accumulator of the count, sum, mean, variance, minimum and
+    maximum of numbers in a single pass and constant memory. The sum is kept
+    using compensated summation and the variance using Welford's algorithm.
+    Accumulators of separate chunks of numbers can be combined with
+    :meth:`merge`.
+
+    Args:
+        values (iterable, optional): Numbers to accumulate.
+
+    Example:
+
+        >>> stats = RunningStats([1, 18, 20, 4])
+        >>> stats.count, stats.mean, stats.variance, stats.min, stats.max
+        (4, 10.75, 69.6875, 1, 20)
+        >>> stats.merge(RunningStats([2, 3])).count
+        6
+
+    .. versionadded:: TODO
+    """
+    __slots__ = ('count', 'min', 'max', '_total', '_compensation',
+                 '_nonfinite', '_mean', '_squares')
+
+    def __init__(self, values=()):
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._total = 0
+        self._compensation = 0
+        self._nonfinite = None
+        self._mean = 0
+        self._squares = 0
+        self.update(values)
+
+    def push(self, value):
+        """Accumulate a single number."""
+        self.update((value,))
+
+    def update(self, values):
+        """Accumulate each number of the iterable `values`."""
+        count = self.count
+        minimum = self.min
+        maximum = self.max
+        total = self._total
+        compensation = self._compensation
+        mean = self._mean
+        squares = self._squares
+
+        for value in values:
+            count += 1
+
+            if count == 1:
+                minimum = maximum = value
+            elif value < minimum:
+                minimum = value
+            elif value > maximum:
+                maximum = value
+
+            if base_is_finite(value):
+                total, compensation = base_add_compensated(total,
+                                                           compensation,
+                                                           value)
+            elif self._nonfinite is None:
+                self._nonfinite = value
+            else:
+                self._nonfinite += value
+
+            delta = value - mean
+            mean += delta / count
+            squares += delta * (value - mean)
+
+        self.count = count
+        self.min = minimum
+        self.max = maximum
+        self._total = total
+        self._compensation = compensation
+        self._mean = mean
+        self._squares = squares
+
+        return self
+
+    def merge(self, other):
+        """Return a new accumulator of the numbers of this and `other`
+        accumulator.
+        """
+        merged = RunningStats()
+
+        if not other.count or not self.count:
+            source = self if self.count else other
+            for slot in RunningStats.__slots__:
+                setattr(merged, slot, getattr(source, slot))
+            return merged
+
+        count = self.count + other.count
+        delta = other._mean - self._mean
+
+        merged.count = count
+        merged.min = min(self.min, other.min)
+        merged.max = max(self.max, other.max)
+        merged._total, merged._compensation = base_add_compensated(
+            self._total, self._compensation + other._compensation,
+            other._total)
+
+        if self._nonfinite is None or other._nonfinite is None:
+            merged._nonfinite = (self._nonfinite if other._nonfinite is None
+                                 else other._nonfinite)
+        else:
+            merged._nonfinite = self._nonfinite + other._nonfinite
+
+        merged._mean = self._mean + delta * other.count / count
+        merged._squares = (self._squares + other._squares +
+                           delta * delta * self.count * other.count / count)
+
+        return merged
+
+    @property
+    def sum(self):
+        """Sum of the numbers."""
+        total = self._total + self._compensation
+
+        if self._nonfinite is not None:
+            total += self._nonfinite
+
+        return total
+
+    @property
+    def mean(self):
+        """Arithmetic mean of the numbers. Raises ``ZeroDivisionError`` when
+        no numbers were accumulated.
+        """
+        return self.sum / self.count
+
+    @property
+    def variance(self):
+        """Population variance of the numbers. Raises ``ZeroDivisionError``
+        when no numbers were accumulated.
+        """
+        return max(self._squares, 0) / self.count
+
+    @property
+    def std_deviation(self):
+        """Population standard deviation of the numbers. Raises
+        ``ZeroDivisionError`` when no numbers were accumulated.
+        """
+        return math.sqrt(self.variance)
+
+    def __repr__(self):
+        return 'RunningStats(count={0})'.format(self.count)
+
+
+class TDigest(object):
+    """Streaming approximation of the quantiles of numbers in bounded memory
+    using a merging t-digest. Numbers are buffered and periodically merged
+    into weighted centroids whose sizes are bounded by the arcsine scale
+    function so that the extreme quantiles are kept most accurately.
+    Digests of separate chunks of numbers can be combined with
+    :meth:`merge`.
+
+    Args:
+        values (iterable, optional): Numbers to add.
+        compression (int, optional): Accuracy parameter that bounds the number
+            of centroids kept to about `compression`. Defaults to ``100``.
+
+    Raises:
+        ValueError: If `compression` isn't a positive integer.
+
+    Example:
+
+        >>> digest = TDigest(range(1, 1001))
+        >>> digest.count, digest.min, digest.max
+        (1000, 1, 1000)
+        >>> abs(digest.quantile(0.5) - 500) < 5
+        True
+
+    .. versionadded:: TODO
+    """
+    __slots__ = ('compression', '_centroids', '_weight', '_buffer', '_min',
+                 '_max')
+
+    def __init__(self, values=(), compression=100):
+        if (not isinstance(compression, integer_types) or
+                isinstance(compression, bool) or compression < 1):
+            raise ValueError('compression must be a positive integer')
+
+        self.compression = compression
+        self._centroids = []
+        self._weight = 0
+        self._buffer = []
+        self._min = None
+        self._max = None
+        self.update(values)
+
+    def push(self, value):
+        """Add a single number."""
+        self.update((value,))
+
+    def update(self, values):
+        """Add each number of the iterable `values`."""
+        limit = 5 * self.compression
+        values = iter(values)
+
+        while True:
+            chunk = list(islice(values, limit - len(self._buffer)))
+
+            if not chunk:
+                break
+
+            self._buffer.extend(chunk)
+
+            if len(self._buffer) >= limit:
+                self._compress()
+
+        return self
+
+    def merge(self, other):
+        """Return a new digest of the numbers of this and `other` digest."""
+        merged = TDigest(compression=max(self.compression, other.compression))
+
+        for digest in (self, other):
+            if digest._buffer:
+                digest._compress()
+
+            if not digest._weight:
+                continue
+
+            merged._centroids.extend(digest._centroids)
+            merged._weight += digest._weight
+            merged._min = (digest._min if merged._min is None
+                           else min(merged._min, digest._min))
+            merged._max = (digest._max if merged._max is None
+                           else max(merged._max, digest._max))
 
-def add(collection, callback=None):
+        merged._centroids.sort()
+        merged._compress()
+
+        return merged
+
+    def quantile(self, q):
+        """Return the approximate `q`-th quantile of the numbers where `q` is
+        between ``0`` and ``1``. Raises ``ValueError`` when no numbers were
+        added.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError('q must be between 0 and 1')
+
+        if self._buffer:
+            self._compress()
+
+        if not self._weight:
+            raise ValueError('digest must not be empty')
+
+        centroids = self._centroids
+        index = q * self._weight
+        first_mean, first_weight = centroids[0]
+        last_mean, last_weight = centroids[-1]
+
+        if index <= first_weight / 2:
+            return (self._min +
+                    (first_mean - self._min) * index / (first_weight / 2))
+
+        if index >= self._weight - last_weight / 2:
+            return (self._max - (self._max - last_mean) *
+                    (self._weight - index) / (last_weight / 2))
+
+        # Interpolate between the centers of the neighboring centroids.
+        center = first_weight / 2
+
+        for (left, left_weight), (right, right_weight) in izip(
+                centroids, islice(centroids, 1, None)):
+            gap = (left_weight + right_weight) / 2
+
+            if index <= center + gap:
+                return left + (right - left) * (index - center) / gap
+
+            center += gap
+
+        return last_mean  # pragma: no cover
+
+    def percentile(self, p):
+        """Return the approximate `p`-th percentile of the numbers where `p`
+        is between ``0`` and ``100``.
+        """
+        if not 0 <= p <= 100:
+            raise ValueError('p must be between 0 and 100')
+
+        return self.quantile(p / 100)
+
+    @property
+    def count(self):
+        """Number of numbers added."""
+        return self._weight + len(self._buffer)
+
+    @property
+    def min(self):
+        """Minimum of the numbers or ``None`` when no numbers were added."""
+        if self._buffer:
+            self._compress()
+
+        return self._min
+
+    @property
+    def max(self):
+        """Maximum of the numbers or ``None`` when no numbers were added."""
+        if self._buffer:
+            self._compress()
+
+        return self._max
+
+    def _compress(self):
+        buffer = self._buffer
+        self._buffer = []
+
+        if buffer:
+            low = min(buffer)
+            high = max(buffer)
+            self._min = low if self._min is None else min(self._min, low)
+            self._max = high if self._max is None else max(self._max, high)
+            self._weight += len(buffer)
+
+        items = self._centroids + list(izip(buffer, repeat(1)))
+        items.sort()
+
+        if not items:
+            return
+
+        total = self._weight
+        centroids = []
+        before = 0
+        limit = total * base_tdigest_limit(0, self.compression)
+        mean, weight = items[0]
+
+        for item_mean, item_weight in islice(items, 1, None):
+            if before + weight + item_weight <= limit:
+                weight += item_weight
+                mean += (item_mean - mean) * item_weight / weight
+            else:
+                centroids.append((mean, weight))
+                before += weight
+                limit = total * base_tdigest_limit(before / total,
+                                                   self.compression)
+                mean, weight = item_mean, item_weight
+
+        centroids.append((mean, weight))
+        self._centroids = centroids
+
+    def __repr__(self):
+        return 'TDigest(count={0})'.format(self.count)
+
+
+def add(collection, callback=None, executor=None):
     """Sum each element in `collection`. If callback is passed, each element of
     `collection` is passed through a callback before the summation is computed.
     If `collection` and `callback` are numbers, they are added together.
@@ -59,6 +437,9 @@ def add(collection, callback=None):
             add.
         callback (mixed|number, optional): Callback applied per iteration or
             second number to add.
+        executor (Executor, optional): ``concurrent.futures.Executor`` used to
+            run `callback` over chunks of `collection` in parallel. Defaults
+            to running serially.
 
     Returns:
         number: Result of summation.
@@ -80,9 +461,14 @@ def add(collection, callback=None):
 
     .. versionchanged:: 3.3.0
         Support adding two numbers when passed as positional arguments.
+
+    .. versionchanged:: TODO
+        Added `executor` argument.
     """
     if pyd.is_number(collection) and pyd.is_number(callback):
         return collection + callback
+    elif executor is not None:
+        return sum(pyd.map_(collection, callback, executor))
     else:
         return sum(result[0] for result in itercallback(collection, callback))
 
@@ -115,8 +501,12 @@ def average(collection, callback=None):
         - :func:`mean` (alias)
 
     .. versionadded:: 2.1.0
+
+    .. versionchanged:: TODO
+        Support iterables and compute the result in a single pass with
+        compensated summation.
     """
-    return add(collection, callback) / pyd.size(collection)
+    return base_running_stats(collection, callback).mean
 
 
 avg = average
@@ -254,7 +644,8 @@ def max_by(collection, callback=None, default=NoValue):
 def median(collection, callback=None):
     """Calculate median of each element in `collection`. If callback is passed,
     each element of `collection` is passed through a callback before the
-    median is computed.
+    median is computed. The middle elements are selected in linear time
+    instead of sorting the whole collection.
 
     Args:
         collection (list|dict): Collection to process.
@@ -263,27 +654,41 @@ def median(collection, callback=None):
     Returns:
         float: Result of median.
 
+    Raises:
+        ValueError: If `collection` is empty.
+
     Example:
 
         >>> median([1, 2, 3, 4, 5])
         3
         >>> median([1, 2, 3, 4])
         2.5
+        >>> median([{'a': 5}, {'a': 1}, {'a': 3}], 'a')
+        3
+
+    See Also:
+        - :func:`quantile`
 
     .. versionadded:: 2.1.0
+
+    .. versionchanged:: TODO
+        Apply `callback` before ordering the elements and select the middle
+        elements instead of sorting them.
     """
-    length = len(collection)
-    middle = (length + 1) / 2
-    collection = [ret[0] for ret in itercallback(sorted(collection), callback)]
+    values = base_sample_values(collection, callback)
+    size = len(values)
 
-    if pyd.is_odd(length):
-        result = collection[int(middle - 1)]
-    else:
-        left = int(middle - 1.5)
-        right = int(middle - 0.5)
-        result = (collection[left] + collection[right]) / 2
+    if not size:
+        raise ValueError('collection must not be empty')
 
-    return result
+    middle = size // 2
+
+    if size % 2:
+        return base_select(values, [middle])[middle]
+
+    selected = base_select(values, [middle - 1, middle])
+
+    return (selected[middle - 1] + selected[middle]) / 2
 
 
 def min_(collection, default=NoValue):
@@ -340,24 +745,27 @@ def min_by(collection, callback=None, default=NoValue):
 
 
 def moving_average(array, size):
-    """Calculate moving average of each element of `array`. If callback is
-    passed, each element of `array` is passed through a callback before the
-    moving average is computed.
+    """Calculate moving average of each window of `size` consecutive elements
+    of `array`. The average is updated in constant time per element from a
+    compensated running sum of the window.
 
     Args:
-        array (list): List to process.
+        array (list): List or iterable to process.
         size (int): Window size.
 
     Returns:
-        list: Result of moving average.
+        generator: Averages of each full window.
+
+    Raises:
+        ValueError: If `size` is not positive.
 
     Example:
 
-        >>> moving_average(range(10), 1)
+        >>> list(moving_average(range(10), 1))
         [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0]
-        >>> moving_average(range(10), 5)
+        >>> list(moving_average(range(10), 5))
         [2.0, 3.0, 4.0, 5.0, 6.0, 7.0]
-        >>> moving_average(range(10), 10)
+        >>> list(moving_average(range(10), 10))
         [4.5]
 
     See Also:
@@ -365,20 +773,144 @@ def moving_average(array, size):
         - :func:`moving_avg` (alias)
 
     .. versionadded:: 2.1.0
+
+    .. versionchanged:: TODO
+        Return a generator and support iterables. (**breaking change**)
     """
-    result = []
-    size = int(size)
+    size = base_window_size(size)
+    return (total / size for total in base_moving_sums(array, size))
 
-    for i in _range(size - 1, len(array) + 1):
-        window = array[i - size:i]
 
-        if len(window) == size:
-            result.append(average(window))
+moving_avg = moving_average
 
-    return result
 
+def moving_max(array, size):
+    """Calculate moving maximum of each window of `size` consecutive elements
+    of `array` in amortized constant time per element.
 
-moving_avg = moving_average
+    Args:
+        array (list): List or iterable to process.
+        size (int): Window size.
+
+    Returns:
+        generator: Maximum of each full window.
+
+    Raises:
+        ValueError: If `size` is not positive.
+
+    Example:
+
+        >>> list(moving_max([1, 3, 2, 5, 4, 1], 3))
+        [3, 5, 5, 5]
+
+    .. versionadded:: TODO
+    """
+    return base_moving_extremes(array, base_window_size(size), operator.le)
+
+
+def moving_median(array, size):
+    """Calculate moving median of each window of `size` consecutive elements
+    of `array`. The window is kept sorted as elements enter and leave it.
+
+    Args:
+        array (list): List or iterable to process.
+        size (int): Window size.
+
+    Returns:
+        generator: Median of each full window.
+
+    Raises:
+        ValueError: If `size` is not positive.
+
+    Example:
+
+        >>> list(moving_median([1, 3, 2, 5, 4, 1], 3))
+        [2, 3, 4, 4]
+        >>> list(moving_median([1, 3, 2, 5, 4, 1], 2))
+        [2.0, 2.5, 3.5, 4.5, 2.5]
+
+    .. versionadded:: TODO
+    """
+    return base_moving_medians(array, base_window_size(size))
+
+
+def moving_min(array, size):
+    """Calculate moving minimum of each window of `size` consecutive elements
+    of `array` in amortized constant time per element.
+
+    Args:
+        array (list): List or iterable to process.
+        size (int): Window size.
+
+    Returns:
+        generator: Minimum of each full window.
+
+    Raises:
+        ValueError: If `size` is not positive.
+
+    Example:
+
+        >>> list(moving_min([1, 3, 2, 5, 4, 1], 3))
+        [1, 2, 2, 1]
+
+    .. versionadded:: TODO
+    """
+    return base_moving_extremes(array, base_window_size(size), operator.ge)
+
+
+def moving_std(array, size):
+    """Calculate moving standard deviation of each window of `size`
+    consecutive elements of `array`. Like :func:`std_deviation`, this is the
+    population standard deviation. The mean and sum of squared deviations of
+    the window are updated in constant time per element and periodically
+    recomputed to keep rounding errors from accumulating.
+
+    Args:
+        array (list): List or iterable to process.
+        size (int): Window size.
+
+    Returns:
+        generator: Standard deviation of each full window.
+
+    Raises:
+        ValueError: If `size` is not positive.
+
+    Example:
+
+        >>> list(moving_std([1, 1, 3, 3, 1], 2))
+        [0.0, 1.0, 0.0, 1.0]
+
+    .. versionadded:: TODO
+    """
+    return base_moving_stds(array, base_window_size(size))
+
+
+def moving_sum(array, size):
+    """Calculate moving sum of each window of `size` consecutive elements of
+    `array`. The sum is updated in constant time per element using
+    compensated summation so that rounding errors don't accumulate as
+    elements enter and leave the window.
+
+    Args:
+        array (list): List or iterable to process.
+        size (int): Window size.
+
+    Returns:
+        generator: Sum of each full window.
+
+    Raises:
+        ValueError: If `size` is not positive.
+
+    Example:
+
+        >>> list(moving_sum([1, 2, 3, 4, 5], 2))
+        [3, 5, 7, 9]
+        >>> list(moving_sum([0.1] * 12, 10))
+        [1.0, 1.0, 1.0]
+
+    .. versionadded:: TODO
+    """
+    return base_moving_sums(array, base_window_size(size))
 
 
 def multiply(multiplier, multiplicand):
@@ -407,6 +939,46 @@ def multiply(multiplier, multiplicand):
     return call_math_operator(multiplier, multiplicand, operator.mul, 1)
 
 
+def percentile(collection, p, callback=None):
+    """Calculate the `p`-th percentile of each element in `collection` where
+    `p` is between ``0`` and ``100``. This is :func:`quantile` of ``p / 100``.
+
+    Args:
+        collection (list|dict): Collection to process.
+        p (number|list): Percentile or list of percentiles to calculate.
+        callback (mixed, optional): Callback applied per iteration.
+
+    Returns:
+        float|list: Percentile or list of percentiles.
+
+    Raises:
+        ValueError: If `collection` is empty or `p` isn't between ``0`` and
+            ``100``.
+
+    Example:
+
+        >>> percentile([1, 2, 3, 4, 5], 50)
+        3
+        >>> percentile([1, 2, 3, 4], [25, 100])
+        [1.75, 4]
+
+    See Also:
+        - :func:`quantile`
+
+    .. versionadded:: TODO
+    """
+    percents = p if isinstance(p, (list, tuple)) else [p]
+
+    if not all(0 <= percent <= 100 for percent in percents):
+        raise ValueError('p must be between 0 and 100')
+
+    results = base_quantiles(collection,
+                             [percent / 100 for percent in percents],
+                             callback)
+
+    return results if isinstance(p, (list, tuple)) else results[0]
+
+
 def power(x, n):
     """Calculate exponentiation of `x` raised to the `n` power.
 
@@ -443,6 +1015,53 @@ def power(x, n):
 pow_ = power
 
 
+def quantile(collection, q, callback=None):
+    """Calculate the `q`-th quantile of each element in `collection` where `q`
+    is between ``0`` and ``1``. If callback is passed, each element of
+    `collection` is passed through a callback before the quantile is
+    computed. Quantiles between two elements are linearly interpolated. The
+    elements are selected in linear time instead of sorting the whole
+    collection. NumPy arrays and, when NumPy is installed, ``array.array``
+    objects of numbers are partitioned with NumPy.
+
+    Args:
+        collection (list|dict): Collection to process.
+        q (number|list): Quantile or list of quantiles to calculate.
+        callback (mixed, optional): Callback applied per iteration.
+
+    Returns:
+        float|list: Quantile or list of quantiles.
+
+    Raises:
+        ValueError: If `collection` is empty or `q` isn't between ``0`` and
+            ``1``.
+
+    Example:
+
+        >>> quantile([1, 2, 3, 4, 5], 0.5)
+        3
+        >>> quantile([1, 2, 3, 4], [0, 0.25, 0.5])
+        [1, 1.75, 2.5]
+        >>> quantile([{'a': 5}, {'a': 1}, {'a': 3}], 1, 'a')
+        5
+
+    See Also:
+        - :func:`median`
+        - :func:`percentile`
+        - :class:`TDigest`
+
+    .. versionadded:: TODO
+    """
+    quantiles = q if isinstance(q, (list, tuple)) else [q]
+
+    if not all(0 <= value <= 1 for value in quantiles):
+        raise ValueError('q must be between 0 and 1')
+
+    results = base_quantiles(collection, quantiles, callback)
+
+    return results if isinstance(q, (list, tuple)) else results[0]
+
+
 def round_(x, precision=0):
     """Round number to precision.
 
@@ -546,8 +1165,11 @@ def std_deviation(array):
         - :func:`sigma` (alias)
 
     .. versionadded:: 2.1.0
+
+    .. versionchanged:: TODO
+        Support iterables and compute the result in a single pass.
     """
-    return math.sqrt(variance(array))
+    return base_running_stats(array).std_deviation
 
 
 def subtract(minuend, subtrahend):
@@ -597,7 +1219,7 @@ def transpose(array):
 
     for y, row in iterator(array):
         for x, col in iterator(row):
-            trans = pyd.set_path(trans, col, [x, y])
+            pyd.set_path(trans, col, [x, y], mutate=True)
 
     return trans
 
@@ -617,13 +1239,11 @@ def variance(array):
         69.6875
 
     .. versionadded:: 2.1.0
-    """
-    ave = average(array)
-
-    def var(x):
-        return power(x - ave, 2)
 
-    return pyd._(array).map_(var).average().value()
+    .. versionchanged:: TODO
+        Support iterables and compute the result in a single pass.
+    """
+    return base_running_stats(array).variance
 
 
 def zscore(collection, callback=None):
@@ -645,12 +1265,16 @@ def zscore(collection, callback=None):
         # [-1.224744871391589, 0.0, 1.224744871391589]
 
     .. versionadded:: 2.1.0
+
+    .. versionchanged:: TODO
+        Compute the mean and standard deviation in a single pass.
     """
-    array = pyd.map_(collection, callback)
-    ave = average(array)
-    sig = sigma(array)
+    array = [result[0] for result in itercallback(collection, callback)]
+    stats = RunningStats(array)
+    ave = stats.mean
+    sig = stats.std_deviation
 
-    return pyd.map_(array, lambda item: (item - ave) / sig)
+    return [(item - ave) / sig for item in array]
 
 
 #
@@ -697,3 +1321,315 @@ def rounder(func, x, precision):
             pass
 
     return result
+
+
+def base_add_compensated(total, compensation, value):
+    """Add `value` to the running `total` using Neumaier's compensated
+    summation and return the new total and compensation.
+    """
+    result = total + value
+
+    if abs(total) >= abs(value):
+        compensation += (total - result) + value
+    else:
+        compensation += (value - result) + total
+
+    return result, compensation
+
+
+def base_is_finite(value):
+    """Return whether the number `value` is neither infinite nor NaN."""
+    return value == value and abs(value) != INFINITY
+
+
+def base_moving_extremes(iterable, size, op):
+    """Yield the extreme value of each window of `size` values of `iterable`
+    using a monotonic deque of the indexes and values that can still become
+    the extreme. Values that are superseded by a later value because
+    ``op(value, later)`` is truthy are dropped.
+    """
+    candidates = deque()
+
+    for index, value in enumerate(iterable):
+        while candidates and op(candidates[-1][1], value):
+            candidates.pop()
+
+        candidates.append((index, value))
+
+        if candidates[0][0] <= index - size:
+            candidates.popleft()
+
+        if index >= size - 1:
+            yield candidates[0][1]
+
+
+def base_moving_medians(iterable, size):
+    """Yield the median of each window of `size` values of `iterable`."""
+    window = deque()
+    ordered = []
+    middle = size // 2
+
+    for value in iterable:
+        if len(window) == size:
+            old = window.popleft()
+            index = bisect_left(ordered, old)
+
+            if index < len(ordered) and ordered[index] == old:
+                del ordered[index]
+            else:
+                # Incomparable values like NaN may not be where bisection
+                # expects them.
+                ordered.remove(old)
+
+        window.append(value)
+        insort(ordered, value)
+
+        if len(window) == size:
+            if size % 2:
+                yield ordered[middle]
+            else:
+                yield (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def base_moving_stds(iterable, size):
+    """Yield the population standard deviation of each window of `size`
+    values of `iterable` by adding and removing values from the running mean
+    and sum of squared deviations of the finite values of the window. Since
+    removing values accumulates rounding errors, both are recomputed from the
+    window every `size` values and whenever the sum of squared deviations
+    drops by more than :data:`MOVING_STD_CANCELLATION` since it was last
+    recomputed.
+    """
+    window = deque()
+    count = nonfinite = steps = 0
+    mean = squares = peak = 0.0
+
+    for value in iterable:
+        if len(window) == size:
+            old = window.popleft()
+
+            if not base_is_finite(old):
+                nonfinite -= 1
+            elif count == 1:
+                count = 0
+                mean = squares = 0.0
+            else:
+                count -= 1
+                delta = old - mean
+                mean -= delta / count
+                squares -= delta * (old - mean)
+
+        window.append(value)
+
+        if base_is_finite(value):
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            squares += delta * (value - mean)
+        else:
+            nonfinite += 1
+
+        steps += 1
+        peak = max(peak, squares)
+
+        if steps >= size or squares < peak * MOVING_STD_CANCELLATION:
+            finite = [item for item in window if base_is_finite(item)]
+            mean = math.fsum(finite) / count if count else 0.0
+            squares = peak = math.fsum((item - mean) ** 2 for item in finite)
+            steps = 0
+
+        if len(window) == size:
+            if nonfinite:
+                yield float('nan')
+            else:
+                yield math.sqrt(max(squares, 0) / size)
+
+
+def base_moving_sums(iterable, size):
+    """Yield the sum of each window of `size` values of `iterable` from a
+    compensated running sum of the finite values of the window. Windows
+    containing infinite or NaN values are summed directly.
+    """
+    window = deque()
+    total = compensation = 0
+    nonfinite = 0
+
+    for value in iterable:
+        if len(window) == size:
+            old = window.popleft()
+
+            if base_is_finite(old):
+                total, compensation = base_add_compensated(total,
+                                                           compensation,
+                                                           -old)
+            else:
+                nonfinite -= 1
+
+        window.append(value)
+
+        if base_is_finite(value):
+            total, compensation = base_add_compensated(total, compensation,
+                                                       value)
+        else:
+            nonfinite += 1
+
+        if len(window) == size:
+            yield sum(window) if nonfinite else total + compensation
+
+
+def base_quantiles(collection, quantiles, callback=None):
+    """Return the linearly interpolated `quantiles` of each element of
+    `collection` passed through `callback`.
+    """
+    values = base_sample_values(collection, callback)
+    size = len(values)
+
+    if not size:
+        raise ValueError('collection must not be empty')
+
+    positions = [(size - 1) * value for value in quantiles]
+    ranks = set()
+
+    for position in positions:
+        rank = int(position)
+        ranks.add(rank)
+
+        if rank < position:
+            ranks.add(rank + 1)
+
+    selected = base_select(values, sorted(ranks))
+    results = []
+
+    for position in positions:
+        rank = int(position)
+        result = selected[rank]
+
+        if rank < position:
+            result += (selected[rank + 1] - result) * (position - rank)
+
+        results.append(result)
+
+    return results
+
+
+def base_running_stats(collection, callback=None):
+    """Return the :class:`RunningStats` of each element of `collection`
+    passed through `callback`.
+    """
+    if callback is None:
+        values = (item for _, item in iterator(collection))
+    else:
+        values = (result[0] for result in itercallback(collection, callback))
+
+    return RunningStats(values)
+
+
+def base_sample_values(collection, callback=None):
+    """Return the elements of `collection` passed through `callback` as a
+    ``list`` or as a NumPy array of numbers when `collection` can be viewed
+    as one and there's no callback.
+    """
+    if callback is None:
+        vector = numpy_vector(collection)
+
+        if vector is not None and vector.dtype.kind in 'iuf':
+            return vector
+
+        return [item for _, item in iterator(collection)]
+
+    return [result[0] for result in itercallback(collection, callback)]
+
+
+def base_select(values, ranks):
+    """Return a ``dict`` mapping each of the sorted `ranks` to the value of
+    that rank in ascending order of `values`. NumPy arrays are partitioned by
+    NumPy. Otherwise each group of neighboring ranks is selected by
+    :func:`base_select_window` in linear time. Small or unfavorable inputs are
+    sorted instead.
+    """
+    if is_numpy_vector(values):
+        partitioned = values.copy()
+        partitioned.partition(ranks)
+        return dict((rank, partitioned[rank].item()) for rank in ranks)
+
+    groups = []
+
+    for rank in ranks:
+        if groups and rank - groups[-1][-1] <= 1:
+            groups[-1].append(rank)
+        else:
+            groups.append([rank])
+
+    if len(values) > SELECT_SORT_SIZE and len(groups) <= SELECT_MAX_GROUPS:
+        selected = {}
+
+        for group in groups:
+            window = base_select_window(values, group[0], group[-1])
+
+            if window is None:
+                break
+
+            below, middle = window
+            middle.sort()
+
+            for rank in group:
+                selected[rank] = middle[rank - below]
+        else:
+            return selected
+
+    ordered = sorted(values)
+
+    return dict((rank, ordered[rank]) for rank in ranks)
+
+
+def base_select_window(values, first, last):
+    """Return the number of `values` below the values of the ranks `first`
+    through `last` in ascending order and the unordered list of values in a
+    window that contains them or ``None`` if the window misses them. The
+    bounds of the window are picked from a sorted sample of `values` around
+    the ranks like the Floyd-Rivest algorithm does, so that filtering
+    `values` leaves only a small window to sort.
+    """
+    size = len(values)
+    sample = sorted(values[::max(int(size ** (1 / 3)), 1)])
+    count = len(sample)
+    margin = int(math.sqrt(count * math.log(size)))
+    lower = sample[max(first * count // size - margin, 0)]
+    upper = sample[min(last * count // size + margin, count - 1)]
+    # Only the values on the side of the window holding fewer values are
+    # filtered twice.
+    if 2 * last < size:
+        head = [value for value in values if value <= upper]
+        middle = [value for value in head if lower <= value]
+        below = len(head) - len(middle)
+    else:
+        tail = [value for value in values if lower <= value]
+        middle = [value for value in tail if value <= upper]
+        below = size - len(tail)
+
+    if below <= first and last < below + len(middle):
+        return below, middle
+
+    return None
+
+
+def base_tdigest_limit(q, compression):
+    """Return the largest quantile up to which a t-digest centroid starting
+    at the quantile `q` may extend according to the arcsine scale function of
+    `compression`.
+    """
+    scale = math.asin(2 * q - 1) + 2 * math.pi / compression
+
+    return (math.sin(min(scale, math.pi / 2)) + 1) / 2
+
+
+def base_window_size(size):
+    """Return the window `size` as an ``int`` or raise a ``ValueError`` if it
+    isn't positive.
+    """
+    size = int(size)
+
+    if size < 1:
+        raise ValueError('size must be a positive integer')
+
+    return size
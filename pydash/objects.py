@@ -6,7 +6,10 @@
 
 from __future__ import absolute_import
 
+from collections import OrderedDict
 import copy
+from decimal import Decimal
+from functools import partial
 import math
 import re
 
@@ -20,7 +23,13 @@ from .helpers import (
     callit,
     getargcount
 )
-from ._compat import iteritems, text_type
+from ._compat import (
+    _range,
+    integer_types,
+    iteritems,
+    string_types,
+    text_type
+)
 from .utilities import to_path
 
 
@@ -29,22 +38,29 @@ __all__ = (
     'callables',
     'clone',
     'clone_deep',
+    'compile_path',
     'deep_get',
     'deep_has',
+    'deep_iter',
     'deep_set',
     'deep_map_values',
     'defaults',
     'defaults_deep',
+    'diff',
     'extend',
     'find_key',
     'find_last_key',
+    'flatten_keys',
     'for_in',
     'for_in_right',
     'for_own',
     'for_own_right',
     'get',
+    'get_many',
     'get_path',
     'has',
+    'has_all',
+    'has_any',
     'has_path',
     'invert',
     'keys',
@@ -54,11 +70,17 @@ __all__ = (
     'merge',
     'methods',
     'omit',
+    'omit_all',
     'pairs',
     'parse_int',
+    'patch',
     'pick',
+    'pick_all',
+    'project',
     'rename_keys',
+    'rename_keys_all',
     'set_',
+    'set_many',
     'set_path',
     'to_boolean',
     'to_dict',
@@ -66,12 +88,58 @@ __all__ = (
     'to_plain_object',
     'to_string',
     'transform',
+    'unflatten_keys',
+    'update_many',
     'update_path',
     'values',
     'values_in',
+    'walk',
 )
 
 
+# Scalar types that are safe to share between objects without copying.
+IMMUTABLE_TYPES = (bool, float, complex, Decimal) + string_types + \
+    integer_types + (bytes,)
+
+# Exact types that are cloned as is by the deep cloner.
+CLONE_SCALAR_TYPES = frozenset(IMMUTABLE_TYPES + (type(None),))
+
+
+class CompiledPath(object):
+    """Wrap a parsed object path with a precomputed access plan for each of
+    its keys.
+    """
+    def __init__(self, path):
+        keys = to_path(path)
+
+        if not pyd.is_list(keys):
+            keys = [keys]
+
+        self.keys = list(keys)
+        self.plan = [base_path_segment(key) for key in self.keys]
+
+    def __call__(self, obj, default=None):
+        """Return value of `obj` at :attr:`keys` or `default` if the path
+        doesn't exist.
+        """
+        for key, index in self.plan:
+            obj = base_get_segment(obj, key, index, NoValue)
+
+            if obj is NoValue:
+                return default
+
+        return obj
+
+    get = __call__
+
+    def set(self, obj, value, default=None, mutate=False):
+        """Set value of `obj` at :attr:`keys` using :func:`set_path`."""
+        return set_path(obj, value, self.keys, default=default, mutate=mutate)
+
+    def __repr__(self):  # pragma: no cover
+        return '{0}({1!r})'.format(type(self).__name__, self.keys)
+
+
 def assign(obj, *sources, **kargs):
     """Assigns own enumerable properties of source object(s) to the destination
     object. If `callback` is supplied, it is invoked with two arguments:
@@ -113,6 +181,9 @@ def assign(obj, *sources, **kargs):
 
     .. versionchanged:: 3.4.4
         Shallow copy each `source` instead of deep copying.
+
+    .. versionchanged:: TODO
+        Don't copy each `source` before assigning to `obj`.
     """
     sources = list(sources)
     callback = kargs.get('callback')
@@ -124,8 +195,6 @@ def assign(obj, *sources, **kargs):
                 else None)
 
     for source in sources:
-        source = source.copy()
-
         for key, value in iteritems(source):
             obj[key] = (value if callback is None
                         else callit(callback,
@@ -199,21 +268,25 @@ def clone(value, is_deep=False, callback=None):
         list|dict: Cloned object.
 
     .. versionadded:: 1.0.0
-    """
-    if callback is None:
-        callback = pyd.identity
 
-    copier = copy.deepcopy if is_deep else copy.copy
+    .. versionchanged:: TODO
+        Deep clone ``dict`` and ``list`` trees without using
+        ``copy.deepcopy`` and only copy `value` once.
+    """
+    copier = base_clone_deep if is_deep else copy.copy
     value = copier(value)
 
-    obj = [(key, callback(val)) for key, val in iterator(value)]
+    if type(value) not in (dict, list):
+        if isinstance(value, list):
+            value = list(value)
+        else:
+            value = dict(iterator(value))
 
-    if isinstance(value, list):
-        obj = [val for _, val in obj]
-    else:
-        obj = dict(obj)
+    if callback is not None:
+        for key, val in iterator(value):
+            value[key] = callback(val)
 
-    return obj
+    return value
 
 
 def clone_deep(value, callback=None):
@@ -244,6 +317,36 @@ def clone_deep(value, callback=None):
     return clone(value, is_deep=True, callback=callback)
 
 
+def compile_path(path):
+    """Parse `path` once into a reusable path object that can get and set the
+    value of other objects at `path`. Each key of the path is planned ahead as
+    a ``dict`` key, a sequence index, or an attribute lookup for objects that
+    don't support item access.
+
+    Args:
+        path (str|list): List or ``.`` delimited string of path describing
+            path.
+
+    Returns:
+        CompiledPath: Callable path object with ``get(obj, default=None)`` and
+            ``set(obj, value, default=None, mutate=False)`` methods. Calling
+            it is the same as calling ``get``.
+
+    Example:
+
+        >>> path = compile_path('a.b[0].c')
+        >>> path({'a': {'b': [{'c': 1}]}})
+        1
+        >>> path.get({'a': {}}, default=0)
+        0
+        >>> path.set({'a': {'b': [{}]}}, 2)
+        {'a': {'b': [{'c': 2}]}}
+
+    .. versionadded:: TODO
+    """
+    return CompiledPath(path)
+
+
 def deep_map_values(obj, callback=None, property_path=NoValue):
     """Map all non-object values in `obj` with return values from `callback`.
     The callback is invoked with two arguments: ``(obj_value, property_path)``
@@ -274,17 +377,30 @@ def deep_map_values(obj, callback=None, property_path=NoValue):
 
     .. versionchanged:: 3.0.0
         Allow callbacks to accept partial arguments.
+
+    .. versionchanged:: TODO
+        Traverse `obj` iteratively using :func:`walk`. Objects referenced
+        more than once, including cyclic references, are only mapped once.
     """
-    properties = to_path(property_path)
+    properties = list(to_path(property_path))
 
-    if pyd.is_object(obj):
-        deep_callback = (
-            lambda value, key: deep_map_values(value,
-                                               callback,
-                                               pyd.flatten([properties, key])))
-        return pyd.extend(obj, map_values(obj, deep_callback))
-    else:
-        return callit(callback, obj, properties)
+    if callback is None:
+        callback = pyd.identity
+
+    argcount = getargcount(callback, maxargs=2)
+
+    if not pyd.is_object(obj):
+        return callit(callback, obj, properties, argcount=argcount)
+
+    for path, value, parent, key in base_walk(obj, True, None, None,
+                                              once=True):
+        if parent is not None and not pyd.is_object(value):
+            parent[key] = callit(callback,
+                                 value,
+                                 properties + list(path),
+                                 argcount=argcount)
+
+    return obj
 
 
 def defaults(obj, *sources):
@@ -319,7 +435,7 @@ def defaults(obj, *sources):
     return obj
 
 
-def defaults_deep(obj, *sources):
+def defaults_deep(obj, *sources, **kargs):
     """This method is like :func:`defaults` except that it recursively assigns
     default properties.
 
@@ -327,6 +443,10 @@ def defaults_deep(obj, *sources):
         obj (dict): Destination object whose properties will be modified.
         sources (dict): Source objects to assign to `obj`.
 
+    Keyword Args:
+        copy (bool, optional): Whether to deep copy values from `sources`
+            that are inserted into `obj`. Defaults to ``True``.
+
     Returns:
         dict: Modified `obj`.
 
@@ -343,11 +463,97 @@ def defaults_deep(obj, *sources):
         True
 
     .. versionadded:: 3.3.0
+
+    .. versionchanged:: TODO
+        Only copy values from `sources` that are inserted into `obj` and
+        added `copy` keyword argument.
+    """
+    return merge(obj, *sources, copy=kargs.get('copy', True), _override=False)
+
+
+def diff(obj, other):
+    """Compute the operations that transform `obj` into `other` as a list of
+    JSON Patch (RFC 6902) ``add``, ``remove``, and ``replace`` operations.
+    Nested ``dict`` and ``list`` objects are compared key by key while any
+    other values are compared by type and equality. Identical subtrees are
+    skipped without being traversed.
+
+    Args:
+        obj (mixed): Object to diff from.
+        other (mixed): Object to diff to.
+
+    Returns:
+        list: List of operation dicts with ``op``, ``path``, and ``value``
+            (except for ``remove``) keys where ``path`` is a JSON Pointer.
+            Values are references to the values of `other`.
+
+    Example:
+
+        >>> diff({'a': 1, 'b': [1, 2]}, {'a': 2, 'b': [1]})
+        [{'op': 'replace', 'path': '/a', 'value': 2},\
+ {'op': 'remove', 'path': '/b/1'}]
+        >>> diff({'a/b': {}}, {'a/b': {'c': None}})
+        [{'op': 'add', 'path': '/a~1b/c', 'value': None}]
+        >>> diff([1], [1])
+        []
+
+    Note:
+        Non-string ``dict`` keys are converted to strings in the paths. See
+        :func:`patch` for how they are resolved.
+
+    .. versionadded:: TODO
     """
-    def setter(obj, key, value):
-        obj.setdefault(key, value)
+    ops = []
+    stack = [('', obj, other)]
 
-    return merge(obj, *sources, _setter=setter)
+    while stack:
+        path, value, other_value = stack.pop()
+
+        if value is other_value:
+            continue
+
+        value_type = type(value)
+
+        if value_type is not type(other_value):
+            ops.append(base_patch_op('replace', path, other_value))
+        elif value_type is dict:
+            changes = []
+
+            for key in value:
+                key_path = path + '/' + base_escape_pointer(key)
+
+                if key not in other_value:
+                    ops.append(base_patch_op('remove', key_path))
+                else:
+                    changes.append((key_path, value[key], other_value[key]))
+
+            for key in other_value:
+                if key not in value:
+                    ops.append(base_patch_op('add',
+                                             path + '/' +
+                                             base_escape_pointer(key),
+                                             other_value[key]))
+
+            stack.extend(reversed(changes))
+        elif value_type is list:
+            common = min(len(value), len(other_value))
+            stack.extend(('{0}/{1}'.format(path, index),
+                          value[index],
+                          other_value[index])
+                         for index in reversed(_range(common)))
+
+            for index in _range(common, len(other_value)):
+                ops.append(base_patch_op('add',
+                                         '{0}/{1}'.format(path, index),
+                                         other_value[index]))
+
+            for index in reversed(_range(common, len(value))):
+                ops.append(base_patch_op('remove',
+                                         '{0}/{1}'.format(path, index)))
+        elif value != other_value:
+            ops.append(base_patch_op('replace', path, other_value))
+
+    return ops
 
 
 def find_key(obj, callback=None):
@@ -383,6 +589,72 @@ def find_key(obj, callback=None):
 find_last_key = find_key
 
 
+def flatten_keys(obj, separator='.'):
+    """Flatten a nested object into a ``dict`` whose keys are the paths of each
+    of its non-object values. Path keys of ``dict`` objects are joined with
+    `separator` and indexes of ``list`` objects are written as ``[index]``.
+    Backslashes and separators contained in ``dict`` keys are escaped with a
+    backslash like :func:`pydash.utilities.to_path` expects. A ``[`` is
+    escaped too so that keys like ``'[0]'`` aren't parsed as indexes by
+    :func:`unflatten_keys`. Empty keys are kept as empty path parts and empty
+    ``dict`` and ``list`` objects are kept as values.
+
+    Args:
+        obj (list|dict): Object to flatten.
+        separator (str, optional): Separator between ``dict`` keys. Defaults
+            to ``'.'``.
+
+    Returns:
+        dict: Flattened object.
+
+    Example:
+
+        >>> flat = flatten_keys({'a': {'b': [{'c': 1}, 2]}, 'd.e': 3})
+        >>> flat == {'a.b[0].c': 1, 'a.b[1]': 2, 'd\\\\.e': 3}
+        True
+        >>> flat = flatten_keys({'a': {'b': 1, 'c': []}}, separator='/')
+        >>> flat == {'a/b': 1, 'a/c': []}
+        True
+
+    .. versionadded:: TODO
+    """
+    flat = {}
+
+    if not pyd.is_object(obj):
+        return flat
+
+    stack = [(None, iterator(obj), isinstance(obj, list))]
+
+    while stack:
+        prefix, items, is_list = stack[-1]
+        item = next(items, NoValue)
+
+        if item is NoValue:
+            stack.pop()
+            continue
+
+        key, value = item
+
+        if is_list:
+            path = '{0}[{1}]'.format(prefix or '', key)
+        else:
+            escaped = base_escape_flat_key(text_type(key), separator)
+            path = escaped if prefix is None else prefix + separator + escaped
+
+        if pyd.is_object(value) and value:
+            prefix = path
+
+            if isinstance(value, list) and not is_list and not escaped:
+                # An empty key only ends before an index at a separator.
+                prefix += separator
+
+            stack.append((prefix, iterator(value), isinstance(value, list)))
+        else:
+            flat[path] = value
+
+    return flat
+
+
 def for_in(obj, callback=None):
     """Iterates over own and inherited enumerable properties of `obj`,
     executing `callback` for each property.
@@ -525,6 +797,40 @@ get_path = get
 deep_get = get
 
 
+def get_many(obj, paths, default=None):
+    """Get the values of `obj` at each of `paths`. All paths are parsed up
+    front and grouped by their shared prefixes so that each shared part of a
+    path is only resolved once.
+
+    Args:
+        obj (list|dict): Object to process.
+        paths (list): List of paths as accepted by :func:`get`.
+        default (mixed): Default value to return for each path that doesn't
+            exist. Defaults to ``None``.
+
+    Returns:
+        list: Values of `obj` in the same order as `paths`.
+
+    Example:
+
+        >>> obj = {'a': {'b': [1, 2], 'c': 3}}
+        >>> get_many(obj, ['a.b[1]', 'a.c', 'a.d', 'a.b[0]'])
+        [2, 3, None, 1]
+
+    .. versionadded:: TODO
+    """
+    paths = list(paths)
+    results = [default] * len(paths)
+    trie, roots = base_path_trie(enumerate(paths))
+
+    for position in roots:
+        results[position] = obj
+
+    base_get_trie(obj, trie, results)
+
+    return results
+
+
 def has(obj, path):
     """Checks if `path` exists as a key of `obj`.
 
@@ -563,20 +869,81 @@ def has(obj, path):
 
         - Added :func:`deep_has` as alias.
         - Added :func:`has_path` as alias.
+
+    .. versionchanged:: TODO
+        Check each key without raising and catching exceptions for ``dict``,
+        ``list``, and ``tuple`` objects.
     """
-    try:
-        get(obj, path, default=NoValue)
-        exists = True
-    except (KeyError, IndexError, TypeError, ValueError):
-        exists = False
+    keys = to_path(path)
+
+    if not pyd.is_list(keys):
+        keys = [keys]
+
+    for key in keys:
+        if type(obj) is dict:
+            try:
+                obj = obj.get(key, NoValue)
+            except TypeError:
+                # Unhashable key.
+                return False
+        else:
+            obj = base_get_segment(obj, key, NoValue, NoValue,
+                                   attributes=False)
+
+        if obj is NoValue:
+            return False
 
-    return exists
+    return True
 
 
 deep_has = has
 has_path = has
 
 
+def has_all(obj, paths):
+    """Checks if every path of `paths` exists in `obj`.
+
+    Args:
+        obj (mixed): Object to test.
+        paths (list): Paths to test for as accepted by :func:`has`.
+
+    Returns:
+        bool: Whether `obj` has all `paths`.
+
+    Example:
+
+        >>> has_all({'a': {'b': 1}, 'c': 2}, ['a.b', 'c'])
+        True
+        >>> has_all({'a': {'b': 1}, 'c': 2}, ['a.b', 'd'])
+        False
+
+    .. versionadded:: TODO
+    """
+    return all(has(obj, path) for path in paths)
+
+
+def has_any(obj, paths):
+    """Checks if any path of `paths` exists in `obj`.
+
+    Args:
+        obj (mixed): Object to test.
+        paths (list): Paths to test for as accepted by :func:`has`.
+
+    Returns:
+        bool: Whether `obj` has any of `paths`.
+
+    Example:
+
+        >>> has_any({'a': {'b': 1}}, ['a.c', 'a.b'])
+        True
+        >>> has_any({'a': {'b': 1}}, ['a.c', 'd'])
+        False
+
+    .. versionadded:: TODO
+    """
+    return any(has(obj, path) for path in paths)
+
+
 def invert(obj, multivalue=False):
     """Creates an object composed of the inverted keys and values of the given
     object.
@@ -725,6 +1092,10 @@ def merge(obj, *sources, **kargs):
     Keyword Args:
         callback (function, optional): Callback function to handle merging
             (must be passed in as keyword argument).
+        copy (bool, optional): Whether to deep copy values from `sources`
+            that are inserted into `obj`. When ``False``, containers from
+            `sources` may be inserted into `obj` by reference and modified by
+            subsequent sources. Defaults to ``True``.
 
     Returns:
         dict: Merged object.
@@ -752,38 +1123,23 @@ def merge(obj, *sources, **kargs):
 
     .. versionchanged:: 3.3.0
         Added internal option for overriding the default setter for obj values.
+
+    .. versionchanged:: TODO
+        Only deep copy the mutable values of each `source` that are inserted
+        into `obj` instead of each whole `source` and added `copy` keyword
+        argument. Merge nested objects iteratively and only once per pair of
+        objects so that deeply nested and cyclic objects can be merged.
     """
     sources = list(sources)
-    _clone = kargs.get('_clone', True)
     callback = kargs.get('callback')
-    setter = kargs.get('_setter', set_item)
+    copier = base_clone_value if kargs.get('copy', True) else pyd.identity
+    override = kargs.get('_override', True)
 
     if callback is None and callable(sources[-1]):
         callback = sources.pop()
 
     for source in sources:
-        # Don't re-clone if we've already cloned before.
-        if _clone:
-            source = copy.deepcopy(source)
-
-        for key, src_value in iterator(source):
-            obj_value = get_item(obj, key, default=None)
-            all_sequences = all([isinstance(src_value, list),
-                                 isinstance(obj_value, list)])
-            all_mappings = all([isinstance(src_value, dict),
-                                isinstance(obj_value, dict)])
-
-            if callback:
-                result = callback(obj_value, src_value)
-            elif all_sequences or all_mappings:
-                result = merge(obj_value,
-                               src_value,
-                               _clone=False,
-                               _setter=setter)
-            else:
-                result = src_value
-
-            setter(obj, key, result)
+        base_merge(obj, source, callback, copier, override)
 
     return obj
 
@@ -791,9 +1147,11 @@ def merge(obj, *sources, **kargs):
 def omit(obj, callback=None, *properties):
     """Creates a shallow clone of object excluding the specified properties.
     Property names may be specified as individual arguments or as lists of
-    property names. If a callback is provided it will be executed for each
-    property of object omitting the properties the callback returns truthy for.
-    The callback is invoked with three arguments: ``(value, key, object)``.
+    property names. Property names that aren't keys of `obj` are treated as
+    deep paths in which case only the containers along the path are copied.
+    If a callback is provided it will be executed for each property of object
+    omitting the properties the callback returns truthy for. The callback is
+    invoked with three arguments: ``(value, key, object)``.
 
     Args:
         obj (mixed): Object to process.
@@ -810,23 +1168,56 @@ def omit(obj, callback=None, *properties):
         True
         >>> omit([1, 2, 3, 4], 0, 3) == {1: 2, 2: 3}
         True
+        >>> obj = {'a': {'b': 1, 'c': 2}, 'd': 3}
+        >>> omit(obj, 'a.b') == {'a': {'c': 2}, 'd': 3}
+        True
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: TODO
+        Support deep paths.
     """
-    if not callable(callback):
-        callback = callback if callback is not None else []
-        properties = pyd.flatten_deep([callback, properties])
+    if callable(callback):
+        argcount = getargcount(callback, maxargs=3)
+
+        return dict((key, value) for key, value in iterator(obj)
+                    if not callit(callback, value, key, obj,
+                                  argcount=argcount))
+
+    return base_omit_keys(obj, base_property_trie(obj, callback, properties))
+
+
+def omit_all(records, *properties, **kargs):
+    """Like :func:`omit` but applied to each object in `records`. The
+    properties are parsed only once for all records.
+
+    Args:
+        records (list): Objects to process.
+        properties (str): Property values to omit or a callback as accepted by
+            :func:`omit`.
+
+    Keyword Args:
+        lazy (bool, optional): Whether to return a generator instead of a
+            ``list``. Defaults to ``False``.
+
+    Returns:
+        list: Results of omitting properties from each record.
+
+    Example:
 
-        # pylint: disable=missing-docstring,function-redefined
-        def callback(value, key, item):
-            return key in properties
+        >>> records = [{'a': 1, 'b': 2}, {'a': 3, 'b': 4}]
+        >>> omit_all(records, 'a') == [{'b': 2}, {'b': 4}]
+        True
 
-        argcount = 3
+    .. versionadded:: TODO
+    """
+    if properties and callable(properties[0]):
+        results = (omit(record, *properties) for record in records)
     else:
-        argcount = getargcount(callback, maxargs=3)
+        results = (base_omit_keys(record, trie)
+                   for record, trie in base_record_tries(records, properties))
 
-    return dict((key, value) for key, value in iterator(obj)
-                if not callit(callback, value, key, obj, argcount=argcount))
+    return results if kargs.get('lazy') else list(results)
 
 
 def pairs(obj):
@@ -898,12 +1289,110 @@ def parse_int(value, radix=None):
     return parsed
 
 
+def patch(obj, ops, mutate=False):
+    """Apply a list of JSON Patch (RFC 6902) ``add``, ``remove``, and
+    ``replace`` operations, like those returned by :func:`diff`, to `obj`.
+
+    Unless `mutate` is ``True``, `obj` isn't modified. Instead, each
+    ``dict`` and ``list`` container along the patched paths is shallow copied
+    once while all other values are shared between `obj` and the returned
+    object.
+
+    Args:
+        obj (list|dict): Object to patch.
+        ops (list): List of operation dicts with ``op``, ``path``, and
+            ``value`` keys where ``path`` is a JSON Pointer.
+        mutate (bool, optional): Whether to modify `obj` in place instead of
+            returning a modified copy. Defaults to ``False``.
+
+    Returns:
+        mixed: Patched `obj`.
+
+    Raises:
+        ValueError: If an operation isn't supported.
+        KeyError|IndexError: If a path doesn't exist in `obj`.
+
+    Example:
+
+        >>> obj = {'a': 1, 'b': [1, 2]}
+        >>> patch(obj, [{'op': 'replace', 'path': '/a', 'value': 2},\
+                        {'op': 'add', 'path': '/b/-', 'value': 3}])
+        {'a': 2, 'b': [1, 2, 3]}
+        >>> obj
+        {'a': 1, 'b': [1, 2]}
+        >>> patch(obj, diff(obj, {'c': [None]})) == {'c': [None]}
+        True
+
+    Note:
+        JSON Pointer reference tokens are strings. A token that isn't a key
+        of a ``dict`` refers to its existing non-string key with the same
+        string, e.g., ``'/1'`` refers to the key ``1``. Keys that don't exist
+        yet are added as strings.
+
+    .. versionadded:: TODO
+    """
+    copied = set()
+
+    def copy_container(value):
+        # pylint: disable=missing-docstring
+        if mutate or id(value) in copied:
+            return value
+
+        value = base_copy_container(value)
+        copied.add(id(value))
+
+        return value
+
+    for operation in ops:
+        op = operation['op']
+
+        if op not in ('add', 'remove', 'replace'):
+            raise ValueError('Unsupported patch operation: {0}'.format(op))
+
+        keys = base_unescape_pointer(operation['path'])
+
+        if not keys:
+            obj = operation['value'] if op != 'remove' else None
+            continue
+
+        obj = target = copy_container(obj)
+
+        for key in keys[:-1]:
+            key = base_pointer_key(target, key)
+            child = copy_container(target[key])
+            target[key] = child
+            target = child
+
+        key = keys[-1]
+
+        if isinstance(target, list) and op == 'add':
+            index = len(target) if key == '-' else int(key)
+
+            if index > len(target):
+                raise IndexError('list index out of range')
+
+            target.insert(index, operation['value'])
+        elif op == 'remove':
+            del target[base_pointer_key(target, key)]
+        elif op == 'replace':
+            key = base_pointer_key(target, key)
+            # Trigger KeyError/IndexError for missing replace paths.
+            target[key]  # pylint: disable=pointless-statement
+            target[key] = operation['value']
+        else:
+            target[base_pointer_key(target, key)] = operation['value']
+
+    return obj
+
+
 def pick(obj, callback=None, *properties):
     """Creates a shallow clone of object composed of the specified properties.
     Property names may be specified as individual arguments or as lists of
-    property names. If a callback is provided it will be executed for each
-    property of object picking the properties the callback returns truthy for.
-    The callback is invoked with three arguments: ``(value, key, object)``.
+    property names. Property names that aren't keys of `obj` are treated as
+    deep paths in which case only the containers along the path are copied.
+    If a callback is provided it will be executed for each property of object
+    picking the properties the callback returns truthy for. The callback is
+    invoked with three arguments: ``(value, key, object)``.
 
     Args:
         obj (list|dict): Object to pick from.
@@ -918,24 +1407,116 @@ def pick(obj, callback=None, *properties):
 
         >>> pick({'a': 1, 'b': 2, 'c': 3}, 'a', 'b') == {'a': 1, 'b': 2}
         True
+        >>> obj = {'a': {'b': 1, 'c': 2}, 'd': [3, 4]}
+        >>> pick(obj, 'a.b', 'd[1]') == {'a': {'b': 1}, 'd': [None, 4]}
+        True
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: TODO
+        Support deep paths.
     """
-    if not callable(callback):
-        callback = callback if callback is not None else []
-        properties = pyd.flatten_deep([callback, properties])
+    if callable(callback):
+        argcount = getargcount(callback, maxargs=3)
+
+        return dict((key, value) for key, value in iterator(obj)
+                    if callit(callback, value, key, obj, argcount=argcount))
+
+    return base_pick_keys(obj, base_property_trie(obj, callback, properties))
+
+
+def pick_all(records, *properties, **kargs):
+    """Like :func:`pick` but applied to each object in `records`. The
+    properties are parsed only once for all records.
+
+    Args:
+        records (list): Objects to pick from.
+        properties (str): Property values to pick or a callback as accepted by
+            :func:`pick`.
+
+    Keyword Args:
+        lazy (bool, optional): Whether to return a generator instead of a
+            ``list``. Defaults to ``False``.
+
+    Returns:
+        list: Picked properties of each record.
+
+    Example:
 
-        # pylint: disable=missing-docstring,function-redefined
-        def callback(value, key, item):
-            return key in properties
+        >>> records = [{'a': {'b': 1}, 'c': 2}, {'a': {'b': 3}, 'c': 4}]
+        >>> pick_all(records, 'a.b') == [{'a': {'b': 1}}, {'a': {'b': 3}}]
+        True
 
-        argcount = 3
+    .. versionadded:: TODO
+    """
+    if properties and callable(properties[0]):
+        results = (pick(record, *properties) for record in records)
     else:
-        argcount = getargcount(callback, maxargs=3)
+        results = (base_pick_keys(record, trie)
+                   for record, trie in base_record_tries(records, properties))
+
+    return results if kargs.get('lazy') else list(results)
+
+
+def project(records, spec, default=None, lazy=False):
+    """Create a new ``dict`` for each object in `records` whose keys are the
+    keys of `spec` and whose values are the values of the record at the
+    corresponding `spec` path. A `spec` value may also be a callable which is
+    invoked with the record. All paths are parsed once for all records and
+    shared path prefixes are only resolved once per record.
+
+    Args:
+        records (list): Objects to project.
+        spec (dict|list): Mapping of result keys to paths as accepted by
+            :func:`get` or callables. A ``list`` of paths uses each path as
+            its own result key.
+        default (mixed, optional): Value to use for paths that don't exist.
+            Defaults to ``None``.
+        lazy (bool, optional): Whether to return a generator instead of a
+            ``list``. Defaults to ``False``.
+
+    Returns:
+        list: Projected records.
+
+    Example:
+
+        >>> records = [{'a': {'b': 1}, 'c': 2}, {'a': {'b': 3}}]
+        >>> results = project(records, {'x': 'a.b', 'y': 'c'})
+        >>> results == [{'x': 1, 'y': 2}, {'x': 3, 'y': None}]
+        True
+        >>> project(records, ['c'], default=0) == [{'c': 2}, {'c': 0}]
+        True
 
-    # TODO: cache argcount
-    return dict((key, value) for key, value in iterator(obj)
-                if callit(callback, value, key, obj, argcount=argcount))
+    .. versionadded:: TODO
+    """
+    if not isinstance(spec, dict):
+        spec = OrderedDict((path, path) for path in spec)
+
+    keys = list(spec)
+    paths = [spec[key] for key in keys]
+    callbacks = [(position, path) for position, path in enumerate(paths)
+                 if callable(path)]
+    trie, roots = base_path_trie((position, path)
+                                 for position, path in enumerate(paths)
+                                 if not callable(path))
+
+    def projector(record):
+        # pylint: disable=missing-docstring
+        results = [default] * len(keys)
+
+        for position in roots:
+            results[position] = record
+
+        base_get_trie(record, trie, results)
+
+        for position, callback in callbacks:
+            results[position] = callback(record)
+
+        return dict(zip(keys, results))
+
+    results = (projector(record) for record in records)
+
+    return results if lazy else list(results)
 
 
 def rename_keys(obj, key_map):
@@ -961,17 +1542,49 @@ def rename_keys(obj, key_map):
                 for key, value in iteritems(obj))
 
 
-def set_(obj, path, value):
-    """Sets the value of an object described by `path`. If any part of the
-    object path doesn't exist, it will be created.
+def rename_keys_all(records, key_map, lazy=False):
+    """Like :func:`rename_keys` but applied to each object in `records`.
 
     Args:
-        obj (list|dict): Object to modify.
-        path (str | list): Target path to set value to.
-        value (mixed): Value to set.
+        records (list): Objects to rename.
+        key_map (dict): Renaming map whose keys correspond to existing keys in
+            each record and whose values are the new key name.
+        lazy (bool, optional): Whether to return a generator instead of a
+            ``list``. Defaults to ``False``.
 
     Returns:
-        mixed: Modified `obj`.
+        list: Renamed records.
+
+    Example:
+
+        >>> records = [{'a': 1, 'b': 2}, {'a': 3}]
+        >>> results = rename_keys_all(records, {'a': 'A'})
+        >>> results == [{'A': 1, 'b': 2}, {'A': 3}]
+        True
+
+    .. versionadded:: TODO
+    """
+    rename = key_map.get
+    results = (dict((rename(key, key), value)
+                    for key, value in iteritems(record))
+               for record in records)
+
+    return results if lazy else list(results)
+
+
+def set_(obj, path, value, mutate=False):
+    """Sets the value of an object described by `path`. If any part of the
+    object path doesn't exist, it will be created.
+
+    Args:
+        obj (list|dict): Object to modify.
+        path (str | list): Target path to set value to.
+        value (mixed): Value to set.
+        mutate (bool, optional): Whether to modify `obj` in place instead of
+            returning a modified copy. Defaults to ``False``.
+
+    Returns:
+        mixed: Modified `obj`.
 
     Example:
 
@@ -986,14 +1599,52 @@ def set_(obj, path, value):
 
     .. versionchanged:: 3.3.0
         Added :func:`set_` as main definition and :func:`deep_set` as alias.
+
+    .. versionchanged:: TODO
+        Added `mutate` argument.
     """
-    return set_path(obj, value, to_path(path))
+    return set_path(obj, value, to_path(path), mutate=mutate)
 
 
 deep_set = set_
 
 
-def set_path(obj, value, keys, default=None):
+def set_many(obj, values, default=None, mutate=False):
+    """Sets multiple values of an object described by the paths in `values`.
+    All updates are applied in a single traversal of `obj` using
+    :func:`update_many`.
+
+    Args:
+        obj (list|dict): Object to modify.
+        values (dict|list): Mapping of paths to values or list of ``(path,
+            value)`` pairs.
+        default (mixed, optional): Default value to assign if path part is not
+            set. Defaults to ``{}`` if `obj` is a ``dict`` or ``[]`` if `obj`
+            is a ``list``.
+        mutate (bool, optional): Whether to modify `obj` in place instead of
+            returning a modified copy. Defaults to ``False``.
+
+    Returns:
+        mixed: Modified `obj`.
+
+    Example:
+
+        >>> set_many({}, {'a.b': 1, 'a.c': 2}) == {'a': {'b': 1, 'c': 2}}
+        True
+        >>> set_many([], [('[0]', 1), ('[1].[0]', 2)])
+        [1, [2]]
+
+    .. versionadded:: TODO
+    """
+    if isinstance(values, dict):
+        values = iteritems(values)
+
+    callbacks = [(path, base_constant(value)) for path, value in values]
+
+    return update_many(obj, callbacks, default=default, mutate=mutate)
+
+
+def set_path(obj, value, keys, default=None, mutate=False):
     """Sets the value of an object described by `keys`. If any part of the
     object path doesn't exist, it will be created with `default`.
 
@@ -1004,6 +1655,8 @@ def set_path(obj, value, keys, default=None):
         default (callable, optional): Callable that returns default value to
             assign if path part is not set. Defaults to ``{}`` if `obj` is a
             ``dict`` or ``[]`` if `obj` is a ``list``.
+        mutate (bool, optional): Whether to modify `obj` in place instead of
+            returning a modified copy. Defaults to ``False``.
 
     Returns:
         mixed: Modified `obj`.
@@ -1016,9 +1669,13 @@ def set_path(obj, value, keys, default=None):
         True
 
     .. versionadded:: 2.0.0
+
+    .. versionchanged:: TODO
+        Added `mutate` argument.
     """
     # pylint: disable=redefined-outer-name
-    return update_path(obj, lambda *_: value, keys, default=default)
+    return update_path(obj, lambda *_: value, keys, default=default,
+                       mutate=mutate)
 
 
 def to_boolean(obj, true_values=('true', '1'), false_values=('false', '0')):
@@ -1225,12 +1882,139 @@ def transform(obj, callback=None, accumulator=None):
     return accumulator
 
 
-def update_path(obj, callback, keys, default=None):
+def unflatten_keys(obj, separator='.'):
+    """Build a nested object from a ``dict`` whose keys are paths as returned
+    by :func:`flatten_keys`. Path parts written as ``[index]`` create
+    ``list`` objects, padding skipped indexes with ``None``, while all other
+    path parts create ``dict`` objects. Each container is created once.
+
+    Args:
+        obj (dict): Flattened object.
+        separator (str, optional): Separator between ``dict`` keys. Defaults
+            to ``'.'``.
+
+    Returns:
+        list|dict: Nested object. The result is a ``list`` if every path
+            starts with an index.
+
+    Example:
+
+        >>> obj = unflatten_keys({'a.b[0].c': 1, 'a.b[1]': 2, 'd\\\\.e': 3})
+        >>> obj == {'a': {'b': [{'c': 1}, 2]}, 'd.e': 3}
+        True
+        >>> unflatten_keys({'[1]': 'b', '[0]': 'a'})
+        ['a', 'b']
+
+    .. versionadded:: TODO
+    """
+    paths = [(base_parse_flat_key(key, separator), value)
+             for key, value in iteritems(obj)]
+    is_list = bool(paths) and all(isinstance(keys[0], int)
+                                  for keys, _ in paths)
+    root = [] if is_list else {}
+
+    for keys, value in paths:
+        target = root
+
+        for key, next_key in zip(keys, keys[1:]):
+            child = base_flat_get(target, key)
+
+            if not pyd.is_object(child):
+                child = [] if isinstance(next_key, int) else {}
+                base_flat_set(target, key, child)
+
+            target = child
+
+        base_flat_set(target, keys[-1], value)
+
+    return root
+
+
+def update_many(obj, callbacks, default=None, mutate=False):
+    """Update multiple values of an object described by the paths in
+    `callbacks`. All paths are parsed up front and grouped by their shared
+    prefixes so that every update is applied in a single traversal of `obj`.
+    Each callback is invoked with the current value at its path: ``(value)``
+
+    Unless `mutate` is ``True``, `obj` isn't modified. Instead, each ``dict``
+    and ``list`` container along the updated paths is shallow copied once
+    while all other values are shared between `obj` and the returned object.
+
+    Updates to a path are applied before updates to any path nested under it.
+    Otherwise, updates are applied in the order of `callbacks`.
+
+    Args:
+        obj (list|dict): Object to modify.
+        callbacks (dict|list): Mapping of paths to callbacks or list of
+            ``(path, callback)`` pairs.
+        default (mixed, optional): Default value to assign if path part is not
+            set. Defaults to ``{}`` if `obj` is a ``dict`` or ``[]`` if `obj`
+            is a ``list``.
+        mutate (bool, optional): Whether to modify `obj` in place instead of
+            returning a modified copy. Defaults to ``False``.
+
+    Returns:
+        mixed: Updated `obj`.
+
+    Example:
+
+        >>> obj = {'a': {'b': 1, 'c': 2}}
+        >>> new_obj = update_many(obj, {'a.b': lambda value: value + 1,\
+                                        'a.d': lambda value: value})
+        >>> new_obj == {'a': {'b': 2, 'c': 2, 'd': None}}
+        True
+        >>> obj == {'a': {'b': 1, 'c': 2}}
+        True
+
+    .. versionadded:: TODO
+    """
+    if default is None:
+        default = {} if isinstance(obj, dict) else []
+
+    if isinstance(callbacks, dict):
+        callbacks = iteritems(callbacks)
+
+    trie = OrderedDict()
+
+    for position, (path, callback) in enumerate(callbacks):
+        keys = to_path(path)
+
+        if not pyd.is_list(keys):
+            keys = [keys]
+
+        if not keys:
+            # Like set_ and update_path, an empty path refers to the key None.
+            keys = [None]
+
+        node = None
+        children = trie
+
+        for key in keys:
+            node = children.setdefault(key, ([], OrderedDict()))
+            children = node[1]
+
+        node[0].append((position, callback))
+
+    if not mutate:
+        # Roots that aren't containers are cloned like in update_path.
+        obj = (base_copy_container(obj) if isinstance(obj, (dict, list))
+               else clone_deep(obj))
+
+    base_update_trie(obj, trie, default, mutate)
+
+    return obj
+
+
+def update_path(obj, callback, keys, default=None, mutate=False):
     """Update the value of an object described by `keys` using `callback`. If
     any part of the object path doesn't exist, it will be created with
     `default`. The callback is invoked with the last key value of `obj`:
     ``(value)``
 
+    Unless `mutate` is ``True``, `obj` isn't modified. Instead, only the
+    ``dict`` and ``list`` containers along the path are shallow copied while
+    all other values are shared between `obj` and the returned object.
+
     Args:
         obj (list|dict): Object to modify.
         callback (function): Function that returns updated value.
@@ -1239,6 +2023,8 @@ def update_path(obj, callback, keys, default=None):
         default (mixed, optional): Default value to assign if path part is not
             set. Defaults to ``{}`` if `obj` is a ``dict`` or ``[]`` if `obj`
             is a ``list``.
+        mutate (bool, optional): Whether to modify `obj` in place instead of
+            returning a modified copy. Defaults to ``False``.
 
     Returns:
         mixed: Updated `obj`.
@@ -1249,8 +2035,20 @@ def update_path(obj, callback, keys, default=None):
         {'a': {'b': None}}
         >>> update_path([], lambda value: value, [0, 0])
         [[None]]
+        >>> obj = {'a': {'b': 1}, 'c': {'d': 2}}
+        >>> new_obj = update_path(obj, lambda value: value + 1, ['a', 'b'])
+        >>> new_obj == {'a': {'b': 2}, 'c': {'d': 2}}
+        True
+        >>> obj['a']['b']
+        1
+        >>> new_obj['c'] is obj['c']
+        True
 
     .. versionadded:: 2.0.0
+
+    .. versionchanged:: TODO
+        Copy only the containers along the path instead of deep cloning
+        `obj` and added `mutate` argument.
     """
     # pylint: disable=redefined-outer-name
     if default is None:
@@ -1260,16 +2058,17 @@ def update_path(obj, callback, keys, default=None):
         keys = [keys]
 
     last_key = pyd.last(keys)
-    obj = clone_deep(obj)
+
+    if not mutate:
+        # Roots that aren't containers are cloned like before, which converts
+        # e.g. None to {}.
+        obj = (base_copy_container(obj) if isinstance(obj, (dict, list))
+               else clone_deep(obj))
+
     target = obj
 
     for key in pyd.initial(keys):
-        set_item(target, key, clone_deep(default), allow_override=False)
-
-        try:
-            target = target[key]
-        except TypeError:
-            target = target[int(key)]
+        target = base_path_child(target, key, default, mutate)
 
     set_item(target, last_key, callback(get_item(target,
                                                  last_key,
@@ -1308,3 +2107,708 @@ def values(obj):
 
 
 values_in = values
+
+
+def walk(obj, order='pre', max_depth=None, prune=None):
+    """Lazily traverse `obj` and all ``list`` and ``dict`` objects nested in
+    it, yielding a ``(path, value)`` tuple for each value where ``path`` is a
+    tuple of the keys leading to ``value``. The traversal is iterative, so
+    deeply nested objects don't hit the recursion limit. A ``list`` or
+    ``dict`` that is already being traversed further up its path, i.e. a
+    cyclic reference, is yielded but not traversed again.
+
+    Args:
+        obj (list|dict): Object to traverse.
+        order (str, optional): Either ``'pre'`` to yield each value before the
+            values nested in it or ``'post'`` to yield it after them. Defaults
+            to ``'pre'``.
+        max_depth (int, optional): Maximum path length to descend to. Values
+            at this depth are yielded but not traversed. Defaults to no limit.
+        prune (function, optional): Callback invoked with ``(value, path)``
+            for each ``list`` or ``dict`` value. If it returns a truthy value,
+            ``value`` is yielded but not traversed.
+
+    Yields:
+        tuple: ``(path, value)`` pairs starting with ``((), obj)`` when
+            `order` is ``'pre'`` or ending with it when `order` is ``'post'``.
+
+    Raises:
+        ValueError: If `order` is not ``'pre'`` or ``'post'``.
+
+    Example:
+
+        >>> obj = {'a': [1, {'b': 2}]}
+        >>> list(walk(obj)) == [((), obj),\
+                                (('a',), obj['a']),\
+                                (('a', 0), 1),\
+                                (('a', 1), {'b': 2}),\
+                                (('a', 1, 'b'), 2)]
+        True
+        >>> [path for path, _ in walk(obj, order='post')]
+        [('a', 0), ('a', 1, 'b'), ('a', 1), ('a',), ()]
+        >>> [path for path, _ in walk(obj, max_depth=1)]
+        [(), ('a',)]
+
+    See Also:
+        - :func:`walk` (main definition)
+        - :func:`deep_iter` (alias)
+
+    .. versionadded:: TODO
+    """
+    if order not in ('pre', 'post'):
+        raise ValueError('order must be either "pre" or "post"')
+
+    if prune is not None:
+        argcount = getargcount(prune, maxargs=2)
+        prune = partial(callit, prune, argcount=argcount)
+
+    for path, value, _, _ in base_walk(obj, order == 'pre', max_depth, prune):
+        yield path, value
+
+
+deep_iter = walk
+
+
+#
+# Helper functions not a part of main API
+#
+
+
+def base_clone_deep(value):
+    """Return a deep copy of `value`. Trees of ``dict`` and ``list`` objects
+    are copied iteratively by looking up the copier of each exact type in a
+    dispatch table while any other mutable value is copied with
+    ``copy.deepcopy``. Objects referenced multiple times are only copied once
+    so shared and cyclic references are preserved like with
+    ``copy.deepcopy``.
+    """
+    if type(value) in CLONE_SCALAR_TYPES:
+        return value
+
+    memo = {}
+    stack = []
+
+    def clone_value(value):
+        # pylint: disable=missing-docstring
+        value_type = type(value)
+
+        if value_type in CLONE_SCALAR_TYPES:
+            return value
+
+        ident = id(value)
+
+        if ident in memo:
+            return memo[ident]
+
+        if value_type not in copiers:
+            return copy.deepcopy(value, memo)
+
+        cloned = memo[ident] = value_type()
+        stack.append((value, cloned))
+
+        return cloned
+
+    def copy_dict(source, target):
+        # pylint: disable=missing-docstring
+        for key, val in iteritems(source):
+            target[key] = (val if type(val) in CLONE_SCALAR_TYPES
+                           else clone_value(val))
+
+    def copy_list(source, target):
+        # pylint: disable=missing-docstring
+        target.extend(val if type(val) in CLONE_SCALAR_TYPES
+                      else clone_value(val)
+                      for val in source)
+
+    copiers = {dict: copy_dict, list: copy_list}
+    cloned = clone_value(value)
+
+    while stack:
+        source, target = stack.pop()
+        copiers[type(source)](source, target)
+
+    return cloned
+
+
+def base_copy_container(value):
+    """Return a shallow copy of `value` if it's a ``dict`` or ``list``;
+    otherwise, return `value` unchanged.
+    """
+    if isinstance(value, (dict, list)):
+        value = copy.copy(value)
+
+    return value
+
+
+def base_constant(value):
+    """Return a callback that ignores its arguments and returns `value`."""
+    return lambda *_: value
+
+
+def base_path_child(target, key, default, mutate):
+    """Return the child container of `target` at `key` for modification. A
+    missing child is created from a clone of `default` and, unless `mutate` is
+    ``True``, an existing child is replaced with a shallow copy of itself.
+    """
+    try:
+        try:
+            child = target[key]
+        except TypeError:
+            child = target[int(key)]
+    except (KeyError, IndexError):
+        child = clone_deep(default)
+        set_item(target, key, child)
+    else:
+        if not mutate:
+            child = base_copy_container(child)
+            set_item(target, key, child)
+
+    return child
+
+
+def base_update_trie(target, trie, default, mutate):
+    """Apply the callbacks of each node of `trie` to the matching key of
+    `target` and then recurse into its children. The nodes of keys that refer
+    to the same index of a ``list`` target, e.g. ``'0'`` and ``0``, are
+    merged first.
+    """
+    if isinstance(target, list):
+        trie = base_index_trie(trie, len(target))
+
+    for key, (callbacks, children) in iteritems(trie):
+        if callbacks:
+            value = get_item(target, key, default=None)
+
+            for _, callback in callbacks:
+                value = callback(value)
+
+            set_item(target, key, value)
+
+        if children:
+            base_update_trie(base_path_child(target, key, default, mutate),
+                             children,
+                             default,
+                             mutate)
+
+
+def base_index_trie(trie, size):
+    """Return `trie` of :func:`update_many` with the nodes of the keys that
+    refer to the same index of a ``list`` of `size` items merged. Negative
+    indexes within the list are counted from its end.
+    """
+    merged = OrderedDict()
+
+    for key, node in iteritems(trie):
+        index = base_path_index(key)
+
+        if index is not None:
+            key = index + size if -size <= index < 0 else index
+
+        if key in merged:
+            node = base_merge_trie_node(merged[key], node)
+
+        merged[key] = node
+
+    return merged
+
+
+def base_merge_trie_node(node, other):
+    """Return a node of :func:`update_many` with the callbacks, in the order
+    they were given, and the children of both `node` and `other`.
+    """
+    callbacks = sorted(node[0] + other[0], key=lambda item: item[0])
+    children = OrderedDict(node[1])
+
+    for key, child in iteritems(other[1]):
+        if key in children:
+            child = base_merge_trie_node(children[key], child)
+
+        children[key] = child
+
+    return (callbacks, children)
+
+
+def base_clone_value(value):
+    """Return a deep copy of `value` unless it's of an immutable scalar type.
+    """
+    if value is None or isinstance(value, IMMUTABLE_TYPES):
+        return value
+
+    return base_clone_deep(value)
+
+
+def base_has_item(obj, key):
+    """Return whether `key` can be retrieved from `obj` using
+    :func:`pydash.helpers.get_item`.
+    """
+    try:
+        get_item(obj, key)
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return False
+    else:
+        return True
+
+
+def base_merge(obj, source, callback, copier, override):
+    """Iteratively merge `source` into `obj` passing each value inserted into
+    `obj` through `copier`. Existing keys of `obj` are only replaced when
+    `override` is ``True``. Each pair of nested objects is only merged once
+    so cyclic references don't cause infinite merging.
+    """
+    stack = [(obj, source)]
+    merged = set()
+
+    while stack:
+        obj, source = stack.pop()
+
+        for key, src_value in iterator(source):
+            obj_value = get_item(obj, key, default=None)
+
+            if callback:
+                result = callback(obj_value, copier(src_value))
+            elif ((isinstance(src_value, list) and
+                   isinstance(obj_value, list)) or
+                  (isinstance(src_value, dict) and
+                   isinstance(obj_value, dict))):
+                pair = (id(obj_value), id(src_value))
+
+                if pair not in merged:
+                    merged.add(pair)
+                    stack.append((obj_value, src_value))
+
+                continue
+            elif override or (obj_value is None and
+                              not base_has_item(obj, key)):
+                result = copier(src_value)
+            else:
+                continue
+
+            set_item(obj, key, result, allow_override=override)
+
+
+def base_get_segment(obj, key, index, default, attributes=True):
+    """Return value of `obj` at the path segment planned by
+    :func:`base_path_segment` or `default` if it doesn't exist. If `index`
+    is ``NoValue``, it's computed from `key` only when needed. Attributes of
+    objects that don't support item access are only returned when
+    `attributes` is ``True``.
+    """
+    obj_type = type(obj)
+
+    if obj_type is dict:
+        try:
+            return obj.get(key, default)
+        except TypeError:
+            # Unhashable key.
+            return default
+    elif obj_type is list or obj_type is tuple:
+        if index is NoValue:
+            index = base_path_index(key)
+
+        if index is None or not -len(obj) <= index < len(obj):
+            return default
+        return obj[index]
+
+    try:
+        return get_item(obj, key)
+    except (KeyError, IndexError, TypeError, AttributeError):
+        pass
+
+    if (attributes and
+            pyd.is_string(key) and
+            not hasattr(obj, '__getitem__')):
+        return getattr(obj, key, default)
+
+    return default
+
+
+def base_get_trie(obj, trie, results):
+    """Set each position of `results` listed in `trie` to the value of `obj`
+    at that node's path.
+    """
+    for (key, index), (positions, children) in iteritems(trie):
+        value = base_get_segment(obj, key, index, NoValue)
+
+        if value is NoValue:
+            continue
+
+        for position in positions:
+            results[position] = value
+
+        if children:
+            base_get_trie(value, children, results)
+
+
+def base_path_index(key):
+    """Return integer value of `key` if it can be used as a sequence index;
+    otherwise, return ``None``.
+    """
+    if isinstance(key, integer_types) and not isinstance(key, bool):
+        return key
+    elif pyd.is_string(key) and key.isdigit():
+        return int(key)
+
+    try:
+        return int(key)
+    except (TypeError, ValueError):
+        return None
+
+
+def base_path_segment(key):
+    """Return a path segment plan of `key` which is `key` and its integer
+    value if it can be used as a sequence index.
+    """
+    return (key, base_path_index(key))
+
+
+def base_path_trie(paths):
+    """Return a trie of the segments of the ``(position, path)`` pairs in
+    `paths` as used by :func:`base_get_trie` and the positions of the paths
+    that refer to the root object.
+    """
+    trie = OrderedDict()
+    roots = []
+
+    for position, path in paths:
+        children = trie
+        node = None
+
+        for segment in CompiledPath(path).plan:
+            node = children.setdefault(segment, ([], OrderedDict()))
+            children = node[1]
+
+        if node is None:
+            roots.append(position)
+        else:
+            node[0].append(position)
+
+    return trie, roots
+
+
+def base_walk(obj, preorder, max_depth, prune, once=False):
+    """Iteratively traverse `obj` yielding ``(path, value, parent, key)`` for
+    each value. Replacing a yielded value in ``parent`` doesn't affect which
+    values are traversed. Objects that are already being traversed further up
+    the current path are yielded but not traversed again so that cyclic
+    references terminate. If `once` is ``True``, objects referenced more than
+    once are only traversed the first time they're reached.
+    """
+    active = set()
+
+    def expand(path, value):
+        # pylint: disable=missing-docstring
+        if (not isinstance(value, (list, dict)) or
+                id(value) in active or
+                (max_depth is not None and len(path) >= max_depth) or
+                (prune is not None and prune(value, path))):
+            return None
+
+        active.add(id(value))
+
+        return iterator(value)
+
+    if preorder:
+        yield (), obj, None, None
+
+    stack = [((), obj, None, None, expand((), obj))]
+
+    while stack:
+        path, value, parent, key, children = stack[-1]
+        child = next(children, NoValue) if children is not None else NoValue
+
+        if child is NoValue:
+            stack.pop()
+
+            if children is not None and not once:
+                active.discard(id(value))
+
+            if not preorder:
+                yield path, value, parent, key
+
+            continue
+
+        child_key, child_value = child
+        child_path = path + (child_key,)
+
+        if preorder:
+            yield child_path, child_value, value, child_key
+
+        stack.append((child_path,
+                      child_value,
+                      value,
+                      child_key,
+                      expand(child_path, child_value)))
+
+
+def base_escape_pointer(key):
+    """Escape `key` for use as a JSON Pointer reference token."""
+    return text_type(key).replace('~', '~0').replace('/', '~1')
+
+
+def base_patch_op(op, path, value=NoValue):
+    """Return JSON Patch operation dict."""
+    operation = {'op': op, 'path': path}
+
+    if value is not NoValue:
+        operation['value'] = value
+
+    return operation
+
+
+def base_pointer_key(target, key):
+    """Return JSON Pointer reference token `key` as an index if `target` is a
+    ``list``. If `target` is a ``dict`` without the key `key`, return its
+    existing non-string key whose string is `key` if there is one.
+    """
+    if isinstance(target, list):
+        return int(key)
+
+    if isinstance(target, dict) and key not in target:
+        for existing in target:
+            if not pyd.is_string(existing) and text_type(existing) == key:
+                return existing
+
+    return key
+
+
+def base_unescape_pointer(pointer):
+    """Parse JSON Pointer string into a list of unescaped keys."""
+    if not pointer:
+        return []
+
+    if not pointer.startswith('/'):
+        raise ValueError('Invalid JSON Pointer: {0}'.format(pointer))
+
+    return [key.replace('~1', '/').replace('~0', '~')
+            for key in pointer[1:].split('/')]
+
+
+def base_escape_flat_key(key, separator):
+    """Escape backslashes, `separator`, and ``[`` in a flattened path `key`.
+    """
+    key = key.replace('\\', '\\\\').replace('[', '\\[')
+
+    if separator:
+        key = key.replace(separator, '\\' + separator)
+
+    return key
+
+
+def base_flat_get(target, key):
+    """Return child of `target` at `key` or ``None`` if it doesn't exist."""
+    if isinstance(target, list):
+        if isinstance(key, int) and key < len(target):
+            return target[key]
+        return None
+
+    return target.get(key)
+
+
+def base_flat_set(target, key, value):
+    """Set `key` of `target` to `value` padding ``list`` objects with
+    ``None`` when `key` is past their end.
+    """
+    if isinstance(target, list):
+        if not isinstance(key, int):
+            raise TypeError('Cannot set key {0!r} of a list'.format(key))
+
+        if key >= len(target):
+            target.extend([None] * (key + 1 - len(target)))
+
+    target[key] = value
+
+
+def base_parse_flat_key(key, separator):
+    """Parse a flattened path `key` into a list of ``dict`` keys and ``list``
+    indexes. Unlike :func:`pydash.utilities.to_path`, empty keys between
+    separators are kept.
+    """
+    pattern = (r'\\(\\|{0}|\[)|\[(\d+)\]|({0})|'
+               r'((?:(?!{0})[^\\\[])+|[\\\[])').format(
+                   re.escape(separator) if separator else '(?!)')
+    keys = []
+    parts = []
+    # A separator ends the current key, which may be empty, unless it directly
+    # follows an index. An index only ends a non-empty key, so an empty key
+    # before an index is written with a trailing separator, e.g. "a..[0]".
+    after_index = False
+
+    for match in re.finditer(pattern, key, re.DOTALL):
+        escaped, index, sep, text = match.groups()
+
+        if index is not None:
+            if parts:
+                keys.append(''.join(parts))
+                parts = []
+
+            keys.append(int(index))
+            after_index = True
+        elif sep is not None:
+            if not after_index:
+                keys.append(''.join(parts))
+                parts = []
+
+            after_index = False
+        else:
+            parts.append(escaped if escaped is not None else text)
+            after_index = False
+
+    if not after_index:
+        keys.append(''.join(parts))
+
+    return keys
+
+
+def base_omit_keys(obj, trie):
+    """Return ``dict`` of the keys of `obj` excluding the paths in `trie`."""
+    result = {}
+
+    for key, value in iterator(obj):
+        node = trie.get(key, NoValue)
+
+        if node is NoValue:
+            result[key] = value
+        elif node is not None:
+            result[key] = base_omit_trie(value, node)
+
+    return result
+
+
+def base_omit_trie(source, trie):
+    """Return a shallow copy of `source` excluding the paths in `trie`."""
+    if isinstance(source, dict):
+        omitted = copy.copy(source)
+
+        for key, node in iteritems(trie):
+            if key not in omitted:
+                continue
+            elif node is None:
+                del omitted[key]
+            else:
+                omitted[key] = base_omit_trie(omitted[key], node)
+    elif isinstance(source, list):
+        omitted = list(source)
+        removals = set()
+
+        for key, node in iteritems(trie):
+            index = base_path_index(key)
+
+            if index is None or not -len(source) <= index < len(source):
+                continue
+            elif node is None:
+                removals.add(index % len(source))
+            else:
+                omitted[index] = base_omit_trie(omitted[index], node)
+
+        for index in sorted(removals, reverse=True):
+            del omitted[index]
+    else:
+        omitted = source
+
+    return omitted
+
+
+def base_pick_keys(obj, trie):
+    """Return ``dict`` of the keys of `obj` containing only the paths in
+    `trie`.
+    """
+    if isinstance(obj, dict):
+        items = ((key, obj[key]) for key in trie if key in obj)
+    else:
+        items = ((key, value) for key, value in iterator(obj) if key in trie)
+
+    result = {}
+
+    for key, value in items:
+        node = trie[key]
+
+        if node is None:
+            result[key] = value
+        else:
+            value = base_pick_trie(value, node)
+
+            if value:
+                result[key] = value
+
+    return result
+
+
+def base_pick_trie(source, trie):
+    """Return a new ``dict`` or ``list`` containing only the paths in `trie`
+    that exist in `source`.
+    """
+    picked = [] if isinstance(source, (list, tuple)) else {}
+
+    for key, node in iteritems(trie):
+        index = base_path_index(key)
+        value = base_get_segment(source, key, index, NoValue)
+
+        if value is NoValue:
+            continue
+
+        if node is not None:
+            value = base_pick_trie(value, node)
+
+            if not value:
+                continue
+
+        if isinstance(picked, list):
+            # The index exists in source, so negative indexes are counted from
+            # its end rather than from the end of the picked list.
+            base_flat_set(picked, index % len(source), value)
+        else:
+            picked[key] = value
+
+    return picked
+
+
+def base_property_trie(obj, *properties):
+    """Return a trie of the paths in `properties` where a key maps to ``None``
+    if its whole value is selected or to the trie of its selected nested
+    paths. Properties that are keys of `obj` are never treated as paths.
+    """
+    trie = {}
+    obj_keys = None
+
+    for prop in pyd.flatten_deep([prop for prop in properties
+                                  if prop is not None]):
+        keys = [prop]
+
+        if pyd.is_string(prop) and ('.' in prop or '[' in prop):
+            if obj_keys is None:
+                obj_keys = (obj if isinstance(obj, dict)
+                            else set(key for key, _ in iterator(obj)))
+
+            if prop not in obj_keys:
+                keys = to_path(prop)
+
+        node = trie
+
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+
+            if node is None:
+                break
+        else:
+            node[keys[-1]] = None
+
+    return trie
+
+
+def base_record_tries(records, properties):
+    """Yield each of `records` with its property trie as built by
+    :func:`base_property_trie`. The trie is only rebuilt for records that
+    have a top-level key which would otherwise be parsed as a path.
+    """
+    properties = [prop for prop in pyd.flatten_deep(properties)
+                  if prop is not None]
+    paths = [prop for prop in properties
+             if pyd.is_string(prop) and ('.' in prop or '[' in prop)]
+    trie = base_property_trie({}, properties)
+
+    for record in records:
+        if paths and (not isinstance(record, dict) or
+                      any(prop in record for prop in paths)):
+            yield record, base_property_trie(record, properties)
+        else:
+            yield record, trie
@@ -6,19 +6,31 @@
 
 from __future__ import absolute_import
 
+import codecs
 import datetime
-from itertools import islice
+from array import array
+from itertools import compress, count, islice, repeat
 import json
 import operator
 import re
 from types import BuiltinFunctionType
 
 import pydash as pyd
-from .helpers import iterator
+from .helpers import (
+    is_numpy_vector,
+    iterator,
+    NoValue,
+    numpy_vector
+)
 from ._compat import (
     builtins,
+    imap,
+    _range,
     integer_types,
+    iteritems,
+    itervalues,
     izip,
+    json_detect_encoding,
     number_types,
     string_types
 )
@@ -74,11 +86,162 @@ __all__ = (
     'is_string',
     'is_tuple',
     'is_zero',
+    'mask',
+    'monotone_violation',
 )
 
 
 RegExp = type(re.compile(''))
 
+# Size of the chunks read from file-like objects by is_json().
+JSON_CHUNK_SIZE = 64 * 1024
+
+# Matches a single JSON token and its leading whitespace capturing the first
+# character of a complete token, an incomplete token at the end of the string,
+# or neither for an invalid character. Numbers and literals are only complete
+# when they're followed by whitespace or punctuation.
+RE_JSON_TOKEN = re.compile(r'''[ \t\n\r]*(?:
+    (?=(.))(?:
+        "(?:[^"\\\x00-\x1f]|\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4}))*"
+        |(?:-?Infinity|NaN|true|false|null
+            |-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?
+        )(?=[ \t\n\r,:\]}])
+        |[{}\[\]:,]
+    )
+    |(
+        "(?:[^"\\\x00-\x1f]|\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4}))*
+            (?:\\(?:u[0-9a-fA-F]{0,3})?)?
+        |[-+.0-9eE]+
+        |-?[a-zA-Z]+
+    )\Z
+    |[^ \t\n\r]
+)''', re.VERBOSE)
+
+# Characters that a JSON document may start and end with.
+JSON_FIRST_CHARS = frozenset('{["-0123456789tfnNI')
+JSON_LAST_CHARS = frozenset('}]"0123456789elNy')
+JSON_WHITESPACE = ' \t\n\r'
+
+# Number of elements of a NumPy array compared at once by monotone_violation().
+MONOTONE_CHUNK_SIZE = 64 * 1024
+
+# Comparisons that monotone_violation() applies to NumPy arrays elementwise.
+# Other callbacks may not be elementwise or may behave differently for NumPy
+# scalars, e.g. by wrapping around for unsigned integers, so they are called
+# per pair of elements instead.
+MONOTONE_OPERATORS = frozenset([operator.lt, operator.le, operator.gt,
+                                operator.ge, operator.eq, operator.ne])
+
+# Translation tables between the flag bytes of a mask, which are 0 or 1, and
+# the binary digits of its bits.
+MASK_DIGITS = bytes(bytearray([48, 49]) + bytearray(_range(2, 256)))
+MASK_FLAGS = bytes(bytearray(_range(48)) + bytearray([0, 1]) +
+                   bytearray(_range(50, 256)))
+
+
+class Mask(object):
+    """Compact boolean mask over the elements of a collection as created by
+    :func:`mask`. The mask is stored as the bits of an integer where bit ``i``
+    is set if element ``i`` matched. Masks of the same size can be combined
+    with ``&``, ``|``, ``^`` and ``~`` without iterating over the elements.
+
+    Args:
+        bits (int, optional): Bits of the mask. Defaults to ``0``.
+        size (int, optional): Number of elements covered by the mask.
+            Defaults to ``0``.
+    """
+    __slots__ = ('bits', 'size')
+
+    def __init__(self, bits=0, size=0):
+        self.bits = bits
+        self.size = size
+
+    @classmethod
+    def from_flags(cls, flags):
+        """Create a mask from an iterable of truthy or falsey flags."""
+        flags = bytearray(map(bool, flags))
+        size = len(flags)
+        flags.reverse()
+        bits = int(bytes(flags.translate(MASK_DIGITS)), 2) if size else 0
+        return cls(bits, size)
+
+    def flags(self):
+        """Return a ``bytearray`` containing a ``0`` or ``1`` for each element
+        covered by the mask.
+        """
+        if not self.size:
+            return bytearray()
+
+        digits = bytearray(format(self.bits, '0{0}b'.format(self.size)),
+                           'ascii')
+        digits.reverse()
+        return digits.translate(MASK_FLAGS)
+
+    def count(self):
+        """Return the number of set elements."""
+        return bin(self.bits).count('1')
+
+    def indexes(self):
+        """Return the indexes of the set elements."""
+        return list(compress(_range(self.size), self.flags()))
+
+    def select(self, collection):
+        """Return the elements of `collection` that are set in the mask."""
+        if isinstance(collection, dict):
+            collection = itervalues(collection)
+
+        return list(compress(collection, self.flags()))
+
+    def _bits_of(self, other):
+        if not isinstance(other, Mask):
+            raise TypeError('masks can only be combined with masks')
+
+        if other.size != self.size:
+            raise ValueError('masks must be the same size')
+
+        return other.bits
+
+    def __and__(self, other):
+        return Mask(self.bits & self._bits_of(other), self.size)
+
+    def __or__(self, other):
+        return Mask(self.bits | self._bits_of(other), self.size)
+
+    def __xor__(self, other):
+        return Mask(self.bits ^ self._bits_of(other), self.size)
+
+    def __invert__(self):
+        return Mask(~self.bits & ((1 << self.size) - 1), self.size)
+
+    def __eq__(self, other):
+        return (isinstance(other, Mask) and
+                self.bits == other.bits and
+                self.size == other.size)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.bits, self.size))
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return iter(map(bool, self.flags()))
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.size
+
+        if not 0 <= index < self.size:
+            raise IndexError('mask index out of range')
+
+        return bool(self.bits >> index & 1)
+
+    def __repr__(self):
+        return 'Mask({0})'.format(list(self))
+
 
 def eq(value, other):
     """Checks if :attr:`value` is equal to :attr:`other`.
@@ -535,33 +698,26 @@ def is_equal_with(value, other, callback):
         >>> is_equal_with('a', 'A', lambda a, b: a.lower() == b.lower())
         True
 
+    Note:
+        Without a callback, the values are compared with ``==``. With a
+        callback, nested ``list`` and ``dict`` objects are compared
+        iteratively: identical objects are equal without calling the callback
+        on their nested values and objects with different lengths or keys are
+        unequal without calling the callback on their nested values. Deeply
+        nested and cyclic objects can be compared. Cyclic objects are equal if
+        their structures can't be told apart.
+
     .. versionadded:: TODO
     """
-    # If callback provided, use it for comparision.
-    equal = callback(value, other) if callable(callback) else None
-
-    # Return callback results if anything but None.
-    if equal is not None:
-        pass
-    elif (callable(callback) and
-          type(value) is type(other) and
-          isinstance(value, (list, dict)) and
-          isinstance(other, (list, dict)) and
-          len(value) == len(other)):
-        # Walk a/b to determine equality using callback.
-        for key, value in iterator(value):
-            if pyd.has(other, key):
-                equal = is_equal_with(value, other[key], callback)
-            else:
-                equal = False
-
-            if not equal:
-                break
-    else:
-        # Use basic == comparision.
-        equal = value == other
+    if not callable(callback):
+        try:
+            return value == other
+        except RuntimeError:
+            # Nesting is too deep or cyclic for the recursive comparison of
+            # builtin containers so compare them iteratively instead.
+            callback = None
 
-    return equal
+    return base_is_equal(value, other, callback)
 
 
 def is_error(value):
@@ -797,7 +953,7 @@ def is_iterable(value):
 
 
 def is_json(value):
-    """Checks if `value` is a valid JSON string.
+    """Checks if `value` is a valid JSON string, ``bytes`` or file-like object.
 
     Args:
         value (mixed): Value to check.
@@ -815,9 +971,37 @@ def is_json(value):
         False
         >>> is_json('{"hello": 1, "world": 2}')
         True
+        >>> is_json('{"hello": 1,}')
+        False
+
+    Note:
+        Strings that can't start or end a JSON document are rejected without
+        being decoded. Other strings and ``bytes`` are decoded with
+        ``json.loads``. File-like objects are read in chunks and their syntax
+        is checked without decoding them into Python objects so that large
+        documents are checked in constant memory.
 
     .. versionadded:: 2.0.0
+
+    .. versionchanged:: TODO
+        Reject strings by their first and last characters before decoding
+        them and support file-like objects.
     """
+    if pyd.is_string(value):
+        if not base_json_bounds(value):
+            return False
+    elif not isinstance(value, (bytes, bytearray)):
+        if not callable(getattr(value, 'read', None)):
+            return False
+
+        chunks = base_read_chunks(value, JSON_CHUNK_SIZE)
+
+        try:
+            return base_scan_json(base_json_tokens(base_decode_json(chunks)))
+        except ValueError:
+            # The bytes can't be decoded.
+            return False
+
     try:
         json.loads(value)
         return True
@@ -880,34 +1064,45 @@ def is_match(obj, source, callback=None):
     .. versionchanged:: 3.2.0
         Don't compare `obj` and `source` using ``type``. Use ``isinstance``
         exclusively.
+
+    .. versionchanged:: TODO
+        Compare nested objects iteratively and only once per pair of objects
+        so that deeply nested and cyclic objects can be matched.
     """
-    # If callback provided, use it for comparision.
-    equal = callback(obj, source) if callable(callback) else None
-
-    # Return callback results if anything but None.
-    if equal is not None:
-        pass
-    elif (isinstance(obj, dict) and isinstance(source, dict) or
-          isinstance(obj, list) and isinstance(source, list) or
-          isinstance(obj, tuple) and isinstance(source, tuple)):
-        # Set equal to True if source is empty, otherwise, False and then allow
-        # deep comparison to determine equality.
-        equal = not source
-
-        # Walk a/b to determine equality.
-        for key, value in iterator(source):
-            try:
-                equal = is_match(obj[key], value, callback)
-            except Exception:  # pylint: disable=broad-except
-                equal = False
+    stack = [(obj, source)]
+    matched = set()
+
+    while stack:
+        obj, source = stack.pop()
+
+        # If callback provided, use it for comparision.
+        equal = callback(obj, source) if callable(callback) else None
 
+        # Return callback results if anything but None.
+        if equal is not None:
             if not equal:
-                break
-    else:
-        # Use basic == comparision.
-        equal = obj == source
+                return equal
+        elif (isinstance(obj, dict) and isinstance(source, dict) or
+              isinstance(obj, list) and isinstance(source, list) or
+              isinstance(obj, tuple) and isinstance(source, tuple)):
+            pair = (id(obj), id(source))
+
+            if pair in matched:
+                continue
+
+            matched.add(pair)
 
-    return equal
+            # Walk a/b to determine equality.
+            for key, value in iterator(source):
+                try:
+                    stack.append((obj[key], value))
+                except Exception:  # pylint: disable=broad-except
+                    return False
+        elif not obj == source:
+            # Use basic == comparision.
+            return False
+
+    return True
 
 
 def is_monotone(value, op):
@@ -927,15 +1122,16 @@ def is_monotone(value, op):
         >>> is_monotone([1, 1, 2, 3], operator.lt)
         False
 
-    .. versionadded:: 2.0.0
-    """
-    if not is_list(value):
-        value = [value]
+    See Also:
+        - :func:`monotone_violation`
 
-    search = (False for x, y in izip(value, islice(value, 1, None))
-              if not op(x, y))
+    .. versionadded:: 2.0.0
 
-    return next(search, True)
+    .. versionchanged:: TODO
+        Support ``array.array``, ``memoryview`` and NumPy array values and
+        compare their elements in chunks.
+    """
+    return monotone_violation(value, op) is None
 
 
 def is_nan(value):
@@ -1267,3 +1463,399 @@ def is_zero(value):
     .. versionadded:: 2.0.0
     """
     return value is 0
+
+
+def mask(collection, predicate=None, *args):
+    """Evaluates `predicate` for each element of `collection` and returns a
+    compact :class:`Mask` of the results that can be combined with other
+    masks using ``&``, ``|``, ``^`` and ``~`` and used to select elements.
+    The predicate is invoked with the element followed by `args`. The
+    comparison predicates :func:`eq`, :func:`gt`, :func:`gte`, :func:`lt` and
+    :func:`lte` as well as :func:`in_range`, :func:`is_boolean`,
+    :func:`is_empty`, :func:`is_nan` and :func:`is_number` are evaluated
+    without a Python function call per element.
+
+    Args:
+        collection (list|dict): Collection to evaluate.
+        predicate (mixed, optional): Predicate applied to each element.
+        args (mixed): Additional arguments passed to `predicate`.
+
+    Returns:
+        Mask: Mask of the elements `predicate` returned truthy for.
+
+    Example:
+
+        >>> list(mask([1, 5, 'a', 10, None], is_number))
+        [True, True, False, True, False]
+        >>> values = [1, 5, 8, 10, 12]
+        >>> selected = mask(values, gt, 4) & ~mask(values, in_range, 9, 11)
+        >>> selected.select(values)
+        [5, 8, 12]
+        >>> selected.indexes()
+        [1, 2, 4]
+
+    .. versionadded:: TODO
+    """
+    if isinstance(collection, dict):
+        values = list(itervalues(collection))
+    else:
+        values = list(collection)
+
+    result = base_mask(values, predicate, args)
+
+    if result is None:
+        callback = pyd.iteratee(predicate)
+        result = Mask.from_flags(map(callback, values,
+                                     *[repeat(arg) for arg in args]))
+
+    return result
+
+
+def monotone_violation(value, op):
+    """Returns the index of the first element of `value` that violates the
+    monotonicity of `value` when `op` is used for comparison, i.e., the first
+    index ``i`` for which ``op(value[i - 1], value[i])`` is falsey, or
+    ``None`` if `value` is monotone. The search stops at the first violation.
+    Lists, ``array.array`` and one-dimensional ``memoryview`` objects are
+    compared without a Python loop. When `op` is one of the comparison
+    functions of the :mod:`operator` module, NumPy arrays are compared in
+    chunks of elements at once and, when NumPy is installed, ``array.array``
+    and ``memoryview`` objects are compared as NumPy arrays sharing their
+    buffer.
+
+    Args:
+        value (list): Value to check.
+        op (function): Operation to used for comparison.
+
+    Returns:
+        int: Index of the first violating element or ``None``.
+
+    Example:
+
+        >>> monotone_violation([1, 2, 4, 3, 5], operator.le)
+        3
+        >>> monotone_violation([1, 1, 2, 3], operator.lt)
+        1
+        >>> monotone_violation(array('i', [1, 1, 2, 3]), operator.le) is None
+        True
+
+    .. versionadded:: TODO
+    """
+    if isinstance(value, memoryview):
+        is_sequence = value.ndim == 1
+    else:
+        is_sequence = (is_list(value) or isinstance(value, array) or
+                       is_numpy_vector(value))
+
+    if not is_sequence:
+        value = [value]
+
+    vector = numpy_vector(value) if op in MONOTONE_OPERATORS else None
+
+    if vector is not None:
+        index = base_monotone_array(vector, op)
+
+        if index is not NoValue:
+            return index
+
+    flags = imap(op, value, islice(value, 1, None))
+
+    return next(compress(count(1), imap(operator.not_, flags)), None)
+
+
+#
+# Helper functions not a part of main API
+#
+
+
+def base_is_equal(value, other, callback):
+    """Iteratively compare `value` and `other` using `callback` to compare
+    each pair of nested values first. Identical values are equal without
+    being traversed and nested ``list`` and ``dict`` objects are checked for
+    matching lengths and keys before their values are compared. Each pair of
+    nested ``list`` or ``dict`` objects is only compared once.
+    """
+    stack = [(value, other)]
+    compared = set()
+
+    while stack:
+        value, other = stack.pop()
+
+        if callback:
+            # Use callback results if anything but None.
+            equal = callback(value, other)
+
+            if equal is not None:
+                if not equal:
+                    return False
+                continue
+
+        if value is other:
+            continue
+
+        value_type = type(value)
+
+        if (value_type is not type(other) or
+                not isinstance(value, (list, dict))):
+            # Use basic == comparision.
+            if not value == other:
+                return False
+            continue
+
+        if len(value) != len(other):
+            return False
+
+        pair = (id(value), id(other))
+
+        if pair in compared:
+            continue
+
+        compared.add(pair)
+
+        if isinstance(value, dict):
+            for key, item in iteritems(value):
+                other_item = other.get(key, NoValue)
+
+                if other_item is NoValue:
+                    return False
+
+                stack.append((item, other_item))
+        else:
+            stack.extend(izip(value, other))
+
+    return True
+
+
+def base_decode_json(chunks):
+    """Yield `chunks` as text decoding ``bytes`` chunks incrementally with
+    the encoding that ``json.loads`` would use.
+
+    Raises:
+        ValueError: If the bytes can't be decoded.
+    """
+    decoder = None
+    head = None
+
+    for chunk in chunks:
+        if pyd.is_string(chunk):
+            yield chunk
+            continue
+
+        if decoder is None:
+            # The encoding is detected from the first four bytes.
+            head = chunk if head is None else head + chunk
+
+            if len(head) < 4:
+                continue
+
+            encoding = json_detect_encoding(bytes(head[:4]))
+            decoder = codecs.getincrementaldecoder(encoding)('surrogatepass')
+            chunk, head = head, None
+
+        yield decoder.decode(chunk)
+
+    if head is not None:
+        # There are fewer than four bytes in total.
+        yield bytes(head).decode(json_detect_encoding(bytes(head)),
+                                 'surrogatepass')
+    elif decoder is not None:
+        yield decoder.decode(b'', True)
+
+
+def base_json_bounds(value):
+    """Return whether the first and last non-whitespace characters of `value`
+    can start and end a JSON document.
+    """
+    start = 0
+    end = len(value) - 1
+
+    while start <= end and value[start] in JSON_WHITESPACE:
+        start += 1
+
+    while end > start and value[end] in JSON_WHITESPACE:
+        end -= 1
+
+    return (start <= end and
+            value[start] in JSON_FIRST_CHARS and
+            value[end] in JSON_LAST_CHARS)
+
+
+def base_json_tokens(chunks):
+    """Yield a list of the first characters of the JSON tokens in each of the
+    text `chunks`. An invalid token is yielded as an empty string. Tokens
+    that are split across chunks are yielded with the later chunk.
+    """
+    chunks = iter(chunks)
+    chunk = next(chunks, None)
+    partial = ''
+
+    while chunk is not None:
+        following = next(chunks, None)
+        buffer = partial + chunk
+
+        if following is None:
+            # Terminate a number or literal at the end of the last chunk.
+            buffer += ' '
+
+        tokens = RE_JSON_TOKEN.findall(buffer)
+        partial = tokens.pop()[1] if tokens and tokens[-1][1] else ''
+
+        yield [first for first, _ in tokens]
+
+        chunk = following
+
+    if partial:
+        yield ['']
+
+
+def base_read_chunks(stream, size):
+    """Yield chunks of `size` read from the file-like object `stream` until
+    it's exhausted.
+    """
+    while True:
+        chunk = stream.read(size)
+
+        if not chunk:
+            break
+
+        yield chunk
+
+
+def base_scan_json(token_lists):
+    """Return whether the tokens yielded by :func:`base_json_tokens` form a
+    single JSON value.
+    """
+    # Closing characters of the containers that are currently open.
+    stack = []
+    # Kind of token expected next: a value, a value or the end of an empty
+    # array, a key, a key or the end of an empty object, a colon or the end
+    # of a value.
+    expected = 'value'
+
+    for tokens in token_lists:
+        for token in tokens:
+            if not token:
+                return False
+            elif expected == 'end':
+                if not stack:
+                    return False
+                elif token == ',':
+                    expected = 'key' if stack[-1] == '}' else 'value'
+                elif token == stack[-1]:
+                    stack.pop()
+                else:
+                    return False
+            elif expected == 'value' or expected == 'value_or_close':
+                if token == '{':
+                    stack.append('}')
+                    expected = 'key_or_close'
+                elif token == '[':
+                    stack.append(']')
+                    expected = 'value_or_close'
+                elif token == ']' and expected == 'value_or_close':
+                    stack.pop()
+                    expected = 'end'
+                elif token in ',:]}':
+                    return False
+                else:
+                    expected = 'end'
+            elif expected == 'key' or expected == 'key_or_close':
+                if token == '"':
+                    expected = 'colon'
+                elif token == '}' and expected == 'key_or_close':
+                    stack.pop()
+                    expected = 'end'
+                else:
+                    return False
+            elif token == ':':
+                expected = 'value'
+            else:
+                return False
+
+    return expected == 'end' and not stack
+
+
+def base_monotone_array(value, op):
+    """Return the index of the first element of the NumPy array `value` that
+    violates `op` by comparing its elements in chunks of
+    :data:`MONOTONE_CHUNK_SIZE` or ``NoValue`` if `op` doesn't compare arrays
+    elementwise.
+    """
+    size = len(value)
+
+    for start in _range(0, size - 1, MONOTONE_CHUNK_SIZE):
+        stop = min(start + MONOTONE_CHUNK_SIZE, size - 1)
+
+        try:
+            flags = op(value[start:stop], value[start + 1:stop + 1])
+        except (TypeError, ValueError):
+            return NoValue
+
+        if getattr(flags, 'shape', None) != (stop - start,):
+            return NoValue
+
+        if not flags.all():
+            return start + int(flags.argmin()) + 1
+
+    return None
+
+
+def base_mask(values, predicate, args):
+    """Return the :class:`Mask` of `predicate` over `values` using builtin
+    functions for the predicates that support it or ``None`` otherwise.
+    """
+    if predicate in (eq, gt, gte, lt, lte):
+        if len(args) != 1:
+            return None
+
+        operation = (operator.is_ if predicate is eq else
+                     operator.gt if predicate is gt else
+                     operator.ge if predicate is gte else
+                     operator.lt if predicate is lt else
+                     operator.le)
+
+        return Mask.from_flags(map(operation, values, repeat(args[0])))
+    elif predicate is in_range:
+        return base_mask_in_range(values, *args)
+    elif args:
+        return None
+    elif predicate is is_boolean:
+        return Mask.from_flags(map(isinstance, values, repeat(bool)))
+    elif predicate is is_number:
+        return base_mask_numbers(values)
+    elif predicate is is_nan:
+        return ~base_mask_numbers(values)
+    elif predicate is is_empty:
+        return (base_mask(values, is_boolean, ()) |
+                base_mask_numbers(values) |
+                Mask.from_flags(map(operator.not_, values)))
+
+    return None
+
+
+def base_mask_in_range(values, start=0, end=None):
+    """Return the :class:`Mask` of :func:`in_range` over `values` or ``None``
+    if not all values are numbers.
+    """
+    # Other values may not be comparable with the range so only compare when
+    # all values are numbers.
+    if base_mask_numbers(values).count() != len(values):
+        return None
+
+    if not is_number(start):
+        start = 0
+
+    if end is None:
+        end = start
+        start = 0
+    elif not is_number(end):
+        end = 0
+
+    return (Mask.from_flags(map(operator.le, repeat(start), values)) &
+            Mask.from_flags(map(operator.lt, values, repeat(end))))
+
+
+def base_mask_numbers(values):
+    """Return the :class:`Mask` of :func:`is_number` over `values`."""
+    return (Mask.from_flags(map(isinstance, values, repeat(number_types))) &
+            ~Mask.from_flags(map(isinstance, values, repeat(bool))))
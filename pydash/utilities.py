@@ -6,14 +6,23 @@
 
 from __future__ import absolute_import, division
 
+import binascii
+import hashlib
 import re
 import math
+import numbers
 from datetime import datetime
 from random import uniform, randint
 
 import pydash as pyd
 from .helpers import callit, getargcount, get_item, NoValue
-from ._compat import _range, string_types
+from ._compat import (
+    PY3,
+    _range,
+    iteritems,
+    string_types,
+    text_type
+)
 
 
 __all__ = (
@@ -24,6 +33,8 @@ __all__ = (
     'deep_property',
     'deep_prop',
     'default_to',
+    'freeze_deep',
+    'hash_deep',
     'identity',
     'iteratee',
     'matches',
@@ -67,6 +78,45 @@ RE_PATH_LIST_INDEX = re.compile(r'^\[\d+\]$')
 ID_COUNTER = 0
 
 
+class FrozenDict(dict):
+    """Immutable and hashable ``dict`` as created by :func:`freeze_deep`. It
+    compares equal to a ``dict`` with the same items and its hash doesn't
+    depend on the order of its items.
+    """
+    __slots__ = ('_hash',)
+
+    def __init__(self, *args, **kargs):
+        if hasattr(self, '_hash'):
+            self._immutable()
+
+        dict.__init__(self, *args, **kargs)
+        self._hash = None
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(frozenset(iteritems(self)))
+        return self._hash
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def __repr__(self):
+        return '{0}({1})'.format(self.__class__.__name__, dict.__repr__(self))
+
+    def _immutable(self, *args, **kargs):
+        raise TypeError('{0} object is immutable'
+                        .format(self.__class__.__name__))
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __ior__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+
 def attempt(func, *args, **kargs):
     """Attempts to execute `func`, returning either the result or the caught
     error object.
@@ -206,6 +256,78 @@ def default_to(value, default_value):
     return default_value if value is None else value
 
 
+def freeze_deep(value):
+    """Return a hashable and immutable mirror of `value` by recursively
+    converting ``dict`` objects to :class:`FrozenDict`, ``list`` and ``tuple``
+    objects to ``tuple`` and ``set`` objects to ``frozenset``. All other values
+    are returned as is. Values that are equal before freezing are equal after
+    freezing.
+
+    Args:
+        value (mixed): Value to freeze.
+
+    Returns:
+        mixed: Frozen value.
+
+    Example:
+
+        >>> frozen = freeze_deep({'a': [1, {'b': {2}}]})
+        >>> frozen == {'a': (1, {'b': frozenset([2])})}
+        True
+        >>> frozen == freeze_deep({'a': [1, {'b': {2}}]})
+        True
+        >>> isinstance(hash(frozen), int)
+        True
+
+    Raises:
+        ValueError: If `value` contains a cyclic reference.
+
+    Note:
+        Since ``list`` and ``tuple`` objects are both frozen to ``tuple``, a
+        ``list`` and a ``tuple`` containing the same items are equal after
+        freezing.
+
+    .. versionadded:: TODO
+    """
+    return base_freeze_deep(value, False, set())
+
+
+def hash_deep(value):
+    """Return a structural hash of `value` such that values which are equal
+    have the same hash even if they contain unhashable ``dict``, ``list`` or
+    ``set`` objects. The hash is a SHA-1 digest of a canonical serialization
+    of `value`, so, unlike :func:`hash`, it's the same in every process for
+    values made of ``None``, numbers, strings, bytes, and containers of them.
+
+    Args:
+        value (mixed): Value to hash.
+
+    Returns:
+        int: Non-negative 64-bit hash of `value`.
+
+    Raises:
+        TypeError: If `value` contains an unhashable object that isn't a
+            ``dict``, ``list`` or ``set``.
+        ValueError: If `value` contains a cyclic reference.
+
+    Example:
+
+        >>> hash_deep({'a': [1, 2]}) == hash_deep({'a': [1, 2]})
+        True
+        >>> hash_deep({'a': 1, 'b': 2}) == hash_deep({'b': 2, 'a': 1})
+        True
+        >>> hash_deep([1, 'a'])
+        9150355265490466803
+
+    Note:
+        Other objects are serialized by their :func:`hash`, which may differ
+        between processes.
+
+    .. versionadded:: TODO
+    """
+    return int(binascii.hexlify(base_hash_digest(value, set())[:8]), 16)
+
+
 def identity(*args):
     """Return the first argument provided to it.
 
@@ -386,20 +508,32 @@ def memoize(func, resolver=None):
         >>> ident = memoize(identity)
         >>> ident(1)
         1
-        >>> ident.cache['(1,){}'] == 1
-        True
         >>> ident(1, 2, 3)
         1
-        >>> ident.cache['(1, 2, 3){}'] == 1
-        True
+        >>> len(ident.cache)
+        2
+        >>> ident(1.0)
+        1.0
+        >>> len(ident.cache)
+        3
 
     .. versionadded:: 1.0.0
+
+    .. versionchanged:: TODO
+        Use a frozen copy of the arguments that includes the type of each
+        value as the default cache key instead of their string representation.
+        Arguments that can't be hashed or are cyclic still use their string
+        representation.
     """
     def memoized(*args, **kargs):  # pylint: disable=missing-docstring
         if resolver:
             key = resolver(*args, **kargs)
         else:
-            key = '{0}{1}'.format(args, kargs)
+            try:
+                key = base_freeze_deep((args, kargs), True, set())
+                hash(key)
+            except (TypeError, ValueError):
+                key = '{0}{1}'.format(args, kargs)
 
         if key not in memoized.cache:
             memoized.cache[key] = func(*args, **kargs)
@@ -933,11 +1067,124 @@ def unique_id(prefix=None):
 
 def unescape_path_key(key):
     """Unescape path key."""
+    if '\\' not in key:
+        return key
+
     key = pyd.js_replace(key, r'/\\\\/g', r'\\')
     key = pyd.js_replace(key, r'/\\\./g', '.')
     return key
 
 
+def base_freeze_deep(value, typed, ancestors):
+    """Return a hashable mirror of `value` as described by
+    :func:`freeze_deep`. If `typed` is ``True``, each value is paired with its
+    type so that equal values of different types, e.g. ``1`` and ``1.0`` or
+    ``[1]`` and ``(1,)``, aren't equal after freezing. `ancestors` is the set
+    of ids of the containers being frozen that contain `value`.
+    """
+    if isinstance(value, FrozenDict) and not typed:
+        return value
+    elif not isinstance(value, (dict, list, tuple, set, frozenset)):
+        return (type(value), value) if typed else value
+
+    if id(value) in ancestors:
+        raise ValueError('Cannot freeze cyclic reference')
+
+    ancestors.add(id(value))
+
+    if isinstance(value, dict):
+        frozen = FrozenDict(
+            (base_freeze_deep(key, typed, ancestors) if typed else key,
+             base_freeze_deep(item, typed, ancestors))
+            for key, item in iteritems(value))
+    elif isinstance(value, (list, tuple)):
+        frozen = tuple(base_freeze_deep(item, typed, ancestors)
+                       for item in value)
+    else:
+        frozen = frozenset(base_freeze_deep(item, typed, ancestors)
+                           for item in value)
+
+    ancestors.discard(id(value))
+
+    return (type(value), frozen) if typed else frozen
+
+
+def base_hash_digest(value, ancestors):
+    """Return the SHA-1 digest of the canonical serialization of `value` used
+    by :func:`hash_deep`. Equal numbers are serialized the same regardless of
+    their type and the items of ``dict`` and ``set`` objects are serialized in
+    the order of their digests. `ancestors` is the set of ids of the
+    containers being hashed that contain `value`.
+    """
+    if not PY3 and isinstance(value, str):
+        try:
+            # Equal to the unicode string of the same ASCII characters.
+            value = value.decode('ascii')
+        except UnicodeDecodeError:
+            pass
+
+    if value is None:
+        data = b'n'
+    elif isinstance(value, text_type):
+        data = b's' + value.encode('utf-8')
+    elif isinstance(value, bytes):
+        data = b'b' + value
+    elif isinstance(value, numbers.Number):
+        data = base_number_bytes(value)
+    elif isinstance(value, (dict, list, tuple, set, frozenset)):
+        if id(value) in ancestors:
+            raise ValueError('Cannot hash cyclic reference')
+
+        ancestors.add(id(value))
+
+        if isinstance(value, dict):
+            data = b'd' + b''.join(sorted(
+                base_hash_digest(key, ancestors) +
+                base_hash_digest(item, ancestors)
+                for key, item in iteritems(value)))
+        elif isinstance(value, (list, tuple)):
+            data = b'l' + b''.join(base_hash_digest(item, ancestors)
+                                   for item in value)
+        else:
+            data = b'e' + b''.join(sorted(base_hash_digest(item, ancestors)
+                                          for item in value))
+
+        ancestors.discard(id(value))
+    else:
+        data = b'h' + str(hash(value)).encode('ascii')
+
+    return hashlib.sha1(data).digest()
+
+
+def base_number_bytes(value):
+    """Return the serialization of the number `value` used by
+    :func:`base_hash_digest`, which is the same for equal numbers of
+    different types, e.g. ``True``, ``1``, and ``1.0``.
+    """
+    if isinstance(value, complex):
+        if value.imag:
+            return b'c' + repr(value).encode('ascii')
+        value = value.real
+
+    try:
+        integer = int(value)
+    except (TypeError, ValueError, OverflowError):
+        integer = None
+
+    if integer is not None and integer == value:
+        return b'i' + str(integer).encode('ascii')
+
+    try:
+        real = float(value)
+    except (TypeError, ValueError, OverflowError):
+        real = None
+
+    if real is not None and (real == value or real != real):
+        return b'f' + repr(real).encode('ascii')
+
+    return b'h' + str(hash(value)).encode('ascii')
+
+
 def base_range(*args, **kargs):
     """Yield range values."""
     from_right = kargs.get('from_right', False)
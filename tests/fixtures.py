@@ -41,6 +41,23 @@ class IteritemsObject(object):
                 yield i, item
 
 
+class Unhashable(object):
+    __hash__ = None
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return (isinstance(other, Unhashable) and
+                self.value == other.value)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'Unhashable({0!r})'.format(self.value)
+
+
 def reduce_callback0(total, num):
     return total + num
 
@@ -91,3 +108,19 @@ def for_in_callback2(value, index, obj):
     else:
         obj[index] = True
         return False
+
+
+def parallel_square(value):
+    return value * value
+
+
+def parallel_raise_over(value, index):
+    if value > 5:
+        raise ValueError(index)
+    return value
+
+
+def parallel_add(total, value):
+    if total is None or value is None:
+        raise ValueError(total, value)
+    return total + value
@@ -4,6 +4,7 @@ import math
 import warnings
 
 import pydash as _
+from . import fixtures
 from .fixtures import parametrize
 
 
@@ -176,6 +177,22 @@ def test_flatten_deep(case, expected):
     assert _.flatten_deep(case) == expected
 
 
+def test_flatten_deep_nested():
+    array = [1]
+
+    for _i in range(5000):
+        array = [array, 2]
+
+    assert _.flatten_deep(array) == [1] + [2] * 5000
+
+
+def test_flatten_deep_cyclic():
+    array = [1, [2]]
+    array[1].append(array)
+
+    assert _.flatten_deep(array) == [1, 2, array]
+
+
 @parametrize('case,expected', [
     (([1, ['2222'], [3, [[4]]]],), [1, '2222', 3, [[4]]]),
     (([1, ['2222'], [3, [[4]]]], 1), [1, '2222', 3, [[4]]]),
@@ -548,11 +565,22 @@ def test_take_right_while(case, expected):
 @parametrize('case,expected', [
     ([1, 2, 1, 3, 1], [1, 2, 3]),
     ([dict(a=1), dict(a=2), dict(a=1)], [dict(a=1), dict(a=2)]),
+    ([[1, 2], (1, 2), [1, 2], set([1, 2]), set([1, 2])],
+     [[1, 2], (1, 2), set([1, 2])]),
+    ([fixtures.Unhashable(1), 1, fixtures.Unhashable(1), 2, 1],
+     [fixtures.Unhashable(1), 1, 2]),
 ])
 def test_uniq(case, expected):
     assert _.uniq(case) == expected
 
 
+def test_uniq_cyclic():
+    cyclic = [1]
+    cyclic.append(cyclic)
+
+    assert _.uniq([cyclic, 1, cyclic, [1], 1.0]) == [cyclic, 1, [1]]
+
+
 @parametrize('alias', [
     _.unique
 ])
@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import math
 
+import pytest
+
 import pydash as _
 
 from . import fixtures
@@ -17,6 +21,25 @@ def test_at(case, expected):
     assert _.at(*case) == expected
 
 
+@parametrize('case,kargs,expected', [
+    (([{'a': 1, 'b': {'c': 2}}, {'a': 3, 'b': {'c': 4}}], 'a', 'b.c'),
+     {},
+     {'a': [1, 3], 'b.c': [2, 4]}),
+    (({'x': {'a': [1, 2]}, 'y': {'a': [3]}}, 'a[0]', ['a', 1]),
+     {},
+     {'a[0]': [1, 3], ('a', 1): [2, None]}),
+    (([{'a': 1, 'b': 2.5}, {'a': 3, 'b': 4.5}], 'a', 'b'),
+     {'typecode': {'a': 'l'}},
+     {'a': array('l', [1, 3]), 'b': [2.5, 4.5]}),
+    (([{'a': 1, 'b': 2.5}, {'a': 3, 'b': 4.5}], 'a', 'b'),
+     {'typecode': 'd'},
+     {'a': array('d', [1.0, 3.0]), 'b': array('d', [2.5, 4.5])}),
+    (([], 'a'), {}, {'a': []}),
+])
+def test_columns(case, kargs, expected):
+    assert _.columns(*case, **kargs) == expected
+
+
 @parametrize('case,expected', [
     (([1, 2, 3], 1), True),
     (([1, 2, 3], 1, 2), False),
@@ -277,6 +300,20 @@ def test_pluck(case, filter_by, expected):
     assert _.pluck(case, filter_by) == expected
 
 
+@parametrize('case,expected', [
+    (([{'name': 'moe', 'age': 40}, {'name': 'larry', 'age': 50}],
+      'name',
+      'age'),
+     [('moe', 40), ('larry', 50)]),
+    (([{'a': {'b': [0, 1]}}, {'a': {'b': [2]}}, {}], 'a.b.0', 'a.b[1]'),
+     [(0, 1), (2, None), (None, None)]),
+    (({'x': [1, 2], 'y': [3, 4]}, 1, 0), [(2, 1), (4, 3)]),
+    (([{'a': 1}], ), [()]),
+])
+def test_pluck_many(case, expected):
+    assert _.pluck_many(*case) == expected
+
+
 @parametrize('case,expected', [
     (([1, 2, 3], None), 1),
     (([1, 2, 3], fixtures.reduce_callback0), 6),
@@ -623,6 +660,71 @@ def test_to_list(case, expected):
     assert set(_.to_list(case)) == set(expected)
 
 
+@parametrize('case,expected', [
+    (([1, 2, 3, 4], fixtures.parallel_add), 10),
+    (([1, 2, 3, 4], fixtures.parallel_add, 10), 20),
+    ((['a', 'b', 'c', 'd', 'e'], fixtures.parallel_add), 'abcde'),
+    ((['b', 'c'], fixtures.parallel_add, 'a'), 'abc'),
+    (({'a': 1}, fixtures.parallel_add), 1),
+    (([], fixtures.parallel_add, 5), 5),
+    (([[1], [2], [3]], fixtures.parallel_add), [1, 2, 3]),
+    (([set([1]), set([2, 1])], lambda total, x: total | x), set([1, 2])),
+    (([4, 1, 3],), 4),
+])
+def test_tree_reduce(case, expected):
+    assert _.tree_reduce(*case) == expected
+
+    for chunk_size in (1, 2, 3):
+        assert _.tree_reduce(*case, chunk_size=chunk_size) == expected
+
+
+def test_tree_reduce_process_executor():
+    items = [str(item) for item in range(200)]
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        for chunk_size in (None, 1, 7):
+            assert (_.tree_reduce(items, fixtures.parallel_add,
+                                  executor=executor,
+                                  chunk_size=chunk_size) ==
+                    ''.join(items))
+
+
+@parametrize('case,expected', [
+    ((array('i', range(100)), fixtures.parallel_add), sum(range(100))),
+    ((array('d', [0.5, 1.5, 2.5]), fixtures.parallel_add, 10), 14.5),
+    ((bytearray(b'abc'), fixtures.parallel_add), 294),
+    ((array('i'), fixtures.parallel_add, 5), 5),
+])
+def test_tree_reduce_process_executor_shared(monkeypatch, case, expected):
+    staged = []
+
+    class SharedBuffer(_.helpers.SharedBuffer):
+        def __init__(self, *args, **kargs):
+            staged.append(args[0])
+            super(SharedBuffer, self).__init__(*args, **kargs)
+
+    monkeypatch.setattr(_.collections, 'SharedBuffer', SharedBuffer)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        for chunk_size in (None, 1, 7):
+            assert _.tree_reduce(*case, executor=executor,
+                                 chunk_size=chunk_size) == expected
+
+    assert len(staged) == (3 if len(case[0]) else 0)
+
+
+def test_tree_reduce_empty():
+    with pytest.raises(TypeError):
+        _.tree_reduce([], fixtures.parallel_add)
+
+
+@parametrize('chunk_size', [None, 1, 4])
+def test_tree_reduce_exception(chunk_size):
+    with pytest.raises(ValueError):
+        _.tree_reduce([1, 2, None, 4, 5], fixtures.parallel_add,
+                      chunk_size=chunk_size)
+
+
 @parametrize('case,filter_by,expected,', [
     ([{'name': 'moe', 'age': 40}, {'name': 'larry', 'age': 50}],
      {'age': 40},
@@ -630,3 +732,170 @@ def test_to_list(case, expected):
 ])
 def test_where(case, filter_by, expected):
     assert _.where(case, filter_by) == expected
+
+
+@parametrize('case,expected', [
+    ((['a', 'b', 'c'], [0, 1, 0]), 'b'),
+    (([{'w': 0}, {'w': 0}, {'w': 2}], 'w'), {'w': 2}),
+    (({'a': 0, 'b': 3}, None), 3),
+    ((['a', 'b', 'c'], lambda item: item == 'c'), 'c'),
+])
+def test_sample_weighted(case, expected):
+    assert _.sample_weighted(*case) == expected
+
+
+@parametrize('collection,weights,n', [
+    (['a', 'b', 'c'], [1, 2, 3], 5),
+    (['a', 'b', 'c'], [1, 0, 1], 20),
+    ([1, 2, 3, 4], None, 0),
+])
+def test_sample_weighted_list(collection, weights, n):
+    sampled = _.sample_weighted(collection, weights, n)
+
+    assert isinstance(sampled, list)
+    assert len(sampled) == n
+    assert set(sampled).issubset(collection)
+
+    if weights:
+        zeros = [item for item, weight in zip(collection, weights)
+                 if not weight]
+        assert not set(sampled).intersection(zeros)
+
+
+def test_weighted_sampler_distribution():
+    sampler = _.WeightedSampler(['a', 'b', 'c', 'd'], [1, 2, 3, 4])
+    draws = 20000
+    counts = _.count_by(sampler(draws))
+
+    assert len(sampler) == 4
+
+    for item, weight in zip(['a', 'b', 'c', 'd'], [1, 2, 3, 4]):
+        assert abs(counts[item] / float(draws) - weight / 10.0) < 0.02
+
+
+@parametrize('collection,weights', [
+    ([1, 2, 3], [1, 2]),
+    ([1, 2, 3], [1, -1, 1]),
+    ([1, 2, 3], [0, 0, 0]),
+    ([], None),
+])
+def test_sample_weighted_invalid(collection, weights):
+    with pytest.raises(ValueError):
+        _.sample_weighted(collection, weights)
+
+
+@parametrize('func,args,expected', [
+    (_.map_, ([1, 2, 3, 4], fixtures.parallel_square), [1, 4, 9, 16]),
+    (_.map_, ({'a': 1, 'b': 2}, lambda value, key: key * value),
+     ['a', 'bb']),
+    (_.map_, ([{'a': 1}, {'a': 2}], 'a'), [1, 2]),
+    (_.map_, ([], None), []),
+    (_.filter_, (list(range(10)), lambda x: x % 3 == 0), [0, 3, 6, 9]),
+    (_.reject, (list(range(10)), lambda x: x % 3 == 0),
+     [1, 2, 4, 5, 7, 8]),
+    (_.partition, ([1, 2, 3, 4], lambda x: x >= 3), [[3, 4], [1, 2]]),
+    (_.flat_map, ([1, 2], lambda x: [x, x]), [1, 1, 2, 2]),
+    (_.group_by, ([1.3, 1.5, 2.1], math.floor), {1: [1.3, 1.5], 2: [2.1]}),
+])
+def test_executor(func, args, expected):
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        assert func(*(args + (executor,))) == expected
+        assert func(*args) == expected
+
+
+def test_invoke_executor():
+    items = [[1, 2], [2, 3], [3, 4]]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert _.invoke(items, 'pop', 0, executor=executor) == [1, 2, 3]
+
+    assert items == [[2], [3], [4]]
+
+
+def test_process_executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert (_.map_(list(range(100)), fixtures.parallel_square, executor) ==
+                [x * x for x in range(100)])
+        assert (_.pmap(list(range(100)), fixtures.parallel_square, executor,
+                       chunk_size=7) ==
+                [x * x for x in range(100)])
+
+
+@parametrize('func,args,expected', [
+    (_.map_, ([{'a': 1}, {'a': 2}] * 50, 'a'), [1, 2] * 50),
+    (_.map_, ([{'a': [1]}, {'a': [2]}] * 50, 'a.0'), [1, 2] * 50),
+    (_.filter_, ([{'a': 1}, {'a': 2}] * 50, {'a': 2}), [{'a': 2}] * 50),
+    (_.reject, ([{'a': 1}, {'a': 2}] * 50, ['a', 2]), [{'a': 1}] * 50),
+    (_.group_by, ([{'a': 1}, {'a': 2}] * 50, 'a'),
+     {1: [{'a': 1}] * 50, 2: [{'a': 2}] * 50}),
+    (_.invoke, (['a', 'b'] * 50, 'upper'), ['A', 'B'] * 50),
+])
+def test_process_executor_shorthand(func, args, expected):
+    # The collections are larger than the serially called probe so that
+    # chunks of them are sent to the workers.
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert func(*args, executor=executor) == expected
+
+
+def test_process_executor_unpicklable():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(Exception) as exc:
+            _.map_(list(range(100)), lambda x: x, executor)
+
+    assert 'pickle' in str(exc.value).lower()
+
+
+@parametrize('chunk_size', [None, 1, 3, 1000])
+def test_pmap(chunk_size):
+    items = list(range(500))
+    expected = [str(item) for item in items]
+
+    assert _.pmap(items, str, chunk_size=chunk_size) == expected
+
+
+@parametrize('chunk_size', [None, 1, 4])
+def test_pmap_exception_order(chunk_size):
+    items = list(range(10)) + list(range(10))
+
+    with pytest.raises(ValueError) as exc:
+        _.pmap(items, fixtures.parallel_raise_over, chunk_size=chunk_size)
+
+    assert exc.value.args == (6,)
+
+
+@parametrize('case,expected', [
+    (([1, 2, 3, 4], lambda x: x >= 3), [3, 4]),
+    (({'a': 1, 'b': 2}, lambda x: x > 1), [2]),
+    (([{'a': 1}, {'a': 0}], 'a'), [{'a': 1}]),
+])
+def test_pfilter(case, expected):
+    assert _.pfilter(*case) == expected
+    assert _.pfilter(*case, chunk_size=1) == expected
+
+
+@parametrize('case,expected', [
+    ((array('d', [0.5, 1.5, 2.5]), fixtures.parallel_square),
+     [0.25, 2.25, 6.25]),
+    ((array('i', range(50)), fixtures.parallel_square),
+     [x * x for x in range(50)]),
+    ((array('b', [-1, 2]), fixtures.parallel_square), [1, 4]),
+    ((bytearray(b'abc'), chr), ['a', 'b', 'c']),
+    ((array('l', [1, 2, 3]), bool), [True, True, True]),
+    ((array('d', [1.0, 2.0]), fixtures.parallel_raise_over), [1.0, 2.0]),
+])
+def test_process_executor_shared(case, expected):
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        for chunk_size in (None, 1, 2):
+            actual = _.pmap(*case, executor=executor, chunk_size=chunk_size)
+            assert actual == expected
+            assert [type(value) for value in actual] == \
+                [type(value) for value in expected]
+
+
+def test_process_executor_shared_exception():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(ValueError) as exc:
+            _.map_(array('d', range(20)), fixtures.parallel_raise_over,
+                   executor)
+
+    assert exc.value.args == (6,)
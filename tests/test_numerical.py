@@ -1,6 +1,13 @@
 # -*- coding: utf-8 -*-
 
+from array import array
+import bisect
+from concurrent.futures import ProcessPoolExecutor
+import math
+import random
+
 import pydash as _
+from . import fixtures
 from .fixtures import parametrize
 
 import pytest
@@ -17,6 +24,13 @@ def test_add(case, expected):
     assert _.add(*case) == expected
 
 
+def test_add_executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert _.add(array('d', [0.5] * 1000), None, executor) == 500.0
+        assert _.add(list(range(100)), fixtures.parallel_square,
+                     executor) == 328350
+
+
 @parametrize('case', [
     _.sum_
 ])
@@ -42,6 +56,16 @@ def test_average_aliases(case):
     assert _.average is case
 
 
+@parametrize('func,case,expected', [
+    (_.average, iter([1, 2, 3, 4]), 2.5),
+    (_.average, [0.1] * 10, 0.1),
+    (_.variance, iter([1, 18, 20, 4]), 69.6875),
+    (_.std_deviation, (x for x in [2, 4, 4, 4, 5, 5, 7, 9]), 2.0),
+])
+def test_statistics_iterable(func, case, expected):
+    assert func(case) == expected
+
+
 @parametrize('case,expected', [
     ((4.006,), 5),
     ((6.004, 2), 6.01),
@@ -111,11 +135,114 @@ def test_max_default(collection, default, expected):
     (([0, 0, 1, 2, 5],), 1),
     (([0, 0, 1, 2],), 0.5),
     (([0, 0, 1, 2, 3, 4],), 1.5),
+    (([5, 1, 3],), 3),
+    (([{'a': 5}, {'a': 1}, {'a': 3}], 'a'), 3),
+    (([3, 1, 2], lambda x: -x), -2),
+    ((iter([4, 1, 3, 2]),), 2.5),
+    (({'a': 4, 'b': 1, 'c': 3},), 3),
 ])
 def test_median(case, expected):
     assert _.median(*case) == expected
 
 
+@parametrize('case,expected', [
+    (([1, 2, 3, 4, 5], 0.5), 3),
+    (([1, 2, 3, 4, 5], 0), 1),
+    (([1, 2, 3, 4, 5], 1), 5),
+    (([1, 2, 3, 4], 0.25), 1.75),
+    (([4, 3, 2, 1], [0, 0.25, 0.5, 1]), [1, 1.75, 2.5, 4]),
+    (([7], (0.1, 0.9)), [7, 7]),
+    (([{'a': 2}, {'a': 1}], 0.5, 'a'), 1.5),
+])
+def test_quantile(case, expected):
+    assert _.quantile(*case) == expected
+
+
+@parametrize('case,expected', [
+    (([1, 2, 3, 4, 5], 50), 3),
+    (([1, 2, 3, 4], [25, 100]), [1.75, 4]),
+    (([{'a': 2}, {'a': 1}], 0, 'a'), 1),
+])
+def test_percentile(case, expected):
+    assert _.percentile(*case) == expected
+
+
+@parametrize('func,case', [
+    (_.median, ([],)),
+    (_.quantile, ([], 0.5)),
+    (_.quantile, ([1, 2], 1.5)),
+    (_.quantile, ([1, 2], [0.5, -0.1])),
+    (_.percentile, ([1, 2], 101)),
+])
+def test_quantile_invalid(func, case):
+    with pytest.raises(ValueError):
+        func(*case)
+
+
+@parametrize('size', [1025, 5000, 20000])
+@parametrize('order', ['random', 'sorted', 'reversed', 'duplicates'])
+def test_quantile_selection(size, order):
+    rand = random.Random(size)
+
+    if order == 'duplicates':
+        values = [rand.randint(0, 10) for _i in range(size)]
+    else:
+        values = [rand.random() for _i in range(size)]
+
+    if order == 'sorted':
+        values.sort()
+    elif order == 'reversed':
+        values.sort(reverse=True)
+
+    ordered = sorted(values)
+    original = list(values)
+
+    for q in (0, 0.001, 0.25, 0.5, 0.999, 1):
+        position = (size - 1) * q
+        rank = int(position)
+        expected = ordered[rank]
+
+        if rank < position:
+            expected += (ordered[rank + 1] - expected) * (position - rank)
+
+        assert _.quantile(values, q) == expected
+
+    assert _.quantile(values, [0.1, 0.5, 0.9]) == [
+        _.quantile(values, 0.1),
+        _.quantile(values, 0.5),
+        _.quantile(values, 0.9),
+    ]
+    assert _.median(values) == (ordered[(size - 1) // 2] +
+                                ordered[size // 2]) / 2.0
+    assert values == original
+
+
+@parametrize('case,expected', [
+    ([1, 2, 3, 4], 2.5),
+    ([5.0, 1.0, 3.0], 3.0),
+])
+def test_median_numpy(case, expected):
+    numpy = pytest.importorskip('numpy')
+    value = numpy.array(case)
+
+    assert _.median(value) == expected
+    assert _.median(array('d', case)) == expected
+    assert list(value) == case
+
+
+def test_quantile_numpy():
+    numpy = pytest.importorskip('numpy')
+    rand = random.Random(0)
+    values = numpy.array([rand.random() for _i in range(1000)])
+    qs = [0, 0.1, 0.5, 0.75, 1]
+
+    for result, expected in zip(_.quantile(values, qs),
+                                numpy.quantile(values, qs)):
+        assert abs(result - expected) < 1e-12
+
+    assert type(_.quantile(numpy.arange(5), 0.5)) is int
+
+
 @parametrize('case,expected', [
     (([1, 2, 3],), 1),
     (({'a': 3, 'b': 2, 'c': 1},), 1),
@@ -156,7 +283,7 @@ def test_min_default(collection, default, expected):
      [2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5]),
 ])
 def test_moving_average(case, expected):
-    assert _.moving_average(*case) == expected
+    assert list(_.moving_average(*case)) == expected
 
 
 @parametrize('case', [
@@ -166,6 +293,109 @@ def test_moving_average_aliases(case):
     assert _.moving_average is case
 
 
+@parametrize('func,case,expected', [
+    (_.moving_sum, ([1, 2, 3, 4, 5], 3), [6, 9, 12]),
+    (_.moving_sum, ([0.1] * 12, 10), [1.0, 1.0, 1.0]),
+    (_.moving_sum, ([1e100, 1.0, -1e100, 1.0], 2), [1e100, -1e100, -1e100]),
+    (_.moving_sum, ([1, float('inf'), 2, 3], 2),
+     [float('inf'), float('inf'), 5]),
+    (_.moving_max, ([1, 3, 2, 5, 4, 1], 3), [3, 5, 5, 5]),
+    (_.moving_max, ([5, 4, 3, 2, 1], 2), [5, 4, 3, 2]),
+    (_.moving_max, ([2, 2, 1, 1], 2), [2, 2, 1]),
+    (_.moving_min, ([1, 3, 2, 5, 4, 1], 3), [1, 2, 2, 1]),
+    (_.moving_min, ([1, 2, 3, 4, 5], 2), [1, 2, 3, 4]),
+    (_.moving_median, ([1, 3, 2, 5, 4, 1], 3), [2, 3, 4, 4]),
+    (_.moving_median, ([1, 3, 2, 5, 4, 1], 2), [2.0, 2.5, 3.5, 4.5, 2.5]),
+    (_.moving_std, ([1, 1, 3, 3, 1], 2), [0.0, 1.0, 0.0, 1.0]),
+    (_.moving_std, ([5, 5, 5, 5], 3), [0.0, 0.0]),
+    (_.moving_average, (iter([1, 2, 3, 4]), 2), [1.5, 2.5, 3.5]),
+    (_.moving_sum, ([1, 2], 3), []),
+    (_.moving_min, ([], 1), []),
+])
+def test_moving_windows(func, case, expected):
+    assert list(func(*case)) == expected
+
+
+@parametrize('func', [
+    _.moving_average,
+    _.moving_max,
+    _.moving_median,
+    _.moving_min,
+    _.moving_std,
+    _.moving_sum,
+])
+def test_moving_windows_brute_force(func):
+    rand = random.Random(0)
+    values = [rand.uniform(-1000, 1000) for _i in range(500)]
+    reference = {
+        _.moving_average: _.average,
+        _.moving_max: max,
+        _.moving_median: _.median,
+        _.moving_min: min,
+        _.moving_std: _.std_deviation,
+        _.moving_sum: math.fsum,
+    }[func]
+
+    for size in (1, 2, 7, 64):
+        expected = [reference(values[i:i + size])
+                    for i in range(len(values) - size + 1)]
+
+        for result, expect in zip(func(values, size), expected):
+            assert abs(result - expect) < 1e-6
+
+        assert len(list(func(values, size))) == len(expected)
+
+
+def test_moving_windows_lazy():
+    def stream():
+        for value in [1, 2, 3]:
+            yield value
+
+        raise AssertionError('stream consumed past the first windows')
+
+    assert next(_.moving_sum(stream(), 2)) == 3
+    assert next(_.moving_max(stream(), 2)) == 2
+
+
+@parametrize('scale,size', [
+    (1e6, 3),
+    (1e8, 5),
+    (1e10, 50),
+])
+def test_moving_std_large_offsets(scale, size):
+    rand = random.Random(0)
+    values = [rand.uniform(-scale, scale) for _i in range(5000)]
+    values += [1e6 + rand.uniform(-0.2, 0.2) for _i in range(size)]
+    values += [1] * size
+    result = list(_.moving_std(values, size))
+
+    assert abs(result[-size - 1] -
+               _.std_deviation(values[-2 * size:-size])) < 1e-6
+    assert result[-1] == 0
+
+
+def test_moving_std_nan():
+    result = list(_.moving_std([1, float('nan'), 1, 3], 2))
+
+    assert math.isnan(result[0])
+    assert math.isnan(result[1])
+    assert result[2] == 1.0
+
+
+@parametrize('func', [
+    _.moving_average,
+    _.moving_max,
+    _.moving_median,
+    _.moving_min,
+    _.moving_std,
+    _.moving_sum,
+])
+@parametrize('size', [0, -1])
+def test_moving_windows_invalid_size(func, size):
+    with pytest.raises(ValueError):
+        func([1, 2, 3], size)
+
+
 @parametrize('multiplier,multiplicand,expected', [
     (10, 5, 50),
     (None, 1, 1),
@@ -290,3 +520,154 @@ def test_variance(case, expected):
 ])
 def test_zscore(case, expected):
     assert _.map_(_.zscore(*case), lambda v: round(v, 3)) == expected
+
+
+def test_running_stats():
+    stats = _.RunningStats([1, 18, 20, 4])
+
+    assert stats.count == 4
+    assert stats.sum == 43
+    assert stats.mean == 10.75
+    assert stats.variance == 69.6875
+    assert stats.std_deviation == 69.6875 ** 0.5
+    assert stats.min == 1
+    assert stats.max == 20
+
+    stats.push(-5)
+    assert stats.count == 5
+    assert stats.min == -5
+
+
+def test_running_stats_empty():
+    stats = _.RunningStats()
+
+    assert stats.count == 0
+    assert stats.sum == 0
+    assert stats.min is None
+    assert stats.max is None
+
+    with pytest.raises(ZeroDivisionError):
+        stats.mean
+
+    with pytest.raises(ZeroDivisionError):
+        stats.variance
+
+
+def test_running_stats_merge():
+    rand = random.Random(0)
+    values = [rand.gauss(1e6, 1) for _i in range(1000)]
+    chunks = [values[i:i + 70] for i in range(0, len(values), 70)]
+    merged = _.RunningStats()
+
+    for chunk in chunks:
+        merged = merged.merge(_.RunningStats(chunk))
+
+    expected = _.RunningStats(values)
+
+    assert merged.count == expected.count
+    assert merged.min == min(values)
+    assert merged.max == max(values)
+    assert merged.sum == math.fsum(values)
+    assert abs(merged.mean - expected.mean) < 1e-9
+    assert abs(merged.variance - expected.variance) < 1e-9
+
+
+def test_running_stats_merge_empty():
+    stats = _.RunningStats([1, 2, 3])
+
+    assert _.RunningStats().merge(stats).variance == stats.variance
+    assert stats.merge(_.RunningStats()).mean == stats.mean
+
+
+def test_running_stats_accuracy():
+    values = [1e100, 1.0, -1e100, 1.0]
+    stats = _.RunningStats(values)
+
+    assert stats.sum == 2.0
+    assert stats.mean == 0.5
+
+
+def test_running_stats_nonfinite():
+    stats = _.RunningStats([1.0, float('inf'), 2.0])
+
+    assert stats.sum == float('inf')
+    assert stats.max == float('inf')
+    assert math.isnan(stats.variance)
+
+
+def test_tdigest():
+    rand = random.Random(0)
+    values = [rand.gauss(0, 1) for _i in range(20000)]
+    ordered = sorted(values)
+    digest = _.TDigest(iter(values))
+
+    assert digest.count == len(values)
+    assert digest.min == ordered[0]
+    assert digest.max == ordered[-1]
+    assert digest.quantile(0) == ordered[0]
+    assert digest.quantile(1) == ordered[-1]
+    assert len(digest._centroids) <= digest.compression
+
+    for q in (0.001, 0.01, 0.1, 0.5, 0.9, 0.99, 0.999):
+        rank = bisect.bisect(ordered, digest.quantile(q)) / float(len(values))
+        assert abs(rank - q) < 0.002
+        assert abs(digest.percentile(q * 100) - digest.quantile(q)) < 1e-9
+
+
+@parametrize('case,q,expected', [
+    ([5], 0.5, 5),
+    ([1, 2, 3, 4, 5], 0.5, 3),
+    ([1, 2, 3, 4], 0.5, 2.5),
+    ([4, 2, 1, 3], 0, 1),
+    ([4, 2, 1, 3], 1, 4),
+])
+def test_tdigest_small(case, q, expected):
+    assert _.TDigest(case).quantile(q) == expected
+
+
+def test_tdigest_push():
+    digest = _.TDigest()
+
+    for value in range(100):
+        digest.push(value)
+
+    assert digest.count == 100
+    assert digest.quantile(0.5) == 49.5
+
+
+def test_tdigest_merge():
+    rand = random.Random(1)
+    values = [rand.random() for _i in range(10000)]
+    merged = _.TDigest()
+
+    for start in range(0, len(values), 1500):
+        merged = merged.merge(_.TDigest(values[start:start + 1500]))
+
+    assert merged.count == len(values)
+    assert merged.min == min(values)
+    assert merged.max == max(values)
+    assert abs(merged.quantile(0.5) - _.median(values)) < 0.01
+    assert abs(merged.quantile(0.99) - _.quantile(values, 0.99)) < 0.01
+
+
+@parametrize('case', [
+    lambda: _.TDigest().quantile(0.5),
+    lambda: _.TDigest([1]).quantile(1.5),
+    lambda: _.TDigest([1]).percentile(-1),
+    lambda: _.TDigest(compression=0),
+    lambda: _.TDigest(compression=0.5),
+    lambda: _.TDigest(compression=-1),
+    lambda: _.TDigest(compression=True),
+    lambda: _.TDigest(compression='100'),
+])
+def test_tdigest_invalid(case):
+    with pytest.raises(ValueError):
+        case()
+
+
+def test_tdigest_empty():
+    digest = _.TDigest()
+
+    assert digest.count == 0
+    assert digest.min is None
+    assert digest.max is None
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+from collections import OrderedDict
+import copy
 import datetime as dt
 
 import pydash as _
@@ -7,6 +9,8 @@ import pydash as _
 from . import fixtures
 from .fixtures import parametrize
 
+import pytest
+
 
 today = dt.date.today()
 
@@ -76,6 +80,50 @@ def test_clone_deep(case, kargs):
             assert value is not case[key]
 
 
+@parametrize('case', [
+    {'a': [1, 2.5, 'x', None, True, {'b': [[], {}]}], 'c': {'d': u'e'}},
+    [[[[1]]], {'a': b'b'}],
+    {'a': (1, [2]), 'b': set([3]), 'c': today},
+])
+def test_clone_deep_equal(case):
+    actual = _.clone_deep(case)
+
+    assert actual == case
+    assert actual == copy.deepcopy(case)
+    assert actual == _.clone_deep(case, callback=_.identity)
+
+
+def test_clone_deep_callback():
+    case = {'a': [1], 'b': [2]}
+    actual = _.clone_deep(case, callback=len)
+
+    assert actual == {'a': 1, 'b': 1}
+    assert case == {'a': [1], 'b': [2]}
+
+
+def test_clone_deep_references():
+    shared = {'a': [1]}
+    case = [shared, shared, (shared,)]
+    case.append(case)
+    actual = _.clone_deep(case)
+
+    assert actual[0] == shared
+    assert actual[0] is not shared
+    assert actual[0]['a'] is not shared['a']
+    assert actual[0] is actual[1]
+    assert actual[2][0] is actual[0]
+    assert actual[3] is actual
+
+
+def test_clone_deep_subclass():
+    case = OrderedDict([('a', [1])])
+    actual = _.clone_deep(case)
+
+    assert type(actual) is dict
+    assert actual == {'a': [1]}
+    assert actual['a'] is not case['a']
+
+
 @parametrize('case,expected', [
     (({'level1': {
         'value': 'value 1',
@@ -104,6 +152,144 @@ def test_deep_map_values(case, expected):
     assert _.deep_map_values(*case) == expected
 
 
+def test_deep_map_values_in_place():
+    obj = {'a': [1, {'b': 2}], 'c': 3}
+    inner = obj['a']
+    result = _.deep_map_values(obj, lambda value, path: [value, path])
+
+    assert result is obj
+    assert obj['a'] is inner
+    assert obj == {'a': [[1, ['a', 0]], {'b': [2, ['a', 1, 'b']]}],
+                   'c': [3, ['c']]}
+
+
+def test_deep_map_values_deep():
+    obj = value = []
+
+    for _i in range(5000):
+        value.append([])
+        value = value[0]
+
+    value.append(1)
+
+    _.deep_map_values(obj, lambda value: value + 1)
+
+    assert _.get(obj, [0] * 5001) == 2
+
+
+def test_deep_map_values_cyclic():
+    obj = {'a': 1}
+    obj['b'] = obj
+    result = _.deep_map_values(obj, lambda value: value + 1)
+
+    assert result['a'] == 2
+    assert result['b'] is result
+
+
+def test_deep_map_values_shared():
+    shared = {'c': 1}
+    result = _.deep_map_values({'a': shared, 'b': shared},
+                               lambda value: value + 1)
+
+    assert result == {'a': {'c': 2}, 'b': {'c': 2}}
+
+
+@parametrize('obj,other,expected', [
+    ({'a': 1}, {'a': 1}, []),
+    ({'a': 1}, {'a': 2}, [{'op': 'replace', 'path': '/a', 'value': 2}]),
+    ({'a': 1}, {'a': True}, [{'op': 'replace', 'path': '/a', 'value': True}]),
+    ({'a': 1}, {}, [{'op': 'remove', 'path': '/a'}]),
+    ({}, {'a': [1]}, [{'op': 'add', 'path': '/a', 'value': [1]}]),
+    ([1, 2, 3], [1], [{'op': 'remove', 'path': '/2'},
+                      {'op': 'remove', 'path': '/1'}]),
+    ([1], [1, 2, 3], [{'op': 'add', 'path': '/1', 'value': 2},
+                      {'op': 'add', 'path': '/2', 'value': 3}]),
+    ({'a': {'b': [1, {'c': 2}]}}, {'a': {'b': [1, {'c': 3}]}},
+     [{'op': 'replace', 'path': '/a/b/1/c', 'value': 3}]),
+    ({'a~/b': 1}, {'a~/b': 2},
+     [{'op': 'replace', 'path': '/a~0~1b', 'value': 2}]),
+    (1, 2, [{'op': 'replace', 'path': '', 'value': 2}]),
+    ([1], {}, [{'op': 'replace', 'path': '', 'value': {}}]),
+])
+def test_diff(obj, other, expected):
+    assert _.diff(obj, other) == expected
+
+
+@parametrize('obj,other', [
+    ({'a': 1, 'b': {'c': [1, 2, {'d': 3}], 'e': None}, 'f': 'g'},
+     {'a': 1, 'b': {'c': [1, {'d': 4}], 'x': [[]]}, 'h': 'i'}),
+    ([[1, 2], [3, 4, 5], {}], [[1], [3, 4, 5, 6, 7], {'a': 1}, 8]),
+    ({'a/b': {'~': 1}, 'c': [1, 2, 3]}, {'a/b': {'~': 2}, 'c': []}),
+    ({'a': 1}, {'a': 1.0}),
+    ({1: 'a'}, {1: 'b'}),
+    ({1: {2: 'a'}, 3: 4, None: [1]}, {1: {2: 'b'}, None: []}),
+])
+def test_diff_patch(obj, other):
+    original = _.clone_deep(obj)
+    ops = _.diff(obj, other)
+    result = _.patch(obj, ops)
+
+    assert result == other
+    assert obj == original
+    assert _.patch(obj, ops, mutate=True) is obj
+    assert obj == other
+
+
+def test_diff_prunes_identical():
+    shared = {'a': [1, 2, 3]}
+    calls = []
+
+    class Spy(object):
+        def __eq__(self, other):
+            calls.append(other)
+            return True
+
+    shared['spy'] = Spy()
+
+    assert _.diff({'x': shared, 'y': 1}, {'x': shared, 'y': 2}) == \
+        [{'op': 'replace', 'path': '/y', 'value': 2}]
+    assert calls == []
+
+
+def test_patch_structural_sharing():
+    obj = {'a': {'b': 1, 'c': 2}, 'd': {'e': [1]}}
+    result = _.patch(obj, [{'op': 'replace', 'path': '/a/b', 'value': 3},
+                           {'op': 'add', 'path': '/a/f', 'value': 4},
+                           {'op': 'remove', 'path': '/a/c'}])
+
+    assert result == {'a': {'b': 3, 'f': 4}, 'd': {'e': [1]}}
+    assert obj == {'a': {'b': 1, 'c': 2}, 'd': {'e': [1]}}
+    assert result['d'] is obj['d']
+
+
+@parametrize('obj,ops,expected', [
+    ([1, 2], [{'op': 'add', 'path': '/0', 'value': 0}], [0, 1, 2]),
+    ([1, 2], [{'op': 'add', 'path': '/-', 'value': 3}], [1, 2, 3]),
+    ({'a': []}, [{'op': 'add', 'path': '/a/-', 'value': 1},
+                 {'op': 'add', 'path': '/a/-', 'value': 2}],
+     {'a': [1, 2]}),
+    ({'a': 1}, [{'op': 'replace', 'path': '', 'value': [1]}], [1]),
+    ({1: 'a', '1': 'b'}, [{'op': 'replace', 'path': '/1', 'value': 'c'}],
+     {1: 'a', '1': 'c'}),
+    ({}, [{'op': 'add', 'path': '/1', 'value': 'a'}], {'1': 'a'}),
+])
+def test_patch(obj, ops, expected):
+    assert _.patch(obj, ops) == expected
+
+
+@parametrize('obj,ops,exception', [
+    ({}, [{'op': 'move', 'path': '/a', 'from': '/b'}], ValueError),
+    ({}, [{'op': 'replace', 'path': '/a', 'value': 1}], KeyError),
+    ({}, [{'op': 'remove', 'path': '/a'}], KeyError),
+    ([], [{'op': 'add', 'path': '/1', 'value': 1}], IndexError),
+    ([], [{'op': 'replace', 'path': '/0', 'value': 1}], IndexError),
+    ({}, [{'op': 'add', 'path': 'a', 'value': 1}], ValueError),
+])
+def test_patch_invalid(obj, ops, exception):
+    with pytest.raises(exception):
+        _.patch(obj, ops)
+
+
 @parametrize('case,expected', [
     (({'name': 'barney'}, {'name': 'fred', 'employer': 'slate'}),
      {'name': 'barney', 'employer': 'slate'}),
@@ -114,12 +300,27 @@ def test_defaults(case, expected):
 
 @parametrize('case,expected', [
     (({'user': {'name': 'barney'}}, {'user': {'name': 'fred', 'age': 36}}),
-     {'user': {'name': 'barney', 'age': 36}})
+     {'user': {'name': 'barney', 'age': 36}}),
+    (({'a.b': None, 'c': [1]}, {'a.b': 1, 'c': [2, 3]}),
+     {'a.b': None, 'c': [1, 3]}),
 ])
 def test_defaults_deep(case, expected):
     assert _.defaults_deep(*case) == expected
 
 
+def test_defaults_deep_copy():
+    source = {'a': {'b': [1]}, 'c': [2]}
+
+    result = _.defaults_deep({'c': [3]}, source)
+    assert result == {'a': {'b': [1]}, 'c': [3]}
+    assert result['a'] is not source['a']
+    assert result['a']['b'] is not source['a']['b']
+
+    result = _.defaults_deep({'c': [3]}, source, copy=False)
+    assert result == {'a': {'b': [1]}, 'c': [3]}
+    assert result['a'] is source['a']
+
+
 @parametrize('case,expected', [
     ([1, 2, 3], {0: 1, 1: 2, 2: 3}),
     ({0: 1, 1: 2, 2: 3}, {0: 1, 1: 2, 2: 3}),
@@ -180,6 +381,70 @@ def test_find_key_aliases(case):
     assert _.find_key is case
 
 
+@parametrize('case,expected', [
+    ({'a': {'b': [{'c': 1}, 2]}, 'd': 3},
+     {'a.b[0].c': 1, 'a.b[1]': 2, 'd': 3}),
+    ([1, [2, {'a': 3}]], {'[0]': 1, '[1][0]': 2, '[1][1].a': 3}),
+    ({'a': {}, 'b': [], 'c': None}, {'a': {}, 'b': [], 'c': None}),
+    ({'a.b': {'c\\d': 1, '[0]': 2}},
+     {'a\\.b.c\\\\d': 1, 'a\\.b.\\[0]': 2}),
+    ({1: {2: 3}}, {'1.2': 3}),
+    ({'': 1, 'a': {'': 2}}, {'': 1, 'a.': 2}),
+    ({'': [1, {'': 2}]}, {'.[0]': 1, '.[1].': 2}),
+    ({}, {}),
+    (5, {}),
+])
+def test_flatten_keys(case, expected):
+    assert _.flatten_keys(case) == expected
+
+
+@parametrize('case', [
+    {'a.b': [{'c\\d': 1}]},
+    {'a\\.b': {'c': [1, {'d.e\\': 2}]}},
+])
+def test_flatten_keys_to_path(case):
+    obj = case
+    flat = _.flatten_keys(obj)
+
+    for path, value in flat.items():
+        assert _.get(obj, path) == value
+
+
+@parametrize('case,separator', [
+    ({'a': {'b': [{'c': 1}, 2]}, 'd': 3}, '.'),
+    ({'a': {'b': [{'c': 1}, 2]}, 'd': 3}, '/'),
+    ({'a': {'b': [{'c': 1}, 2]}, 'd': 3}, '::'),
+    ([[1, [2]], {'a': [], 'b': {}}], '.'),
+    ({'a.b/c': {'d\\e': 1, '[0]': [None, 2], 'x[1]y': 3}}, '.'),
+    ({'a.b/c': {'d\\e': 1, '[0]': [None, 2], 'x[1]y': 3}}, '/'),
+    ({'a::b:c': {':': 1}}, '::'),
+    ({'': 1}, '.'),
+    ({'a': {'': 1}}, '.'),
+    ({'': {'b': 1}}, '.'),
+    ({'': [1]}, '.'),
+    ({'': [[1], {'': 2}]}, '/'),
+    ({'a': {'': [1]}}, '.'),
+    ({'[0]': 1, 'x[1]y': {'[': [2]}}, '.'),
+    ({'[0]': 1, 'x[1]y': {'[': [2]}}, '::'),
+])
+def test_unflatten_keys_round_trip(case, separator):
+    flat = _.flatten_keys(case, separator)
+
+    assert _.unflatten_keys(flat, separator) == case
+
+
+@parametrize('case,expected', [
+    ({'a.b': 1, 'a.c': 2}, {'a': {'b': 1, 'c': 2}}),
+    ({'a[2]': 1}, {'a': [None, None, 1]}),
+    ({'[1].a': 1, '[0]': 0}, [0, {'a': 1}]),
+    ({'[0]': 1, 'a': 2}, {0: 1, 'a': 2}),
+    ({'a..b': 1}, {'a': {'': {'b': 1}}}),
+    ({}, {}),
+])
+def test_unflatten_keys(case, expected):
+    assert _.unflatten_keys(case) == expected
+
+
 @parametrize('case,expected', [
     (({'name': 'fred', 'employer': 'slate'}, fixtures.for_in_callback0),
      ({'name': 'fredfred', 'employer': 'slateslate'},)),
@@ -260,6 +525,67 @@ def test_get(case, expected):
     assert _.get(*case) == expected
 
 
+class Point(object):
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+@parametrize('obj,path,expected', [
+    ({'a': {'b': [0, {'c': 1}]}}, 'a.b[1].c', 1),
+    ({'a': {'b': [0, {'c': 1}]}}, 'a.b.1.c', 1),
+    ({'a': {'b': [0, {'c': 1}]}}, ['a', 'b', -1, 'c'], 1),
+    ({'a': {'b': [0, {'c': 1}]}}, 'a.b.2.c', None),
+    ({'a': {'b': [0, {'c': 1}]}}, 'a.b.x', None),
+    ({'a': (1, 2)}, 'a.1', 2),
+    ({1: {'a': 1}}, [1, 'a'], 1),
+    ({'a': 'abc'}, 'a.1', 'b'),
+    ({'a': Point(1, [2, 3])}, 'a.y.1', 3),
+    ({'a': Point(1, 2)}, 'a.z', None),
+    ({'a.b': 1}, 'a\\.b', 1),
+    ([1, 2], 0, 1),
+    ({'a': None}, 'a.b', None),
+    ({None: 1}, None, 1),
+    ({True: 1}, True, 1),
+    ([1, 2], True, 2),
+])
+def test_compile_path(obj, path, expected):
+    compiled = _.compile_path(path)
+
+    assert compiled(obj) == expected
+    assert compiled.get(obj) == expected
+    assert _.get_many(obj, [path]) == [expected]
+
+
+def test_compile_path_default():
+    compiled = _.compile_path('a.b')
+
+    assert compiled({}, default=5) == 5
+    assert compiled({'a': {'b': None}}, default=5) is None
+
+
+def test_compile_path_set():
+    compiled = _.compile_path('a.b[0]')
+    obj = {'a': {'b': [1]}}
+
+    assert compiled.set(obj, 2) == {'a': {'b': [2]}}
+    assert obj == {'a': {'b': [1]}}
+    assert compiled.set(obj, 3, mutate=True) is obj
+    assert obj == {'a': {'b': [3]}}
+
+
+@parametrize('case,expected', [
+    (({'a': {'b': [1, 2], 'c': 3}}, ['a.b[1]', 'a.c', 'a.d', 'a.b.0', 'a']),
+     [2, 3, None, 1, {'b': [1, 2], 'c': 3}]),
+    (({'a': {'b': 1}}, ['a.b', 'a.b', 'x.y']), [1, 1, None]),
+    (({'a': {'b': 1}}, ['x', 'a.b.c'], 0), [0, 0]),
+    (({'a': 1}, []), []),
+    (([[1, 2], [3]], [[0, 1], [1, 0], [1, 1]]), [2, 3, None]),
+])
+def test_get_many(case, expected):
+    assert _.get_many(*case) == expected
+
+
 @parametrize('case', [
     _.get_path,
     _.deep_get,
@@ -292,6 +618,24 @@ def test_get_aliases(case):
     (({'lev.el1': {r'lev\el2': {'level3': ['value']}}},
       r'lev\.el1.lev\\el2.level3.[0]'),
      True),
+    (({'a': [1]}, 'a.1'), False),
+    (({'a': [1]}, 'a.-1'), True),
+    (({'a': [1]}, 'a.x'), False),
+    (({'a': (1, 2)}, 'a.1'), True),
+    (({'a': 'abc'}, 'a.2'), True),
+    (({'a': 'abc'}, 'a.3'), False),
+    (({'a': None}, 'a'), True),
+    (({'a': None}, 'a.b'), False),
+    (({}, [['a']]), False),
+    (({1: {'a': 1}}, [1, 'a']), True),
+    ((Point(1, 2), 'x'), False),
+    (({}, None), False),
+    (({None: 1}, None), True),
+    (({True: 1}, True), True),
+    (({1: 'a'}, 1), True),
+    (([1], True), False),
+    (([1], 0), True),
+    (([1], 1), False),
 ])
 def test_has(case, expected):
     assert _.has(*case) == expected
@@ -305,6 +649,24 @@ def test_has_aliases(case):
     assert _.has is case
 
 
+@parametrize('case,expected', [
+    (({'a': {'b': 1}, 'c': [2]}, ['a.b', 'c.0', 'a']), True),
+    (({'a': {'b': 1}, 'c': [2]}, ['a.b', 'c.1']), False),
+    (({'a': 1}, []), True),
+])
+def test_has_all(case, expected):
+    assert _.has_all(*case) is expected
+
+
+@parametrize('case,expected', [
+    (({'a': {'b': 1}, 'c': [2]}, ['x', 'c.0']), True),
+    (({'a': {'b': 1}, 'c': [2]}, ['a.c', 'c.1']), False),
+    (({'a': 1}, []), False),
+])
+def test_has_any(case, expected):
+    assert _.has_any(*case) is expected
+
+
 @parametrize('case,expected', [
     ({'a': 1, 'b': 2, 'c': 3}, ['a', 'b', 'c']),
     ([1, 2, 3], [0, 1, 2])
@@ -393,6 +755,62 @@ def test_merge_no_link_list():
     assert case == {'foo': [{}]}
 
 
+def test_merge_no_link_callback():
+    case = {'foo': [1]}
+    result = _.merge({}, case, callback=lambda obj_value, src_value: src_value)
+    result['foo'].append(2)
+
+    assert case == {'foo': [1]}
+
+
+def test_merge_copy_false():
+    case1 = {'foo': {'bar': 1}, 'baz': [1]}
+    case2 = {'foo': {'qux': 2}}
+    result = _.merge({}, case1, case2, copy=False)
+
+    assert result == {'foo': {'bar': 1, 'qux': 2}, 'baz': [1]}
+    assert result['foo'] is case1['foo']
+    assert result['baz'] is case1['baz']
+    assert case1['foo'] == {'bar': 1, 'qux': 2}
+
+
+def test_merge_deep():
+    def nested(leaf):
+        obj = value = {}
+
+        for _i in range(5000):
+            value['a'] = {}
+            value = value['a']
+
+        value['b'] = leaf
+        return obj
+
+    result = _.merge(nested(1), nested(2))
+
+    assert _.get(result, ['a'] * 5000 + ['b']) == 2
+
+
+def test_merge_cyclic():
+    obj = {'a': 1}
+    obj['self'] = obj
+    source = {'b': 2}
+    source['self'] = source
+    result = _.merge(obj, source)
+
+    assert result is obj
+    assert obj['b'] == 2
+    assert obj['self'] is obj
+
+
+def test_merge_shares_immutable_values():
+    value = 'x' * 100
+    case = {'a': value, 'b': (1, 2)}
+    result = _.merge({}, case)
+
+    assert result['a'] is value
+    assert result == case
+
+
 @parametrize('case,expected', [
     (({'a': 1, 'b': 2, 'c': 3}, 'a'), {'b': 2, 'c': 3}),
     (({'a': 1, 'b': 2, 'c': 3}, 'a', 'b'), {'c': 3}),
@@ -402,12 +820,55 @@ def test_merge_no_link_list():
      {'b': 2, 'c': 3}),
     (([1, 2, 3],), {0: 1, 1: 2, 2: 3}),
     (([1, 2, 3], 0), {1: 2, 2: 3}),
-    (([1, 2, 3], 0, 1), {2: 3})
+    (([1, 2, 3], 0, 1), {2: 3}),
+    (({'a': {'b': 1, 'c': 2}, 'd': 3}, 'a.b'), {'a': {'c': 2}, 'd': 3}),
+    (({'a': {'b': {'c': 1}}, 'd': 3}, 'a.b.c', 'a.x.y'),
+     {'a': {'b': {}}, 'd': 3}),
+    (({'a': {'b': 1}, 'd': 3}, 'a', 'a.b'), {'d': 3}),
+    (({'a': [1, 2, 3]}, 'a[0]', 'a[2]', 'a[5]'), {'a': [2]}),
+    (({'a': [{'b': 1, 'c': 2}]}, 'a[0].b'), {'a': [{'c': 2}]}),
+    (({'a.b': 1, 'a': {'b': 2}}, 'a.b'), {'a': {'b': 2}}),
+    (({'a': 1}, 'a.b'), {'a': 1}),
+    (({'a': [1, 2, 3]}, 'a.-1', 'a.-5', 'a.3'), {'a': [1, 2]}),
+    (({'a': [{'b': 1}, {'b': 2}]}, 'a.-1.b'), {'a': [{'b': 1}, {}]}),
 ])
 def test_omit(case, expected):
     assert _.omit(*case) == expected
 
 
+def test_omit_deep_copies_path_only():
+    obj = {'a': {'b': 1, 'c': {'d': 2}}, 'e': {'f': 3}}
+    result = _.omit(obj, 'a.b')
+
+    assert result == {'a': {'c': {'d': 2}}, 'e': {'f': 3}}
+    assert obj == {'a': {'b': 1, 'c': {'d': 2}}, 'e': {'f': 3}}
+    assert result['a'] is not obj['a']
+    assert result['a']['c'] is obj['a']['c']
+    assert result['e'] is obj['e']
+
+
+@parametrize('case,expected', [
+    (([{'a': 1, 'b': 2}, {'a': 3, 'c': 4}], 'a'), [{'b': 2}, {'c': 4}]),
+    (([{'a': 1, 'b': 2}, {'a': 3, 'c': 4}], ['a', 'b']), [{}, {'c': 4}]),
+    (([{'a': {'b': 1, 'c': 2}}, {'a': {'c': 3}}], 'a.b'),
+     [{'a': {'c': 2}}, {'a': {'c': 3}}]),
+    (([{'a': {'b': 1}}, {'a.b': 2, 'a': {'b': 3}}], 'a.b'),
+     [{'a': {}}, {'a': {'b': 3}}]),
+    (([[1, 2, 3], [4, 5]], 0), [{1: 2, 2: 3}, {1: 5}]),
+    (([{'a': 1, 'b': 2}], lambda value: value > 1), [{'a': 1}]),
+    (([],), []),
+])
+def test_omit_all(case, expected):
+    assert _.omit_all(*case) == expected
+
+
+def test_omit_all_lazy():
+    result = _.omit_all(iter([{'a': 1, 'b': 2}]), 'a', lazy=True)
+
+    assert not isinstance(result, list)
+    assert list(result) == [{'b': 2}]
+
+
 @parametrize('case,expected', [
     ({'a': 1, 'b': 2, 'c': 3}, [['a', 1], ['b', 2], ['c', 3]]),
     ([1, 2, 3], [[0, 1], [1, 2], [2, 3]])
@@ -446,11 +907,84 @@ def test_parse_int(case, expected):
     ((fixtures.Object(a=1, b=2, c=3), 'a', 'b'), {'a': 1, 'b': 2}),
     ((fixtures.ItemsObject({'a': 1, 'b': 2, 'c': 3}), 'a'), {'a': 1}),
     ((fixtures.IteritemsObject({'a': 1, 'b': 2, 'c': 3}), 'a'), {'a': 1}),
+    (({'a': {'b': 1, 'c': 2}, 'd': 3}, 'a.b'), {'a': {'b': 1}}),
+    (({'a': {'b': 1, 'c': 2}, 'd': 3}, 'a.b', 'd'), {'a': {'b': 1}, 'd': 3}),
+    (({'a': {'b': 1, 'c': 2}}, 'a.b', 'a'), {'a': {'b': 1, 'c': 2}}),
+    (({'a': {'b': 1}}, 'a.x', 'x.y'), {}),
+    (({'a': [1, 2, 3]}, 'a[1]'), {'a': [None, 2]}),
+    (({'a': [{'b': 1, 'c': 2}]}, 'a[0].c'), {'a': [{'c': 2}]}),
+    (({'a.b': 1, 'a': {'b': 2}}, 'a.b'), {'a.b': 1}),
+    (({'a': fixtures.Object(b=1, c=2)}, 'a.b'), {'a': {'b': 1}}),
+    ((fixtures.Object(a={'b': 1, 'c': 2}), 'a.c'), {'a': {'c': 2}}),
+    (({'a': [1, 2]}, 'a.-1'), {'a': [None, 2]}),
+    (({'a': [1, 2, 3]}, 'a.-1', 'a.0'), {'a': [1, None, 3]}),
+    (({'a': [{'b': 1}, {'b': 2}]}, 'a.-1.b'), {'a': [None, {'b': 2}]}),
+    (({'a': [1, 2]}, 'a.-3', 'a.2'), {}),
 ])
 def test_pick(case, expected):
     assert _.pick(*case) == expected
 
 
+def test_pick_deep_shares_values():
+    value = {'d': 1}
+    obj = {'a': {'b': value, 'c': 2}}
+    result = _.pick(obj, 'a.b')
+
+    assert result == {'a': {'b': {'d': 1}}}
+    assert result['a']['b'] is value
+
+
+@parametrize('case,expected', [
+    (([{'a': 1, 'b': 2}, {'a': 3, 'c': 4}], 'a'), [{'a': 1}, {'a': 3}]),
+    (([{'a': 1, 'b': 2}, {'c': 4}], 'a', 'b'), [{'a': 1, 'b': 2}, {}]),
+    (([{'a': {'b': 1, 'c': 2}}, {'a': {'c': 3}}], 'a.b'),
+     [{'a': {'b': 1}}, {}]),
+    (([{'a': {'b': 1}}, {'a.b': 2, 'a': {'b': 3}}], 'a.b'),
+     [{'a': {'b': 1}}, {'a.b': 2}]),
+    (([fixtures.Object(a=1, b=2)], 'a'), [{'a': 1}]),
+    (([[1, 2, 3], [4, 5]], 0), [{0: 1}, {0: 4}]),
+    (([{'a': 1, 'b': 2}], lambda value: value > 1), [{'b': 2}]),
+    (([],), []),
+])
+def test_pick_all(case, expected):
+    assert _.pick_all(*case) == expected
+
+
+def test_pick_all_lazy():
+    result = _.pick_all(iter([{'a': 1, 'b': 2}]), 'a', lazy=True)
+
+    assert not isinstance(result, list)
+    assert list(result) == [{'a': 1}]
+
+
+@parametrize('case,expected', [
+    (([{'a': {'b': 1}, 'c': 2}, {'a': {'b': 3}}], {'x': 'a.b', 'y': 'c'}),
+     [{'x': 1, 'y': 2}, {'x': 3, 'y': None}]),
+    (([{'a': {'b': 1}, 'c': 2}, {'a': {'b': 3}}], ['a.b', 'c']),
+     [{'a.b': 1, 'c': 2}, {'a.b': 3, 'c': None}]),
+    (([{'a': [1, 2]}], {'x': 'a[1]', 'y': ['a', 0], 'z': 'a[5]'}),
+     [{'x': 2, 'y': 1, 'z': None}]),
+    (([{'a': 1}], {'x': 'a', 'y': lambda record: record['a'] + 1}),
+     [{'x': 1, 'y': 2}]),
+    (([{'a': 1}], {'x': []}), [{'x': {'a': 1}}]),
+    (([fixtures.Object(a=1)], {'x': 'a'}), [{'x': 1}]),
+    (([], {'x': 'a'}), []),
+])
+def test_project(case, expected):
+    assert _.project(*case) == expected
+
+
+def test_project_default():
+    assert _.project([{'a': 1}, {}], ['a'], default=0) == [{'a': 1}, {'a': 0}]
+
+
+def test_project_lazy():
+    result = _.project(iter([{'a': 1}]), {'b': 'a'}, lazy=True)
+
+    assert not isinstance(result, list)
+    assert list(result) == [{'b': 1}]
+
+
 @parametrize('case,expected', [
     (({'a': 1, 'b': 2}, {'a': 'A', 'b': 'B'}), {'A': 1, 'B': 2}),
     (({'a': 1, 'b': 2}, {'a': 'A'}), {'A': 1, 'b': 2}),
@@ -460,6 +994,22 @@ def test_rename_keys(case, expected):
     assert _.rename_keys(*case) == expected
 
 
+@parametrize('case,expected', [
+    (([{'a': 1, 'b': 2}, {'a': 3}], {'a': 'A'}), [{'A': 1, 'b': 2}, {'A': 3}]),
+    (([{'a': 1, 'b': 2}], {'a': 'b', 'b': 'a'}), [{'b': 1, 'a': 2}]),
+    (([], {'a': 'A'}), []),
+])
+def test_rename_keys_all(case, expected):
+    assert _.rename_keys_all(*case) == expected
+
+
+def test_rename_keys_all_lazy():
+    result = _.rename_keys_all(iter([{'a': 1}]), {'a': 'A'}, lazy=True)
+
+    assert not isinstance(result, list)
+    assert list(result) == [{'A': 1}]
+
+
 @parametrize('case,expected', [
     (({}, ['one', 'two', 'three', 'four'], 1),
      {'one': {'two': {'three': {'four': 1}}}}),
@@ -476,11 +1026,90 @@ def test_rename_keys(case, expected):
     (([1, 2, [3, 4, [5, 6]]], '[2].[2].[1]', 7), [1, 2, [3, 4, [5, 7]]]),
     (([1, 2, [3, 4, [5, 6]]], [2, 2, 2], 7), [1, 2, [3, 4, [5, 6, 7]]]),
     (([1, 2, [3, 4, [5, 6]]], '[2].[2].[2]', 7), [1, 2, [3, 4, [5, 6, 7]]]),
+    ((None, 'a', 1), {'a': 1}),
+    ((None, '1.0', 9), {'1': [9]}),
+    (((1, 2), 0, 5), {0: 5, 1: 2}),
 ])
 def test_set_(case, expected):
     assert _.set_(*case) == expected
 
 
+@parametrize('case,expected', [
+    (({}, {'a.b': 1, 'a.c': 2}), {'a': {'b': 1, 'c': 2}}),
+    (({'a': {'b': 1}}, [('a.b', 2), ('a.b', 3)]), {'a': {'b': 3}}),
+    (([], [('[0][0]', 1), ('[1]', 2)]), [[1], 2]),
+    (({'a': [1, 2]}, [('a.0', 5), ('a[0]', 6)]), {'a': [6, 2]}),
+    (({'a': [1, 2]}, [('a[1]', 5), ('a.-1', 6)]), {'a': [1, 6]}),
+    (({'a': {}}, [('a.0', 5), ('a[0]', 6)]), {'a': {'0': 5, 0: 6}}),
+    (({'a': 1}, [([], 5)]), {'a': 1, None: 5}),
+    (({'a': 1}, {'': 5}), {'a': 1, '': 5}),
+    ((None, {'a': 1}), {'a': 1}),
+])
+def test_set_many(case, expected):
+    assert _.set_many(*case) == expected
+
+
+def test_set_many_structural_sharing():
+    obj = {'a': {'b': [1, 2]}, 'c': {'d': 3}}
+    result = _.set_many(obj, {'a.b.0': 5, 'a.e': 6})
+
+    assert obj == {'a': {'b': [1, 2]}, 'c': {'d': 3}}
+    assert result == {'a': {'b': [5, 2], 'e': 6}, 'c': {'d': 3}}
+    assert result['c'] is obj['c']
+    assert _.set_many(obj, {'a.b.1': 7}, mutate=True) is obj
+    assert obj['a']['b'] == [1, 7]
+
+
+@parametrize('case,expected', [
+    (({'a': {'b': 1}}, {'a.b': lambda value: value + 1}), {'a': {'b': 2}}),
+    (({'a': [{'b': 1}]},
+      [('a.0.b', lambda value: value + 1),
+       ('a[0]', lambda value: dict(value, c=1)),
+       ('a.-1.b', lambda value: value * 10)]),
+     {'a': [{'b': 20, 'c': 1}]}),
+    (({}, {'a.b': lambda value: value}), {'a': {'b': None}}),
+])
+def test_update_many(case, expected):
+    assert _.update_many(*case) == expected
+
+
+def test_set_structural_sharing():
+    obj = {'a': {'b': [1, {'c': 2}]}, 'd': {'e': [3]}}
+    original = _.clone_deep(obj)
+    result = _.set_(obj, 'a.b.1.c', 5)
+
+    assert obj == original
+    assert result == {'a': {'b': [1, {'c': 5}]}, 'd': {'e': [3]}}
+    assert result is not obj
+    assert result['a'] is not obj['a']
+    assert result['a']['b'] is not obj['a']['b']
+    assert result['a']['b'][1] is not obj['a']['b'][1]
+    assert result['d'] is obj['d']
+
+
+@parametrize('case,expected', [
+    (({'a': {'b': 1}}, 'a.b', 2), {'a': {'b': 2}}),
+    (({'a': {}}, 'a.b.c', 2), {'a': {'b': {'c': 2}}}),
+    (([1, [2]], [1, 1], 3), [1, [2, 3]]),
+])
+def test_set_mutate(case, expected):
+    obj = case[0]
+    result = _.set_(*case, mutate=True)
+
+    assert result is obj
+    assert obj == expected
+
+
+def test_set_path_default_not_shared():
+    default = {'x': []}
+    result = _.set_path({}, 1, ['a', 'b', 'c'], default=default)
+
+    assert result == {'a': {'b': {'x': [], 'c': 1}, 'x': []}}
+    assert result['a'] is not default
+    assert result['a']['b'] is not result['a']
+    assert default == {'x': []}
+
+
 @parametrize('case', [
     _.deep_set
 ])
@@ -585,6 +1214,79 @@ def test_update_path(case, expected):
     assert result is not case[0]
 
 
+def test_update_path_mutate():
+    obj = {'earth': {'rome': 'Republic'}}
+    result = _.update_path(obj, lambda value: 'Empire', ['earth', 'rome'],
+                           mutate=True)
+
+    assert result is obj
+    assert obj == {'earth': {'rome': 'Empire'}}
+
+
+walk_case = OrderedDict([('a', [1, {'b': 2}]), ('c', 3)])
+
+
+@parametrize('case,kargs,expected', [
+    (walk_case,
+     {},
+     [(), ('a',), ('a', 0), ('a', 1), ('a', 1, 'b'), ('c',)]),
+    (walk_case,
+     {'order': 'post'},
+     [('a', 0), ('a', 1, 'b'), ('a', 1), ('a',), ('c',), ()]),
+    (walk_case,
+     {'max_depth': 2},
+     [(), ('a',), ('a', 0), ('a', 1), ('c',)]),
+    (walk_case,
+     {'max_depth': 0},
+     [()]),
+    (walk_case,
+     {'prune': lambda value: isinstance(value, list)},
+     [(), ('a',), ('c',)]),
+    (walk_case,
+     {'prune': lambda value, path: path == ('a', 1), 'order': 'post'},
+     [('a', 0), ('a', 1), ('a',), ('c',), ()]),
+    ([[1, [2]], 3],
+     {},
+     [(), (0,), (0, 0), (0, 1), (0, 1, 0), (1,)]),
+    (5, {}, [()]),
+    ([], {}, [()]),
+])
+def test_walk(case, kargs, expected):
+    results = list(_.walk(case, **kargs))
+
+    assert [path for path, _value in results] == expected
+
+    for path, value in results:
+        assert _.get(case, list(path)) is value if path else value is case
+
+
+def test_walk_cyclic():
+    obj = {'a': [1]}
+    obj['a'].append(obj)
+
+    assert [path for path, _value in _.walk(obj)] == \
+        [(), ('a',), ('a', 0), ('a', 1)]
+
+
+def test_walk_lazy():
+    walker = _.walk({'a': {'b': 1}})
+
+    assert next(walker) == ((), {'a': {'b': 1}})
+    assert next(walker) == (('a',), {'b': 1})
+
+
+def test_walk_invalid_order():
+    with pytest.raises(ValueError):
+        list(_.walk({}, order='in'))
+
+
+@parametrize('case', [
+    _.deep_iter,
+])
+def test_walk_aliases(case):
+    assert _.walk is case
+
+
 @parametrize('case,expected', [
     ({'a': 1, 'b': 2, 'c': 3}, [1, 2, 3]),
     ([1, 2, 3], [1, 2, 3])
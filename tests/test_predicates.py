@@ -1,15 +1,20 @@
 # -*- coding: utf-8 -*-
 
+from array import array
 import datetime
 import decimal
+import io
 import operator
 import re
 
 import pydash as _
+from pydash._compat import text_type
 
 from . import fixtures
 from .fixtures import parametrize
 
+import pytest
+
 
 @parametrize('value,other,expected', [
     ('a', 'a', True),
@@ -220,6 +225,34 @@ def test_is_equal(case, expected):
     assert _.is_equal(*case) == expected
 
 
+def nested(depth, leaf):
+    obj = value = {}
+
+    for _i in range(depth):
+        value['a'] = [{}]
+        value = value['a'][0]
+
+    value['b'] = leaf
+    return obj
+
+
+def cyclic(value):
+    obj = {'a': value}
+    obj['self'] = obj
+    return obj
+
+
+@parametrize('case,expected', [
+    ((nested(5000, 1), nested(5000, 1)), True),
+    ((nested(5000, 1), nested(5000, 2)), False),
+    ((cyclic(1), cyclic(1)), True),
+    ((cyclic(1), cyclic(2)), False),
+])
+def test_is_equal_deep(case, expected):
+    assert _.is_equal(*case) is expected
+    assert _.is_equal_with(case[0], case[1], lambda a, b: None) is expected
+
+
 @parametrize('case,expected', [
     ((1, 1, None), True),
     ((1, 2, None), False),
@@ -244,6 +277,33 @@ def test_is_equal_with(case, expected):
     assert _.is_equal_with(*case) == expected
 
 
+@parametrize('case,expected,calls', [
+    (({'a': [1, 2]}, {'a': [1, 2]}), True, 4),
+    (({'a': [1, 2]}, {'b': [1, 2]}), False, 1),
+    (({'a': [1, 2]}, {'a': [1, 2, 3]}), False, 2),
+    (([1, 2], (1, 2)), False, 1),
+])
+def test_is_equal_with_prechecks(case, expected, calls):
+    compared = []
+
+    def callback(value, other):
+        compared.append((value, other))
+
+    assert _.is_equal_with(case[0], case[1], callback) is expected
+    assert len(compared) == calls
+
+
+def test_is_equal_with_identical():
+    value = [1, 2]
+    compared = []
+
+    def callback(value, other):
+        compared.append((value, other))
+
+    assert _.is_equal_with({'a': value}, {'a': value}, callback) is True
+    assert compared == [({'a': value}, {'a': value}), (value, value)]
+
+
 @parametrize('case,expected', [
     (Exception(), True),
     ({}, False),
@@ -355,11 +415,60 @@ def test_is_iterable(case, expected):
     ('', False),
     (1, False),
     (True, False),
+    (' [1, 2.5e-3, -0, true, false, null, NaN, -Infinity] ', True),
+    ('"a\\u00e9\\n"', True),
+    ('{"a": 1,}', False),
+    ('[1 2]', False),
+    ('01', False),
+    ('x', False),
+    ('{}x', False),
+    (b'{"a": [1]}', True),
+    (b'{"a": [1}', False),
+    (bytearray(b'[]'), True),
 ])
 def test_is_json(case, expected):
     assert _.is_json(case) == expected
 
 
+@parametrize('case,expected', [
+    ('{"one": 1, "two": {"three": "3"}, "four": [4, -5.5e+5]}', True),
+    ('[1, 2.5e-3, -0, true, false, null, NaN, -Infinity, Infinity]', True),
+    ('"a\\"b\\u00e9\\n"', True),
+    (' 123 ', True),
+    ('[[[]], {}, {"a": {"b": []}}]', True),
+    ('', False),
+    ('  ', False),
+    ('{"a": 1,}', False),
+    ('{"a" 1}', False),
+    ('{1: 2}', False),
+    ('["a": 1]', False),
+    ('[1,,2]', False),
+    ('[1 2]', False),
+    ('[1e]', False),
+    ('[.5]', False),
+    ('01', False),
+    ('1 2', False),
+    ('tru', False),
+    ('truex', False),
+    ('"abc', False),
+    ('"a\tb"', False),
+    ('"\\x"', False),
+    ('[[[]]', False),
+    ('[]]', False),
+])
+@parametrize('chunk_size', [1, 2, 3, 64 * 1024])
+def test_is_json_stream(case, expected, chunk_size, monkeypatch):
+    monkeypatch.setattr('pydash.predicates.JSON_CHUNK_SIZE', chunk_size)
+
+    assert _.is_json(io.StringIO(text_type(case))) is expected
+    assert _.is_json(io.BytesIO(case.encode('utf-8'))) is expected
+    assert _.is_json(io.BytesIO(case.encode('utf-16'))) is expected
+
+
+def test_is_json_stream_invalid_bytes():
+    assert _.is_json(io.BytesIO(b'["\xff"]')) is False
+
+
 @parametrize('case,expected', [
     ([1, 2, 3], True),
     ({}, False),
@@ -386,6 +495,16 @@ def test_is_match(case, expected):
     assert _.is_match(*case) == expected
 
 
+@parametrize('case,expected', [
+    ((nested(5000, 1), nested(5000, 1)), True),
+    ((nested(5000, 1), nested(5000, 2)), False),
+    ((cyclic(1), cyclic(1)), True),
+    ((cyclic(1), cyclic(2)), False),
+])
+def test_is_match_deep(case, expected):
+    assert _.is_match(*case) is expected
+
+
 @parametrize('case,expected', [
     (([1, 2, 3], operator.le), True),
     (([3, 2, 1], operator.ge), True),
@@ -396,6 +515,16 @@ def test_is_monotone(case, expected):
     assert _.is_monotone(*case) == expected
 
 
+@parametrize('case,expected', [
+    (array('i', [1, 2, 3]), True),
+    (array('d', [1.0, 2.5, 2.0]), False),
+    (memoryview(b'abc'), True),
+    (memoryview(b'aba'), False),
+])
+def test_is_increasing_buffer(case, expected):
+    assert _.is_increasing(case) is expected
+
+
 @parametrize('case,expected', [
     (0, False),
     (123456789123456789123456789, False),
@@ -563,3 +692,134 @@ def test_is_tuple(case, expected):
 ])
 def test_is_zero(case, expected):
     assert _.is_zero(case) == expected
+
+
+@parametrize('collection,predicate,args', [
+    ([1, 2, 3, 2], _.eq, (2,)),
+    ([1, 2.5, 3, -1], _.gt, (2,)),
+    ([1, 2.5, 3, -1], _.gte, (3,)),
+    ([1, 2.5, 3, -1], _.lt, (2,)),
+    ([1, 2.5, 3, -1], _.lte, (1,)),
+    ([1, 2.5, 3, -1, 5], _.in_range, (2,)),
+    ([1, 2.5, 3, -1, 5], _.in_range, (1, 4)),
+    ([1, 'a', 3, None], _.in_range, (0, 4)),
+    ([1, 'a', True, None, 2.5, float('nan')], _.is_boolean, ()),
+    ([1, 'a', True, None, 2.5, float('nan')], _.is_number, ()),
+    ([1, 'a', True, None, 2.5, float('nan')], _.is_nan, ()),
+    ([0, '', 'a', [], [1], True, None, {}], _.is_empty, ()),
+    ([{'a': 1}, {'a': 2}, {'b': 1}], _.is_match, ({'a': 1},)),
+    ([{'a': 1}, {'a': 2}, {'b': 1}], {'a': 2}, ()),
+    ([{'a': 1}, {'a': 0}, {'b': 1}], 'a', ()),
+    ([1, 2, 3, 4], lambda value: value % 2, ()),
+    ([], _.is_number, ()),
+])
+def test_mask(collection, predicate, args):
+    expected = [bool(_.iteratee(predicate)(value, *args))
+                for value in collection]
+    result = _.mask(collection, predicate, *args)
+
+    assert list(result) == expected
+    assert len(result) == len(collection)
+    assert result.count() == sum(expected)
+    assert result.indexes() == [index for index, flag in enumerate(expected)
+                                if flag]
+    assert result.select(collection) == [value for value, flag
+                                         in zip(collection, expected) if flag]
+
+
+def test_mask_dict():
+    result = _.mask({'a': 1, 'b': 'x'}, _.is_number)
+
+    assert result.select({'a': 1, 'b': 'x'}) == [1]
+
+
+@parametrize('case,expected', [
+    (lambda a, b: a & b, [True, False, False, False]),
+    (lambda a, b: a | b, [True, True, True, False]),
+    (lambda a, b: a ^ b, [False, True, True, False]),
+    (lambda a, b: ~a, [False, False, True, True]),
+])
+def test_mask_operators(case, expected):
+    first = _.Mask.from_flags([1, 1, 0, 0])
+    second = _.Mask.from_flags([True, False, True, False])
+
+    assert list(case(first, second)) == expected
+
+
+def test_mask_sequence():
+    result = _.Mask.from_flags([True, False, True])
+
+    assert result[0] is True
+    assert result[-2] is False
+    assert result == _.Mask(0b101, 3)
+    assert result != _.Mask(0b101, 4)
+    assert repr(result) == 'Mask([True, False, True])'
+
+    with pytest.raises(IndexError):
+        result[3]
+
+
+@parametrize('other,exception', [
+    (_.Mask(0, 2), ValueError),
+    (1, TypeError),
+])
+def test_mask_combine_invalid(other, exception):
+    with pytest.raises(exception):
+        _.Mask(0, 3) & other
+
+
+@parametrize('case,expected', [
+    (([1, 2, 4, 3, 5], operator.le), 3),
+    (([1, 1, 2, 3], operator.lt), 1),
+    (([3, 2, 1], operator.ge), None),
+    (([], operator.le), None),
+    ((5, operator.le), None),
+    ((array('i', [1, 2, 3, 0]), operator.le), 3),
+    ((array('u', u'abca'), operator.le), 3),
+    ((memoryview(b'abba'), operator.lt), 2),
+    ((array('I', [5, 3, 7]), lambda a, b: b - a > 0), 1),
+])
+def test_monotone_violation(case, expected):
+    assert _.monotone_violation(*case) == expected
+
+
+def test_monotone_violation_short_circuit():
+    calls = []
+
+    def op(x, y):
+        calls.append((x, y))
+        return x <= y
+
+    assert _.monotone_violation([1, 2, 0, 3, 4], op) == 2
+    assert calls == [(1, 2), (2, 0)]
+
+
+@parametrize('case,op,expected', [
+    (list(range(10)), operator.lt, None),
+    ([1, 1, 2], operator.lt, 1),
+    ([1, 2, 0], lambda x, y: x <= y, 2),
+    ([1, 2, 0], lambda x, y: True if x <= y else False, 2),
+    ([[1, 2], [3, 4]], operator.le, None),
+])
+def test_monotone_violation_numpy(monkeypatch, case, op, expected):
+    numpy = pytest.importorskip('numpy')
+    monkeypatch.setattr('pydash.predicates.MONOTONE_CHUNK_SIZE', 2)
+
+    assert _.monotone_violation(numpy.array(case), op) == expected
+
+
+@parametrize('case,expected', [
+    (array('d', [1.0, 2.0, 3.0, 2.0]), 3),
+    (memoryview(bytearray([4, 3, 2, 1])), 1),
+])
+def test_monotone_violation_numpy_buffer(monkeypatch, case, expected):
+    pytest.importorskip('numpy')
+    monkeypatch.setattr('pydash.predicates.MONOTONE_CHUNK_SIZE', 2)
+
+    assert _.monotone_violation(case, operator.le) == expected
+
+
+def test_monotone_violation_numpy_callback():
+    pytest.importorskip('numpy')
+
+    assert not _.is_monotone(array('I', [5, 3, 7]), lambda a, b: b - a > 0)
@@ -90,6 +90,75 @@ def test_default_to(case, expected):
     assert _.default_to(*case) == expected
 
 
+@parametrize('case,expected', [
+    (1, 1),
+    ('a', 'a'),
+    ([1, [2, 3]], (1, (2, 3))),
+    ((1, [2]), (1, (2,))),
+    (set([1, 2]), frozenset([1, 2])),
+    ({'a': [1, {'b': set([2])}]}, {'a': (1, {'b': frozenset([2])})}),
+])
+def test_freeze_deep(case, expected):
+    frozen = _.freeze_deep(case)
+    assert frozen == expected
+    assert hash(frozen) == hash(_.freeze_deep(case))
+
+
+def test_freeze_deep_immutable():
+    frozen = _.freeze_deep({'a': 1})
+
+    with pytest.raises(TypeError):
+        frozen['a'] = 2
+
+    with pytest.raises(TypeError):
+        frozen.update(b=2)
+
+    with pytest.raises(TypeError):
+        frozen |= {'b': 2}
+
+    with pytest.raises(TypeError):
+        frozen.__init__(b=2)
+
+    assert frozen == {'a': 1}
+    assert _.freeze_deep(frozen) is frozen
+
+
+@parametrize('func', [_.freeze_deep, _.hash_deep])
+def test_freeze_deep_cyclic(func):
+    cyclic = {'a': [1]}
+    cyclic['a'].append(cyclic)
+
+    with pytest.raises(ValueError):
+        func(cyclic)
+
+    shared = [1]
+
+    assert func([shared, shared]) == func([[1], [1]])
+
+
+@parametrize('case,other', [
+    ({'a': 1, 'b': [1, 2]}, {'b': [1, 2], 'a': 1}),
+    ([{'a': set([1])}], [{'a': set([1])}]),
+    ((1, 'a'), (1, 'a')),
+    ([1, 2.5, True], (1.0, 2.5, 1)),
+    (set([1, 'a']), frozenset(['a', 1.0])),
+])
+def test_hash_deep(case, other):
+    assert _.hash_deep(case) == _.hash_deep(other)
+
+
+def test_hash_deep_stable():
+    # The hash must not depend on the per process salt of str hashes.
+    value = {'a': [1, 'x', {'b': set([1.5, 'c'])}], 'z': None}
+
+    assert _.hash_deep(value) == 11243210685958562447
+
+
+def test_hash_deep_unhashable():
+    with pytest.raises(TypeError):
+        _.hash_deep([fixtures.Unhashable(1)])
+
+
 @parametrize('case,expected', [
     ((1,), 1),
     ((1, 2), 1),
@@ -162,8 +231,14 @@ def test_matches_property(case, arg, expected):
 
 
 @parametrize('case,args,kargs,key', [
-    ((lambda a, b: a + b,), (1, 2), {}, '(1, 2){}'),
-    ((lambda a, b: a + b,), (1,), {'b': 2}, "(1,){'b': 2}"),
+    ((lambda a, b: a + b,), (1, 2), {},
+     _.utilities.base_freeze_deep(((1, 2), {}), True, set())),
+    ((lambda a, b: a + b,), (1,), {'b': 2},
+     _.utilities.base_freeze_deep(((1,), {'b': 2}), True, set())),
+    ((lambda a, b: a + b,), ([1], [2]), {},
+     _.utilities.base_freeze_deep((([1], [2]), {}), True, set())),
+    ((lambda a, b: [a, b],), (fixtures.Unhashable(1), [2]), {},
+     '(Unhashable(1), [2]){}'),
     ((lambda a, b: a + b, lambda a, b: a * b), (1, 2), {}, 2),
     ((lambda a, b: a + b, lambda a, b: a * b), (1,), {'b': 2}, 2),
 ])
@@ -175,6 +250,42 @@ def test_memoize(case, args, kargs, key):
     assert memoized.cache[key] == expected
 
 
+def test_memoize_cyclic():
+    cyclic = [1]
+    cyclic.append(cyclic)
+    memoized = _.memoize(len)
+
+    assert memoized(cyclic) == 2
+    assert list(memoized.cache) == ['([1, [...]],){}']
+
+
+def test_memoize_distinct_reprs():
+    class Item(object):
+        def __repr__(self):
+            return 'Item'
+
+    memoized = _.memoize(lambda item: item)
+    first = Item()
+    second = Item()
+
+    assert memoized(first) is first
+    assert memoized(second) is second
+
+
+@parametrize('args', [
+    ([1], (1,)),
+    (1, 1.0, True),
+    ({'a': [1]}, {'a': (1,)}),
+    ({1: 'a'}, {1.0: 'a'}),
+    ({1}, {1.0}),
+])
+def test_memoize_distinct_types(args):
+    memoized = _.memoize(type)
+
+    assert [memoized(arg) for arg in args] == [type(arg) for arg in args]
+    assert len(memoized.cache) == len(args)
+
+
 @parametrize('case,args,kargs,expected', [
     (('a.b',), ({'a': {'b': lambda x, y: x + y}}, 1, 2), {}, 3),
     (('a.b',), ({'a': {'b': lambda x, y: x + y}}, 1,), {'y': 2}, 3),